@@ -6,11 +6,15 @@
 - 地形配置: 中央に水辺（高コスト）および段差（高度差）
 - 探索任務: 始点 (0,0) → 終点 (9,9)
 """
+import operator
+import sys
+from typing import Sequence
+
 from src.map_loader_v2 import MultiLayerMap
-from src.finder import find_path, FinderAlgorithm
+from src.finder import find_path, build_search_context, FinderAlgorithm
 from src.cost_function import CostConfig
 from src.coordinates import (
-    GridCoord, IsoCoord, IsoConfig, to_iso, to_iso_int, to_grid
+    IsoConfig, to_iso_batch, to_iso_int_batch, to_grid_batch
 )
 
 
@@ -84,36 +88,35 @@ def print_terrain_legend() -> None:
     print("=" * 60)
 
 
+def _format_grid(rows: Sequence[Sequence[object]]) -> str:
+    """Format a grid layer with column header, row labels and border as one string."""
+    width = len(rows[0]) if rows else 0
+    border = "    +" + "-" * (2 * width + 1) + "+"
+
+    lines = ["     " + "".join(f" {x}" for x in range(width)), border]
+    lines.extend(
+        f"  {y} |" + "".join(f" {cell}" for cell in row) + " |"
+        for y, row in enumerate(rows)
+    )
+    lines.append(border)
+    return "\n".join(lines)
+
+
 def print_map_layers(terrain: list[list[str]], elevation: list[list[int]]) -> None:
     """Print terrain and elevation maps side by side."""
     print("\n【マップレイヤー (Map Layers)】")
     print("-" * 60)
 
     print("\n[地形レイヤー (Terrain Layer)]")
-    print("     ", end="")
-    for x in range(10):
-        print(f" {x}", end="")
-    print()
-    print("    +" + "-" * 21 + "+")
-    for y, row in enumerate(terrain):
-        print(f"  {y} |", end="")
-        for cell in row:
-            print(f" {cell}", end="")
-        print(" |")
-    print("    +" + "-" * 21 + "+")
+    sys.stdout.write(_format_grid(terrain) + "\n")
 
     print("\n[高度レイヤー (Elevation Layer)]")
-    print("     ", end="")
-    for x in range(10):
-        print(f" {x}", end="")
-    print()
-    print("    +" + "-" * 21 + "+")
-    for y, row in enumerate(elevation):
-        print(f"  {y} |", end="")
-        for cell in row:
-            print(f" {cell}", end="")
-        print(" |")
-    print("    +" + "-" * 21 + "+")
+    sys.stdout.write(_format_grid(elevation) + "\n")
+
+
+# One line of the coordinate transformation log:
+# step, (x, y), h, (iso_x, iso_y) float, (iso_x, iso_y) int
+_TRANSFORM_ROW_FMT = "%4d | (%3d, %3d)    | %4d | (%9.2f, %9.2f) | (%6d, %6d)"
 
 
 def print_coordinate_transformations(path: list[tuple[int, int]], elevation: list[list[int]]) -> None:
@@ -125,13 +128,15 @@ def print_coordinate_transformations(path: list[tuple[int, int]], elevation: lis
 
     config = IsoConfig(tile_width=64, tile_height=32, elevation_scale=16)
 
-    for i, (x, y) in enumerate(path):
-        h = elevation[y][x]
-        grid = GridCoord(x, y, h)
-        iso = to_iso(grid, config)
-        iso_int = to_iso_int(grid, config)
+    xs = [x for x, _ in path]
+    ys = [y for _, y in path]
+    hs = [elevation[y][x] for x, y in path]
+    iso_xs, iso_ys = to_iso_batch(xs, ys, hs, config)
+    int_xs, int_ys = to_iso_int_batch(xs, ys, hs, config)
 
-        print(f"{i:>4} | ({x:>3}, {y:>3})    | {h:>4} | ({iso.x:>9.2f}, {iso.y:>9.2f}) | ({iso_int.x:>6}, {iso_int.y:>6})")
+    rows = zip(range(len(xs)), xs, ys, hs, iso_xs, iso_ys, int_xs, int_ys)
+    if xs:
+        sys.stdout.write("\n".join(_TRANSFORM_ROW_FMT % row for row in rows) + "\n")
 
     print("-" * 80)
 
@@ -142,20 +147,17 @@ def print_roundtrip_verification(path: list[tuple[int, int]], elevation: list[li
     print("-" * 60)
 
     config = IsoConfig(tile_width=64, tile_height=32, elevation_scale=16)
-    max_error_x = 0.0
-    max_error_y = 0.0
 
-    for x, y in path:
-        h = elevation[y][x]
-        grid_original = GridCoord(x, y, h)
-        iso = to_iso(grid_original, config)
-        grid_recovered = to_grid(iso, h, config)
-        iso_recovered = to_iso(grid_recovered, config)
+    xs = [x for x, _ in path]
+    ys = [y for _, y in path]
+    hs = [elevation[y][x] for x, y in path]
+
+    iso_xs, iso_ys = to_iso_batch(xs, ys, hs, config)
+    grid_xs, grid_ys = to_grid_batch(iso_xs, iso_ys, hs, config)
+    recovered_xs, recovered_ys = to_iso_batch(grid_xs, grid_ys, hs, config)
 
-        error_x = abs(iso_recovered.x - iso.x)
-        error_y = abs(iso_recovered.y - iso.y)
-        max_error_x = max(max_error_x, error_x)
-        max_error_y = max(max_error_y, error_y)
+    max_error_x = max((abs(a - b) for a, b in zip(recovered_xs, iso_xs)), default=0.0)
+    max_error_y = max((abs(a - b) for a, b in zip(recovered_ys, iso_ys)), default=0.0)
 
     print(f"往復変換最大誤差 X: {max_error_x:.6f} px")
     print(f"往復変換最大誤差 Y: {max_error_y:.6f} px")
@@ -168,25 +170,22 @@ def visualize_path(terrain: list[list[str]], path: list[tuple[int, int]]) -> Non
     print("\n【経路可視化 (Path Visualization)】")
     print("-" * 60)
 
-    # Create a copy of terrain for visualization
-    viz = [row.copy() for row in terrain]
+    # Flat row-major byte buffer of the terrain, marked in place
+    width = len(terrain[0]) if terrain else 0
+    buf = bytearray("".join("".join(row) for row in terrain), "ascii")
 
     # Mark path with '@' (except S and G)
+    keep = (ord('S'), ord('G'))
+    marker = ord('@')
     for x, y in path:
-        if viz[y][x] not in ('S', 'G'):
-            viz[y][x] = '@'
-
-    print("     ", end="")
-    for x in range(10):
-        print(f" {x}", end="")
-    print()
-    print("    +" + "-" * 21 + "+")
-    for y, row in enumerate(viz):
-        print(f"  {y} |", end="")
-        for cell in row:
-            print(f" {cell}", end="")
-        print(" |")
-    print("    +" + "-" * 21 + "+")
+        index = y * width + x
+        if buf[index] not in keep:
+            buf[index] = marker
+
+    text = buf.decode("ascii")
+    viz = [text[i:i + width] for i in range(0, len(text), width)] if width else []
+
+    sys.stdout.write(_format_grid(viz) + "\n")
 
 
 def analyze_path_decisions(path: list[tuple[int, int]], terrain: list[list[str]], elevation: list[list[int]]) -> None:
@@ -194,11 +193,23 @@ def analyze_path_decisions(path: list[tuple[int, int]], terrain: list[list[str]]
     print("\n【経路判断分析 (Path Decision Analysis)】")
     print("-" * 60)
 
-    # Check what terrains were traversed
-    terrain_counts = {}
+    # Single pass over the path: terrain counts, hazards crossed, path heights
+    terrain_counts: dict[str, int] = {}
+    water_seen = False
+    cliff_seen = False
+    heights: list[int] = []
+
     for x, y in path:
         t = terrain[y][x]
         terrain_counts[t] = terrain_counts.get(t, 0) + 1
+        water_seen |= t == '~'
+        cliff_seen |= t == '^'
+        heights.append(elevation[y][x])
+
+    # Step-wise elevation deltas, reduced with C-level builtins
+    deltas = list(map(operator.sub, heights[1:], heights))
+    max_ascent = max(0, max(deltas, default=0))
+    max_descent = max(0, -min(deltas, default=0))
 
     print("通過した地形:")
     terrain_names = {
@@ -210,24 +221,12 @@ def analyze_path_decisions(path: list[tuple[int, int]], terrain: list[list[str]]
 
     # Check what was avoided
     print("\n回避判断:")
-    water_avoided = all(terrain[y][x] != '~' for x, y in path)
-    cliff_avoided = all(terrain[y][x] != '^' for x, y in path)
+    water_avoided = not water_seen
+    cliff_avoided = not cliff_seen
 
     print(f"  水辺 (~) 回避: {'✓ 成功' if water_avoided else '✗ 通過あり'}")
     print(f"  崖   (^) 回避: {'✓ 成功' if cliff_avoided else '✗ 通過あり'}")
 
-    # Check elevation changes
-    max_ascent = 0
-    max_descent = 0
-    for i in range(1, len(path)):
-        prev_x, prev_y = path[i-1]
-        curr_x, curr_y = path[i]
-        delta_h = elevation[curr_y][curr_x] - elevation[prev_y][prev_x]
-        if delta_h > 0:
-            max_ascent = max(max_ascent, delta_h)
-        else:
-            max_descent = max(max_descent, -delta_h)
-
     print(f"\n高度変化:")
     print(f"  最大上昇: {max_ascent} 段")
     print(f"  最大下降: {max_descent} 段")
@@ -241,8 +240,14 @@ def run_algorithm_comparison(game_map: MultiLayerMap) -> None:
 
     config = CostConfig()
 
-    dijkstra_result = find_path(game_map, FinderAlgorithm.DIJKSTRA, cost_config=config)
-    astar_result = find_path(game_map, FinderAlgorithm.ASTAR, cost_config=config)
+    context = build_search_context(game_map, cost_config=config)
+
+    dijkstra_result = find_path(
+        game_map, FinderAlgorithm.DIJKSTRA, cost_config=config, context=context
+    )
+    astar_result = find_path(
+        game_map, FinderAlgorithm.ASTAR, cost_config=config, context=context
+    )
 
     print(f"{'指標':^20} | {'Dijkstra':^15} | {'A*':^15}")
     print("-" * 60)
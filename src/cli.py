@@ -4,20 +4,17 @@ import sys
 from typing import Sequence
 
 from src.map_loader import load_map_from_file, MapValidationError
-from src.graph_builder import build_graph
+from src.graph_builder import build_neighbor_table
 from src.search import search_path, Algorithm, NoPathError
 from src.visualize import render_path, format_metrics, format_comparison
 
 
-def parse_args(args: Sequence[str]) -> argparse.Namespace:
+def _build_parser() -> argparse.ArgumentParser:
     """
-    Parse command line arguments.
-
-    Args:
-        args: Command line arguments
+    Build the command line argument parser.
 
     Returns:
-        Parsed arguments namespace
+        Configured ArgumentParser
     """
     parser = argparse.ArgumentParser(
         prog='game-route-search',
@@ -50,7 +47,24 @@ def parse_args(args: Sequence[str]) -> argparse.Namespace:
         help='Display metrics (path length, execution time)',
     )
 
-    return parser.parse_args(args)
+    return parser
+
+
+# Built once at import; parse_args reuses it for every call.
+_PARSER = _build_parser()
+
+
+def parse_args(args: Sequence[str]) -> argparse.Namespace:
+    """
+    Parse command line arguments.
+
+    Args:
+        args: Command line arguments
+
+    Returns:
+        Parsed arguments namespace
+    """
+    return _PARSER.parse_args(args)
 
 
 def run(
@@ -80,7 +94,7 @@ def run(
         print(f"Error: Invalid map: {e}", file=sys.stderr)
         return 1
 
-    graph = build_graph(game_map)
+    graph = build_neighbor_table(game_map)
 
     if compare:
         return run_compare_mode(game_map, graph, metrics)
@@ -109,7 +123,7 @@ def run_compare_mode(game_map, graph, metrics: bool) -> int:
 
     Args:
         game_map: The loaded game map
-        graph: The built graph
+        graph: Neighbor table of the map
         metrics: Whether to display metrics
 
     Returns:
@@ -6,20 +6,24 @@ from pathlib import Path
 from typing import Sequence
 
 from src.map_loader_v2 import load_multi_layer_map, MultiLayerMap, LayerValidationError
-from src.finder import find_path, FinderAlgorithm, FinderResult, NoPathFoundError
+from src.finder import (
+    find_path,
+    find_paths_batch,
+    build_search_context,
+    FinderAlgorithm,
+    FinderResult,
+    NoPathFoundError,
+)
 from src.cost_function import CostConfig
 from src.visualize import render_path
 
 
-def parse_args(args: Sequence[str]) -> argparse.Namespace:
+def _build_parser() -> argparse.ArgumentParser:
     """
-    Parse command line arguments.
-
-    Args:
-        args: Command line arguments
+    Build the command line argument parser.
 
     Returns:
-        Parsed arguments namespace
+        Configured ArgumentParser
     """
     parser = argparse.ArgumentParser(
         prog='game-route-search',
@@ -67,12 +71,22 @@ def parse_args(args: Sequence[str]) -> argparse.Namespace:
         help='Allow diagonal (8-directional) movement',
     )
 
-    parser.add_argument(
+    # Comparison and batch runs produce different reports; only one per run
+    mode = parser.add_mutually_exclusive_group()
+
+    mode.add_argument(
         '--compare',
         action='store_true',
         help='Compare Dijkstra and A* algorithms',
     )
 
+    mode.add_argument(
+        '--queries',
+        type=str,
+        default=None,
+        help='Path to a file of "sx sy gx gy" lines to solve in one batch',
+    )
+
     parser.add_argument(
         '--metrics',
         action='store_true',
@@ -86,7 +100,24 @@ def parse_args(args: Sequence[str]) -> argparse.Namespace:
         help='Maximum cost cap for saturation (default: 255)',
     )
 
-    return parser.parse_args(args)
+    return parser
+
+
+# Built once at import; parse_args reuses it for every call.
+_PARSER = _build_parser()
+
+
+def parse_args(args: Sequence[str]) -> argparse.Namespace:
+    """
+    Parse command line arguments.
+
+    Args:
+        args: Command line arguments
+
+    Returns:
+        Parsed arguments namespace
+    """
+    return _PARSER.parse_args(args)
 
 
 def load_map(args: argparse.Namespace) -> MultiLayerMap:
@@ -123,8 +154,43 @@ def load_map(args: argparse.Namespace) -> MultiLayerMap:
             priority_path=priority_path,
         )
     else:
-        with open(map_path, 'r', encoding='utf-8') as f:
-            return load_multi_layer_map(legacy_text=f)
+        return load_multi_layer_map(legacy_bytes=map_path.read_bytes())
+
+
+def load_queries(path: Path) -> list[tuple[tuple[int, int], tuple[int, int]]]:
+    """
+    Load (start, goal) queries, one "sx sy gx gy" line each.
+
+    Blank lines are skipped.
+
+    Args:
+        path: Path to the queries file
+
+    Returns:
+        List of (start, goal) pairs
+
+    Raises:
+        FileNotFoundError: If file not found
+        ValueError: If a line is not four integers
+    """
+    if not path.exists():
+        raise FileNotFoundError(f"Queries file not found: {path}")
+
+    queries: list[tuple[tuple[int, int], tuple[int, int]]] = []
+
+    for line_no, line in enumerate(path.read_text(encoding='utf-8').splitlines(), 1):
+        fields = line.split()
+        if not fields:
+            continue
+        if len(fields) != 4:
+            raise ValueError(f"Line {line_no}: expected 'sx sy gx gy', got {line!r}")
+        try:
+            sx, sy, gx, gy = (int(value) for value in fields)
+        except ValueError:
+            raise ValueError(f"Line {line_no}: coordinates must be integers") from None
+        queries.append(((sx, sy), (gx, gy)))
+
+    return queries
 
 
 def render_path_v2(game_map: MultiLayerMap, path: Sequence[tuple[int, int]]) -> str:
@@ -138,16 +204,7 @@ def render_path_v2(game_map: MultiLayerMap, path: Sequence[tuple[int, int]]) ->
     Returns:
         String visualization
     """
-    from src.map_loader import GameMap
-
-    legacy_map = GameMap(
-        grid=game_map.terrain,
-        start=game_map.start,
-        goal=game_map.goal,
-        width=game_map.width,
-        height=game_map.height,
-    )
-    return render_path(legacy_map, path)
+    return render_path(game_map, path)
 
 
 def format_metrics_v2(result: FinderResult) -> str:
@@ -197,6 +254,32 @@ def format_comparison_v2(dijkstra: FinderResult, astar: FinderResult) -> str:
     return '\n'.join(lines)
 
 
+def format_batch_v2(
+    queries: Sequence[tuple[tuple[int, int], tuple[int, int]]],
+    results: Sequence[FinderResult | None],
+) -> str:
+    """
+    Format one summary line per batch query.
+
+    Args:
+        queries: (start, goal) pairs
+        results: Result for each query, None where no path exists
+
+    Returns:
+        Formatted batch summary string
+    """
+    lines = []
+    for (start, goal), result in zip(queries, results):
+        if result is None:
+            lines.append(f"{start} -> {goal}: no path")
+        else:
+            lines.append(
+                f"{start} -> {goal}: cost={result.total_cost:.3f}, "
+                f"length={len(result.path)}, expanded={result.nodes_expanded}"
+            )
+    return '\n'.join(lines)
+
+
 def run(args: argparse.Namespace) -> int:
     """
     Run the path search.
@@ -226,6 +309,9 @@ def run(args: argparse.Namespace) -> int:
 
     algorithm = FinderAlgorithm.DIJKSTRA if args.algo == 'dijkstra' else FinderAlgorithm.ASTAR
 
+    if args.queries:
+        return run_batch_mode(game_map, args, algorithm, cost_config)
+
     try:
         result = find_path(
             game_map,
@@ -263,18 +349,27 @@ def run_compare_mode(
     Returns:
         Exit code (0 for success, non-zero for error)
     """
+    # Both solves share one precomputed neighbor/edge cost table
+    context = build_search_context(
+        game_map,
+        cost_config=cost_config,
+        allow_diagonal=args.allow_diagonal,
+    )
+
     try:
         dijkstra_result = find_path(
             game_map,
             FinderAlgorithm.DIJKSTRA,
             allow_diagonal=args.allow_diagonal,
             cost_config=cost_config,
+            context=context,
         )
         astar_result = find_path(
             game_map,
             FinderAlgorithm.ASTAR,
             allow_diagonal=args.allow_diagonal,
             cost_config=cost_config,
+            context=context,
         )
     except NoPathFoundError as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -294,6 +389,45 @@ def run_compare_mode(
     return 0
 
 
+def run_batch_mode(
+    game_map: MultiLayerMap,
+    args: argparse.Namespace,
+    algorithm: FinderAlgorithm,
+    cost_config: CostConfig,
+) -> int:
+    """
+    Run in batch mode, solving every query of the --queries file.
+
+    Args:
+        game_map: The loaded game map
+        args: Parsed arguments
+        algorithm: Search algorithm to use
+        cost_config: Cost configuration
+
+    Returns:
+        Exit code (0 if every query has a path, non-zero otherwise)
+    """
+    try:
+        queries = load_queries(Path(args.queries))
+        results = find_paths_batch(
+            game_map,
+            queries,
+            algorithm,
+            allow_diagonal=args.allow_diagonal,
+            cost_config=cost_config,
+        )
+    except FileNotFoundError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    except ValueError as e:
+        print(f"Error: Invalid queries: {e}", file=sys.stderr)
+        return 1
+
+    print(format_batch_v2(queries, results))
+
+    return 0 if all(result is not None for result in results) else 1
+
+
 def main() -> int:
     """
     Main entry point.
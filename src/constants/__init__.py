@@ -2,6 +2,13 @@
 from src.constants.terrain_costs import (
     TerrainCost,
     TERRAIN_COSTS,
+    ASCII_TERRAIN_LUT,
+    PASSABLE_LUT,
+    BASE_COST_LUT,
+    ASCENT_COST_LUT,
+    DESCENT_COST_LUT,
+    DIAGONAL_FACTOR_LUT,
+    PASSABLE_CODES_BY_BASE_COST,
     get_terrain_cost,
     load_terrain_costs,
     DEFAULT_TERRAIN,
@@ -10,6 +17,13 @@ from src.constants.terrain_costs import (
 __all__ = [
     "TerrainCost",
     "TERRAIN_COSTS",
+    "ASCII_TERRAIN_LUT",
+    "PASSABLE_LUT",
+    "BASE_COST_LUT",
+    "ASCENT_COST_LUT",
+    "DESCENT_COST_LUT",
+    "DIAGONAL_FACTOR_LUT",
+    "PASSABLE_CODES_BY_BASE_COST",
     "get_terrain_cost",
     "load_terrain_costs",
     "DEFAULT_TERRAIN",
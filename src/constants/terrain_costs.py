@@ -1,11 +1,13 @@
 """Terrain cost constants generated from CSV."""
 import csv
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Mapping
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TerrainCost:
     """Cost parameters for a terrain type."""
 
@@ -35,17 +37,31 @@ def load_terrain_costs(csv_path: Path | None = None) -> Mapping[str, TerrainCost
     """
     Load terrain costs from CSV file.
 
+    Parsed tables are memoized per (path, mtime, size), so repeated loads of
+    an unchanged file skip CSV parsing; editing the file invalidates the
+    entry. The size catches rewrites within one tick of a coarse mtime.
+
     Args:
         csv_path: Path to CSV file. If None, uses default path.
 
     Returns:
-        Dictionary mapping terrain code to TerrainCost.
+        Read-only mapping from terrain code to TerrainCost.
     """
     path = csv_path or DEFAULT_CSV_PATH
 
-    if not path.exists():
-        return {".": DEFAULT_TERRAIN}
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return MappingProxyType({".": DEFAULT_TERRAIN})
+
+    return _load_terrain_costs_cached(path, stat.st_mtime_ns, stat.st_size)
+
 
+@lru_cache(maxsize=8)
+def _load_terrain_costs_cached(
+    path: Path, mtime_ns: int, size: int
+) -> Mapping[str, TerrainCost]:
+    """Parse a terrain cost CSV; mtime_ns and size only serve as part of the cache key."""
     costs: dict[str, TerrainCost] = {}
 
     with open(path, "r", encoding="utf-8") as f:
@@ -62,20 +78,61 @@ def load_terrain_costs(csv_path: Path | None = None) -> Mapping[str, TerrainCost
             )
             costs[cost.code] = cost
 
-    return costs
+    return MappingProxyType(costs)
 
 
 TERRAIN_COSTS: Mapping[str, TerrainCost] = load_terrain_costs()
 
+# Lookup table indexed by ord(code) for single ASCII characters.
+# Unknown ASCII codes resolve to DEFAULT_TERRAIN, matching get_terrain_cost.
+ASCII_TERRAIN_LUT: tuple[TerrainCost, ...] = tuple(
+    TERRAIN_COSTS.get(chr(i), DEFAULT_TERRAIN) for i in range(128)
+)
+
+# Per-field views of ASCII_TERRAIN_LUT, for loops that need a single field.
+PASSABLE_LUT: bytes = bytes(cost.passable for cost in ASCII_TERRAIN_LUT)
+BASE_COST_LUT: tuple[float, ...] = tuple(cost.base_cost for cost in ASCII_TERRAIN_LUT)
+ASCENT_COST_LUT: tuple[float, ...] = tuple(cost.ascent_cost for cost in ASCII_TERRAIN_LUT)
+DESCENT_COST_LUT: tuple[float, ...] = tuple(cost.descent_cost for cost in ASCII_TERRAIN_LUT)
+DIAGONAL_FACTOR_LUT: tuple[float, ...] = tuple(
+    cost.diagonal_factor for cost in ASCII_TERRAIN_LUT
+)
+
+# Passable ASCII codes ordered by base cost, cheapest first, so the cheapest
+# terrain present in a map is the first code found in its terrain bytes.
+PASSABLE_CODES_BY_BASE_COST: bytes = bytes(sorted(
+    (code for code in range(128) if PASSABLE_LUT[code]),
+    key=lambda code: (BASE_COST_LUT[code], code),
+))
+
+
+# Memo of every code get_terrain_cost has resolved, seeded with all single
+# ASCII characters. Unknown codes are remembered too (up to the limit) so
+# repeated lookups never fall through to the slow path.
+_LOOKUP_CACHE_LIMIT = 1024
+_lookup_cache: dict[str, TerrainCost] = {
+    chr(i): cost for i, cost in enumerate(ASCII_TERRAIN_LUT)
+}
+
 
 def get_terrain_cost(code: str) -> TerrainCost:
     """
     Get terrain cost for a given code.
 
+    Lookups go through a memo dict pre-seeded with every single ASCII
+    character; any other code is resolved once via TERRAIN_COSTS and
+    remembered.
+
     Args:
         code: Terrain code character.
 
     Returns:
         TerrainCost for the terrain, or DEFAULT_TERRAIN if unknown.
     """
-    return TERRAIN_COSTS.get(code, DEFAULT_TERRAIN)
+    try:
+        return _lookup_cache[code]
+    except KeyError:
+        cost = TERRAIN_COSTS.get(code, DEFAULT_TERRAIN)
+        if len(_lookup_cache) < _LOOKUP_CACHE_LIMIT:
+            _lookup_cache[code] = cost
+        return cost
@@ -13,7 +13,8 @@ Mathematical formulas:
 - Iso to Grid: Inverse transformation with rounding
 - Diamond hit-test: |u| + |v| <= 1 where u = 2/tw*(X-Xc), v = 2/th*(Y-Yc)
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Callable, Sequence
 
 
 class OutOfBoundsError(Exception):
@@ -51,7 +52,7 @@ def validate_grid_bounds(x: int, y: int, width: int, height: int) -> None:
         raise OutOfBoundsError(x, y, width, height)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IsoConfig:
     """Configuration for isometric projection.
 
@@ -65,8 +66,15 @@ class IsoConfig:
     tile_height: float = 32.0
     elevation_scale: float = 16.0
 
+    # Derived in __post_init__ so transforms skip the per-call division.
+    half_tw: float = field(init=False, repr=False, compare=False)
+    half_th: float = field(init=False, repr=False, compare=False)
+    inv_half_tw: float = field(init=False, repr=False, compare=False)
+    inv_half_th: float = field(init=False, repr=False, compare=False)
+    quarter_th: float = field(init=False, repr=False, compare=False)
+
     def __post_init__(self) -> None:
-        """Validate configuration parameters."""
+        """Validate configuration parameters and precompute derived tile sizes and reciprocals."""
         if self.tile_width <= 0:
             raise ValueError("tile_width must be positive")
         if self.tile_height <= 0:
@@ -74,8 +82,17 @@ class IsoConfig:
         if self.elevation_scale < 0:
             raise ValueError("elevation_scale must be non-negative")
 
+        object.__setattr__(self, "half_tw", self.tile_width / 2)
+        object.__setattr__(self, "half_th", self.tile_height / 2)
+        object.__setattr__(self, "inv_half_tw", 2.0 / self.tile_width)
+        object.__setattr__(self, "inv_half_th", 2.0 / self.tile_height)
+        object.__setattr__(self, "quarter_th", self.tile_height / 4)
+
+
+_DEFAULT_CONFIG = IsoConfig()
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class GridCoord:
     """Logical grid coordinate with optional elevation."""
 
@@ -84,7 +101,7 @@ class GridCoord:
     h: int = 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IsoCoord:
     """Isometric screen coordinate."""
 
@@ -92,7 +109,7 @@ class IsoCoord:
     y: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IsoCoordInt:
     """Isometric screen coordinate with integer values (pixel-aligned)."""
 
@@ -100,6 +117,41 @@ class IsoCoordInt:
     y: int
 
 
+def _to_iso_core(
+    x: float,
+    y: float,
+    h: float,
+    half_tw: float,
+    half_th: float,
+    beta: float,
+) -> tuple[float, float]:
+    """Forward projection on plain scalars (no dataclass allocation)."""
+    return half_tw * (x - y), half_th * (x + y) - beta * h
+
+
+def _to_grid_core(
+    iso_x: float,
+    iso_y: float,
+    h: float,
+    inv_half_tw: float,
+    inv_half_th: float,
+    beta: float,
+) -> tuple[int, int]:
+    """Inverse projection on plain scalars (no dataclass allocation).
+
+    Multiplies by the precomputed reciprocals instead of dividing, and rounds
+    half away from zero with int() truncation instead of calling round().
+    """
+    x_term = iso_x * inv_half_tw
+    y_term = (iso_y + beta * h) * inv_half_th
+    gx = (x_term + y_term) * 0.5
+    gy = (y_term - x_term) * 0.5
+    return (
+        int(gx + 0.5) if gx >= 0 else -int(0.5 - gx),
+        int(gy + 0.5) if gy >= 0 else -int(0.5 - gy),
+    )
+
+
 def to_iso(grid: GridCoord, config: IsoConfig | None = None) -> IsoCoord:
     """
     Convert logical grid coordinate to isometric screen coordinate.
@@ -115,12 +167,39 @@ def to_iso(grid: GridCoord, config: IsoConfig | None = None) -> IsoCoord:
     Returns:
         Isometric screen coordinate (X, Y)
     """
-    cfg = config or IsoConfig()
+    cfg = config if config is not None else _DEFAULT_CONFIG
 
-    iso_x = (cfg.tile_width / 2) * (grid.x - grid.y)
-    iso_y = (cfg.tile_height / 2) * (grid.x + grid.y) - cfg.elevation_scale * grid.h
+    iso_x, iso_y = _to_iso_core(
+        grid.x, grid.y, grid.h,
+        cfg.half_tw, cfg.half_th, cfg.elevation_scale,
+    )
+
+    return IsoCoord(iso_x, iso_y)
 
-    return IsoCoord(x=iso_x, y=iso_y)
+
+def to_iso_scalars(
+    grid: GridCoord,
+    config: IsoConfig | None = None,
+) -> tuple[float, float]:
+    """
+    Convert logical grid coordinate to isometric screen coordinate as plain floats.
+
+    Same result as to_iso without allocating an IsoCoord, for callers that
+    unpack the coordinates straight away.
+
+    Args:
+        grid: Logical grid coordinate (x, y, h)
+        config: Isometric projection configuration
+
+    Returns:
+        Tuple of (X, Y)
+    """
+    cfg = config if config is not None else _DEFAULT_CONFIG
+
+    return _to_iso_core(
+        grid.x, grid.y, grid.h,
+        cfg.half_tw, cfg.half_th, cfg.elevation_scale,
+    )
 
 
 def to_grid(iso: IsoCoord, elevation: int, config: IsoConfig | None = None) -> GridCoord:
@@ -135,6 +214,9 @@ def to_grid(iso: IsoCoord, elevation: int, config: IsoConfig | None = None) -> G
         x = (X / (tw/2) + Y_adj / (th/2)) / 2
         y = (Y_adj / (th/2) - X / (tw/2)) / 2
 
+    Fractional results are rounded to the nearest integer, with halves
+    rounded away from zero.
+
     Args:
         iso: Isometric screen coordinate (X, Y)
         elevation: Known elevation at this position
@@ -143,24 +225,146 @@ def to_grid(iso: IsoCoord, elevation: int, config: IsoConfig | None = None) -> G
     Returns:
         Logical grid coordinate (x, y, h)
     """
-    cfg = config or IsoConfig()
+    cfg = config if config is not None else _DEFAULT_CONFIG
 
-    y_adjusted = iso.y + cfg.elevation_scale * elevation
+    grid_x, grid_y = _to_grid_core(
+        iso.x, iso.y, elevation,
+        cfg.inv_half_tw, cfg.inv_half_th, cfg.elevation_scale,
+    )
 
-    half_tw = cfg.tile_width / 2
-    half_th = cfg.tile_height / 2
+    return GridCoord(grid_x, grid_y, elevation)
 
-    x_term = iso.x / half_tw
-    y_term = y_adjusted / half_th
 
-    grid_x = (x_term + y_term) / 2
-    grid_y = (y_term - x_term) / 2
+def to_iso_specialize(config: IsoConfig | None = None) -> Callable[[int, int, int], IsoCoord]:
+    """
+    Build a to_iso variant bound to one configuration.
 
-    return GridCoord(
-        x=round(grid_x),
-        y=round(grid_y),
-        h=elevation,
-    )
+    The tile sizes and elevation scale are read once and captured by the
+    returned function, so repeated projections with the same configuration
+    skip the per-call config lookups.
+
+    Args:
+        config: Isometric projection configuration
+
+    Returns:
+        Function mapping (x, y, h) to the same IsoCoord as to_iso
+    """
+    cfg = config if config is not None else _DEFAULT_CONFIG
+    half_tw = cfg.half_tw
+    half_th = cfg.half_th
+    beta = cfg.elevation_scale
+
+    def project(x: int, y: int, h: int = 0) -> IsoCoord:
+        return IsoCoord(half_tw * (x - y), half_th * (x + y) - beta * h)
+
+    return project
+
+
+def to_grid_specialize(config: IsoConfig | None = None) -> Callable[[IsoCoord, int], GridCoord]:
+    """
+    Build a to_grid variant bound to one configuration.
+
+    Counterpart of to_iso_specialize for the inverse projection.
+
+    Args:
+        config: Isometric projection configuration
+
+    Returns:
+        Function mapping (iso, elevation) to the same GridCoord as to_grid
+    """
+    cfg = config if config is not None else _DEFAULT_CONFIG
+    inv_half_tw = cfg.inv_half_tw
+    inv_half_th = cfg.inv_half_th
+    beta = cfg.elevation_scale
+
+    def unproject(iso: IsoCoord, elevation: int) -> GridCoord:
+        grid_x, grid_y = _to_grid_core(
+            iso.x, iso.y, elevation, inv_half_tw, inv_half_th, beta,
+        )
+        return GridCoord(grid_x, grid_y, elevation)
+
+    return unproject
+
+
+def to_iso_batch(
+    xs: Sequence[int],
+    ys: Sequence[int],
+    hs: Sequence[int],
+    config: IsoConfig | None = None,
+) -> tuple[list[float], list[float]]:
+    """
+    Convert many logical grid coordinates to isometric screen coordinates.
+
+    Batch variant of to_iso that works on parallel coordinate sequences,
+    avoiding one GridCoord/IsoCoord allocation per point.
+
+    Args:
+        xs: Grid x coordinates
+        ys: Grid y coordinates
+        hs: Elevations
+        config: Isometric projection configuration
+
+    Returns:
+        Tuple of (iso_xs, iso_ys) lists
+
+    Raises:
+        ValueError: If the coordinate sequences differ in length
+    """
+    cfg = config if config is not None else _DEFAULT_CONFIG
+
+    half_tw = cfg.half_tw
+    half_th = cfg.half_th
+    beta = cfg.elevation_scale
+
+    iso_xs: list[float] = []
+    iso_ys: list[float] = []
+
+    for x, y, h in zip(xs, ys, hs, strict=True):
+        iso_x, iso_y = _to_iso_core(x, y, h, half_tw, half_th, beta)
+        iso_xs.append(iso_x)
+        iso_ys.append(iso_y)
+
+    return iso_xs, iso_ys
+
+
+def to_grid_batch(
+    iso_xs: Sequence[float],
+    iso_ys: Sequence[float],
+    elevations: Sequence[int],
+    config: IsoConfig | None = None,
+) -> tuple[list[int], list[int]]:
+    """
+    Convert many isometric screen coordinates to logical grid coordinates.
+
+    Batch variant of to_grid; see to_grid for the inverse formula.
+
+    Args:
+        iso_xs: Isometric X coordinates
+        iso_ys: Isometric Y coordinates
+        elevations: Known elevation at each position
+        config: Isometric projection configuration
+
+    Returns:
+        Tuple of (grid_xs, grid_ys) lists
+
+    Raises:
+        ValueError: If the coordinate sequences differ in length
+    """
+    cfg = config if config is not None else _DEFAULT_CONFIG
+
+    inv_half_tw = cfg.inv_half_tw
+    inv_half_th = cfg.inv_half_th
+    beta = cfg.elevation_scale
+
+    grid_xs: list[int] = []
+    grid_ys: list[int] = []
+
+    for iso_x, iso_y, h in zip(iso_xs, iso_ys, elevations, strict=True):
+        grid_x, grid_y = _to_grid_core(iso_x, iso_y, h, inv_half_tw, inv_half_th, beta)
+        grid_xs.append(grid_x)
+        grid_ys.append(grid_y)
+
+    return grid_xs, grid_ys
 
 
 def to_iso_center(grid: GridCoord, config: IsoConfig | None = None) -> IsoCoord:
@@ -176,13 +380,46 @@ def to_iso_center(grid: GridCoord, config: IsoConfig | None = None) -> IsoCoord:
     Returns:
         Isometric screen coordinate at tile center
     """
-    base = to_iso(grid, config)
-    cfg = config or IsoConfig()
+    cfg = config if config is not None else _DEFAULT_CONFIG
+    iso_x, iso_y = to_iso_scalars(grid, cfg)
 
-    return IsoCoord(
-        x=base.x,
-        y=base.y + cfg.tile_height / 4,
-    )
+    return IsoCoord(iso_x, iso_y + cfg.quarter_th)
+
+
+def to_iso_center_batch(
+    xs: Sequence[int],
+    ys: Sequence[int],
+    hs: Sequence[int],
+    config: IsoConfig | None = None,
+) -> tuple[list[float], list[float]]:
+    """
+    Convert many logical grid coordinates to isometric tile-center coordinates.
+
+    Batch variant of to_iso_center.
+
+    Args:
+        xs: Grid x coordinates
+        ys: Grid y coordinates
+        hs: Elevations
+        config: Isometric projection configuration
+
+    Returns:
+        Tuple of (iso_xs, iso_ys) lists
+
+    Raises:
+        ValueError: If the coordinate sequences differ in length
+    """
+    cfg = config if config is not None else _DEFAULT_CONFIG
+
+    iso_xs, iso_ys = to_iso_batch(xs, ys, hs, cfg)
+    center_offset = cfg.quarter_th
+
+    return iso_xs, [iso_y + center_offset for iso_y in iso_ys]
+
+
+# sqrt(2) - 2: correction applied per diagonal step when rewriting the octile
+# distance as dx + dy + (sqrt(2) - 2) * min(dx, dy).
+_OCTILE_DIAGONAL_DELTA = 1.41421356237 - 2
 
 
 def manhattan_distance_grid(a: GridCoord, b: GridCoord) -> int:
@@ -204,6 +441,8 @@ def octile_distance_grid(a: GridCoord, b: GridCoord) -> float:
     Calculate Octile distance between two grid coordinates (for 8-directional movement).
 
     Formula: max(dx, dy) + (sqrt(2) - 1) * min(dx, dy)
+    Evaluated as dx + dy + (sqrt(2) - 2) * min(dx, dy), which needs a
+    single comparison instead of max() and min() calls.
 
     Args:
         a: First grid coordinate
@@ -212,10 +451,10 @@ def octile_distance_grid(a: GridCoord, b: GridCoord) -> float:
     Returns:
         Octile distance
     """
-    dx = abs(a.x - b.x)
-    dy = abs(a.y - b.y)
+    dx = a.x - b.x if a.x >= b.x else b.x - a.x
+    dy = a.y - b.y if a.y >= b.y else b.y - a.y
 
-    return max(dx, dy) + (1.41421356237 - 1) * min(dx, dy)
+    return dx + dy + _OCTILE_DIAGONAL_DELTA * (dx if dx < dy else dy)
 
 
 def to_iso_int(grid: GridCoord, config: IsoConfig | None = None) -> IsoCoordInt:
@@ -236,11 +475,48 @@ def to_iso_int(grid: GridCoord, config: IsoConfig | None = None) -> IsoCoordInt:
     Returns:
         Integer isometric screen coordinate (X, Y)
     """
-    iso = to_iso(grid, config)
-    return IsoCoordInt(
-        x=int(round(iso.x)),
-        y=int(round(iso.y)),
-    )
+    iso_x, iso_y = to_iso_scalars(grid, config)
+    return IsoCoordInt(int(round(iso_x)), int(round(iso_y)))
+
+
+def to_iso_int_batch(
+    xs: Sequence[int],
+    ys: Sequence[int],
+    hs: Sequence[int],
+    config: IsoConfig | None = None,
+) -> tuple[list[int], list[int]]:
+    """
+    Convert many logical grid coordinates to integer isometric screen coordinates.
+
+    Batch variant of to_iso_int; rounding matches it exactly (round half to even).
+
+    Args:
+        xs: Grid x coordinates
+        ys: Grid y coordinates
+        hs: Elevations
+        config: Isometric projection configuration
+
+    Returns:
+        Tuple of (iso_xs, iso_ys) integer lists
+
+    Raises:
+        ValueError: If the coordinate sequences differ in length
+    """
+    cfg = config if config is not None else _DEFAULT_CONFIG
+
+    half_tw = cfg.half_tw
+    half_th = cfg.half_th
+    beta = cfg.elevation_scale
+
+    iso_xs: list[int] = []
+    iso_ys: list[int] = []
+
+    for x, y, h in zip(xs, ys, hs, strict=True):
+        iso_x, iso_y = _to_iso_core(x, y, h, half_tw, half_th, beta)
+        iso_xs.append(round(iso_x))
+        iso_ys.append(round(iso_y))
+
+    return iso_xs, iso_ys
 
 
 def is_in_diamond(u: float, v: float) -> bool:
@@ -266,6 +542,25 @@ def is_in_diamond(u: float, v: float) -> bool:
     return abs(u) + abs(v) <= 1.0
 
 
+def is_in_diamond_batch(us: Sequence[float], vs: Sequence[float]) -> list[bool]:
+    """
+    Hit-test many normalized coordinates against the diamond region.
+
+    Batch variant of is_in_diamond: |u| + |v| <= 1 element-wise.
+
+    Args:
+        us: Normalized x coordinates
+        vs: Normalized y coordinates
+
+    Returns:
+        List of flags, True where the point is inside or on the boundary
+
+    Raises:
+        ValueError: If the coordinate sequences differ in length
+    """
+    return [abs(u) + abs(v) <= 1.0 for u, v in zip(us, vs, strict=True)]
+
+
 def normalize_to_diamond(
     click_x: float,
     click_y: float,
@@ -290,7 +585,7 @@ def normalize_to_diamond(
     Returns:
         Tuple of (u, v) normalized coordinates
     """
-    cfg = config or IsoConfig()
-    u = (2.0 / cfg.tile_width) * (click_x - center_x)
-    v = (2.0 / cfg.tile_height) * (click_y - center_y)
+    cfg = config if config is not None else _DEFAULT_CONFIG
+    u = cfg.inv_half_tw * (click_x - center_x)
+    v = cfg.inv_half_th * (click_y - center_y)
     return (u, v)
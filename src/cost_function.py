@@ -1,7 +1,13 @@
 """Cost function for multi-weighted pathfinding."""
 from dataclasses import dataclass
 
-from src.constants.terrain_costs import get_terrain_cost
+from src.constants.terrain_costs import (
+    ASCENT_COST_LUT,
+    BASE_COST_LUT,
+    DESCENT_COST_LUT,
+    DIAGONAL_FACTOR_LUT,
+    PASSABLE_LUT,
+)
 from src.map_loader_v2 import MultiLayerMap
 
 # Maximum cost cap (SPECIFICATION.md §最終査察追補)
@@ -10,7 +16,7 @@ from src.map_loader_v2 import MultiLayerMap
 MAX_COST_CAP: int = 255
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CostConfig:
     """Configuration for cost calculation."""
 
@@ -18,6 +24,10 @@ class CostConfig:
     max_cost_cap: float = MAX_COST_CAP
 
 
+# Shared default so calls without a config do not allocate one per edge
+_DEFAULT_COST_CONFIG = CostConfig()
+
+
 def is_diagonal_move(u: tuple[int, int], v: tuple[int, int]) -> bool:
     """
     Check if movement from u to v is diagonal.
@@ -29,9 +39,9 @@ def is_diagonal_move(u: tuple[int, int], v: tuple[int, int]) -> bool:
     Returns:
         True if diagonal move (both x and y change)
     """
-    dx = abs(v[0] - u[0])
-    dy = abs(v[1] - u[1])
-    return dx == 1 and dy == 1
+    dx = v[0] - u[0]
+    dy = v[1] - u[1]
+    return (dx == 1 or dx == -1) and (dy == 1 or dy == -1)
 
 
 def calculate_edge_cost(
@@ -68,40 +78,56 @@ def calculate_edge_cost(
 
     Returns:
         Total edge cost
-    """
-    cfg = config or CostConfig()
-
-    terrain_code = game_map.terrain[v[1]][v[0]]
-    terrain = get_terrain_cost(terrain_code)
 
-    if not terrain.passable:
+    Raises:
+        IndexError: If u or v lies outside the map
+    """
+    cfg = config or _DEFAULT_COST_CONFIG
+
+    width = game_map.width
+    height = game_map.height
+    # Flat indices would wrap an off-map x into the neighboring row
+    if not (
+        0 <= u[0] < width and 0 <= u[1] < height
+        and 0 <= v[0] < width and 0 <= v[1] < height
+    ):
+        raise IndexError(f"Edge {u} -> {v} leaves the map")
+    u_index = u[1] * width + u[0]
+    v_index = v[1] * width + v[0]
+
+    code = game_map.terrain_codes[v_index]
+
+    # Single early exit for impassable targets, straight from the bytes mask
+    if not PASSABLE_LUT[code]:
         return float('inf')
 
-    is_diagonal = is_diagonal_move(u, v)
+    # Inlined is_diagonal_move: both coordinates change by exactly one
+    dx = v[0] - u[0]
+    dy = v[1] - u[1]
+    is_diagonal = (dx == 1 or dx == -1) and (dy == 1 or dy == -1)
     if is_diagonal and not allow_diagonal:
         return float('inf')
 
-    kappa = terrain.diagonal_factor if is_diagonal else 1.0
-    base_component = terrain.base_cost * kappa
+    kappa = DIAGONAL_FACTOR_LUT[code] if is_diagonal else 1.0
+    base_component = BASE_COST_LUT[code] * kappa
 
-    h_u = game_map.elevation[u[1]][u[0]]
-    h_v = game_map.elevation[v[1]][v[0]]
+    h_u = game_map.elevation_flat[u_index]
+    h_v = game_map.elevation_flat[v_index]
     delta_h = h_v - h_u
 
-    ascent_component = terrain.ascent_cost * max(0, delta_h)
-    descent_component = terrain.descent_cost * max(0, -delta_h)
+    ascent_component = ASCENT_COST_LUT[code] * max(0, delta_h)
+    descent_component = DESCENT_COST_LUT[code] * max(0, -delta_h)
 
-    priority_v = game_map.priority[v[1]][v[0]]
+    priority_v = game_map.priority_flat[v_index]
     priority_component = cfg.priority_weight * priority_v
 
     total_cost = base_component + ascent_component + descent_component + priority_component
 
     # Apply cost saturation (SPECIFICATION.md §最終査察追補)
     # c̃(u,v) = min(c(u,v), C_max) where C_max = 255
-    if total_cost > cfg.max_cost_cap:
-        return cfg.max_cost_cap
-
-    return total_cost
+    # A plain comparison beats a min() call in CPython.
+    cap = cfg.max_cost_cap
+    return cap if total_cost > cap else total_cost
 
 
 def get_minimum_base_cost(game_map: MultiLayerMap) -> float:
@@ -116,12 +142,5 @@ def get_minimum_base_cost(game_map: MultiLayerMap) -> float:
     Returns:
         Minimum base cost (excluding impassable)
     """
-    min_cost = float('inf')
-
-    for row in game_map.terrain:
-        for code in row:
-            terrain = get_terrain_cost(code)
-            if terrain.passable and terrain.base_cost < min_cost:
-                min_cost = terrain.base_cost
-
-    return min_cost if min_cost != float('inf') else 1.0
+    # Computed once per map in MultiLayerMap.__post_init__
+    return game_map.min_base_cost
@@ -3,11 +3,17 @@ import heapq
 import time
 from dataclasses import dataclass
 from enum import Enum
-from typing import Sequence
+from typing import Callable, Sequence
 
 from src.map_loader_v2 import MultiLayerMap
-from src.cost_function import calculate_edge_cost, get_minimum_base_cost, CostConfig
-from src.constants.terrain_costs import get_terrain_cost
+from src.cost_function import get_minimum_base_cost, CostConfig
+from src.constants.terrain_costs import (
+    ASCENT_COST_LUT,
+    BASE_COST_LUT,
+    DESCENT_COST_LUT,
+    DIAGONAL_FACTOR_LUT,
+    PASSABLE_LUT,
+)
 
 
 class FinderAlgorithm(Enum):
@@ -34,9 +40,29 @@ class FinderResult:
     execution_time: float
 
 
+@dataclass(frozen=True)
+class SearchContext:
+    """Per-map search precomputation that can be shared across find_path calls.
+
+    edges[y * width + x] lists the (neighbor, edge_cost) pairs leaving (x, y),
+    with impassable neighbors already dropped. The context is only valid for
+    the map, cost configuration and movement mode it was built with.
+    """
+
+    width: int
+    height: int
+    allow_diagonal: bool
+    cost_config: CostConfig
+    min_cost: float
+    edges: tuple[tuple[tuple[tuple[int, int], float], ...], ...]
+
+
 DIRECTIONS_4 = [(0, -1), (0, 1), (-1, 0), (1, 0)]
 DIRECTIONS_8 = DIRECTIONS_4 + [(-1, -1), (-1, 1), (1, -1), (1, 1)]
 
+# Heuristic signature: h(pos, goal, min_cost) -> estimated cost to goal
+HeuristicFunc = Callable[[tuple[int, int], tuple[int, int], float], float]
+
 
 def manhattan_heuristic(
     pos: tuple[int, int],
@@ -87,6 +113,15 @@ def octile_heuristic(
     return d_octile * min_cost
 
 
+def _direction_table(
+    width: int,
+    allow_diagonal: bool,
+) -> list[tuple[int, int, int, bool]]:
+    """List (dx, dy, flat index offset, is_diagonal) per move, in DIRECTIONS order."""
+    directions = DIRECTIONS_8 if allow_diagonal else DIRECTIONS_4
+    return [(dx, dy, dy * width + dx, dx != 0 and dy != 0) for dx, dy in directions]
+
+
 def get_neighbors(
     pos: tuple[int, int],
     game_map: MultiLayerMap,
@@ -105,24 +140,110 @@ def get_neighbors(
     """
     directions = DIRECTIONS_8 if allow_diagonal else DIRECTIONS_4
     neighbors: list[tuple[int, int]] = []
+    width = game_map.width
+    height = game_map.height
+    terrain_codes = game_map.terrain_codes
 
     for dx, dy in directions:
         nx, ny = pos[0] + dx, pos[1] + dy
 
-        if 0 <= nx < game_map.width and 0 <= ny < game_map.height:
-            terrain_code = game_map.terrain[ny][nx]
-            terrain = get_terrain_cost(terrain_code)
-            if terrain.passable:
+        if 0 <= nx < width and 0 <= ny < height:
+            if PASSABLE_LUT[terrain_codes[ny * width + nx]]:
                 neighbors.append((nx, ny))
 
     return neighbors
 
 
+def build_search_context(
+    game_map: MultiLayerMap,
+    cost_config: CostConfig | None = None,
+    allow_diagonal: bool = False,
+) -> SearchContext:
+    """
+    Precompute the neighbor and edge cost table of a map.
+
+    Building the table costs one pass over every cell; afterwards each
+    find_path call given the context skips neighbor generation and cost
+    evaluation entirely. Worth it when several searches run on the same map.
+
+    Args:
+        game_map: Multi-layer map
+        cost_config: Cost calculation configuration
+        allow_diagonal: Whether diagonal movement is allowed
+
+    Returns:
+        SearchContext for the map
+    """
+    config = cost_config or CostConfig()
+    width = game_map.width
+    height = game_map.height
+    elevation = game_map.elevation_flat
+    priority_weight = config.priority_weight
+    cost_cap = config.max_cost_cap
+
+    # Per-cell cost terms of entering each cell, resolved from the LUTs in
+    # one pass so the edge loop below only does indexed reads
+    codes = game_map.terrain_codes
+    passable = [PASSABLE_LUT[code] for code in codes]
+    straight = [BASE_COST_LUT[code] for code in codes]
+    diagonal_cost = [BASE_COST_LUT[code] * DIAGONAL_FACTOR_LUT[code] for code in codes]
+    ascent = [ASCENT_COST_LUT[code] for code in codes]
+    descent = [DESCENT_COST_LUT[code] for code in codes]
+    priority_term = [priority_weight * value for value in game_map.priority_flat]
+
+    directions = _direction_table(width, allow_diagonal)
+    edges: list[tuple[tuple[tuple[int, int], float], ...]] = []
+    append = edges.append
+
+    for y in range(height):
+        for x in range(width):
+            current = y * width + x
+            h_u = elevation[current]
+            cell_edges: list[tuple[tuple[int, int], float]] = []
+
+            for dx, dy, offset, diagonal in directions:
+                nx = x + dx
+                ny = y + dy
+                if not (0 <= nx < width and 0 <= ny < height):
+                    continue
+
+                neighbor = current + offset
+                if not passable[neighbor]:
+                    continue
+
+                delta_h = elevation[neighbor] - h_u
+                edge_cost = (
+                    (diagonal_cost[neighbor] if diagonal else straight[neighbor])
+                    + ascent[neighbor] * max(0, delta_h)
+                    + descent[neighbor] * max(0, -delta_h)
+                    + priority_term[neighbor]
+                )
+                if edge_cost > cost_cap:
+                    edge_cost = cost_cap
+
+                cell_edges.append(((nx, ny), edge_cost))
+
+            append(tuple(cell_edges))
+
+    return SearchContext(
+        width=width,
+        height=game_map.height,
+        allow_diagonal=allow_diagonal,
+        cost_config=config,
+        min_cost=get_minimum_base_cost(game_map),
+        edges=tuple(edges),
+    )
+
+
 def find_path(
     game_map: MultiLayerMap,
     algorithm: FinderAlgorithm,
     allow_diagonal: bool = False,
     cost_config: CostConfig | None = None,
+    heuristic: HeuristicFunc | None = None,
+    context: SearchContext | None = None,
+    start: tuple[int, int] | None = None,
+    goal: tuple[int, int] | None = None,
 ) -> FinderResult:
     """
     Find optimal path using specified algorithm.
@@ -132,78 +253,159 @@ def find_path(
         algorithm: Dijkstra or A*
         allow_diagonal: Whether diagonal movement is allowed
         cost_config: Cost calculation configuration
+        heuristic: A* heuristic override (defaults to octile when diagonal
+            movement is allowed, Manhattan otherwise); ignored by Dijkstra
+        context: Precomputed table from build_search_context for this map;
+            when omitted, neighbors and edge costs are computed on demand
+        start: Start position (defaults to game_map.start)
+        goal: Goal position (defaults to game_map.goal)
 
     Returns:
         FinderResult with path and statistics
 
     Raises:
         NoPathFoundError: If no path exists
+        ValueError: If context was built with different options, or start
+            or goal lies outside the map
     """
     start_time = time.perf_counter()
 
-    start = game_map.start
-    goal = game_map.goal
+    if start is None:
+        start = game_map.start
+    elif not _in_bounds(start, game_map):
+        raise ValueError(f"Start {start} is outside the map")
+    if goal is None:
+        goal = game_map.goal
+    elif not _in_bounds(goal, game_map):
+        raise ValueError(f"Goal {goal} is outside the map")
     config = cost_config or CostConfig()
 
-    min_cost = get_minimum_base_cost(game_map)
-    heuristic_func = octile_heuristic if allow_diagonal else manhattan_heuristic
-
-    dist: dict[tuple[int, int], float] = {start: 0}
-    came_from: dict[tuple[int, int], tuple[int, int] | None] = {start: None}
-
-    if algorithm == FinderAlgorithm.ASTAR:
-        h_start = heuristic_func(start, goal, min_cost)
-        pq: list[tuple[float, tuple[int, int]]] = [(h_start, start)]
+    if context is not None:
+        if (
+            context.allow_diagonal != allow_diagonal
+            or context.cost_config != config
+            or context.width != game_map.width
+            or context.height != game_map.height
+        ):
+            raise ValueError("Search context was built for a different map or options")
+        min_cost = context.min_cost
     else:
-        pq = [(0.0, start)]
+        min_cost = get_minimum_base_cost(game_map)
 
+    if heuristic is not None:
+        heuristic_func = heuristic
+    else:
+        heuristic_func = octile_heuristic if allow_diagonal else manhattan_heuristic
+
+    width = game_map.width
+    height = game_map.height
+    goal_x, goal_y = goal
+    start_index = start[1] * width + start[0]
+    goal_index = goal_y * width + goal_x
+    is_astar = algorithm == FinderAlgorithm.ASTAR
+
+    # Flat row-major search state; nodes are indexed y * width + x
+    inf = float('inf')
+    dist = [inf] * (width * height)
+    came_from = [-1] * (width * height)
+    dist[start_index] = 0.0
+
+    # Heap entries are (f, key) with the column-major key x * height + y, so
+    # ties break exactly like (f, (x, y)) while comparing a single int.
+    # Costs are bounded by max_cost_cap, but a bucket (Dial) queue was measured
+    # here and is no faster: edge costs are floats, so buckets still need a
+    # heap to keep this pop order, and the extra Python-level bookkeeping costs
+    # about as much as the C heapq operations it replaces. Packing f and key
+    # into one int (order-preserving IEEE 754 bits) was measured too: the
+    # per-push struct/int.from_bytes encoding costs more than the cheaper
+    # int compares save, so entries stay (float, int) tuples.
+    goal_key = goal_x * height + goal_y
+    h_start = heuristic_func(start, goal, min_cost) if is_astar else 0.0
+    pq: list[tuple[float, int]] = [(h_start, start[0] * height + start[1])]
+
+    # Inlined neighbor expansion and edge cost (see calculate_edge_cost)
+    directions = _direction_table(width, allow_diagonal)
+    terrain_codes = game_map.terrain_codes
+    elevation = game_map.elevation_flat
+    priority = game_map.priority_flat
+    priority_weight = config.priority_weight
+    cost_cap = config.max_cost_cap
+    context_edges = context.edges if context is not None else None
+
+    heappush = heapq.heappush
+    heappop = heapq.heappop
     nodes_expanded = 0
 
     while pq:
-        current_f, current = heapq.heappop(pq)
+        current_f, key = heappop(pq)
 
-        if current == goal:
+        if key == goal_key:
             break
 
-        current_dist = dist.get(current, float('inf'))
+        cx, cy = divmod(key, height)
+        current = cy * width + cx
+        current_dist = dist[current]
 
-        if algorithm == FinderAlgorithm.ASTAR:
-            if current_f > current_dist + heuristic_func(current, goal, min_cost) + 1e-9:
-                continue
-        else:
-            if current_f > current_dist + 1e-9:
+        # Stale entries are detected exactly: a live entry's f was computed
+        # from the same dist and heuristic operands, so it compares equal
+        if is_astar:
+            if current_f > current_dist + heuristic_func((cx, cy), goal, min_cost):
                 continue
+        elif current_f > current_dist:
+            continue
 
         nodes_expanded += 1
 
-        for neighbor in get_neighbors(current, game_map, allow_diagonal):
-            edge_cost = calculate_edge_cost(
-                current, neighbor, game_map, config, allow_diagonal
-            )
+        if context_edges is not None:
+            for (nx, ny), edge_cost in context_edges[current]:
+                neighbor = ny * width + nx
+                new_dist = current_dist + edge_cost
+
+                if new_dist < dist[neighbor]:
+                    dist[neighbor] = new_dist
+                    came_from[neighbor] = current
+                    f_score = new_dist + heuristic_func((nx, ny), goal, min_cost) if is_astar else new_dist
+                    heappush(pq, (f_score, nx * height + ny))
+            continue
 
-            if edge_cost == float('inf'):
+        h_u = elevation[current]
+
+        for dx, dy, offset, diagonal in directions:
+            nx = cx + dx
+            ny = cy + dy
+            if not (0 <= nx < width and 0 <= ny < height):
                 continue
 
+            neighbor = current + offset
+            code = terrain_codes[neighbor]
+            if not PASSABLE_LUT[code]:
+                continue
+
+            delta_h = elevation[neighbor] - h_u
+            edge_cost = (
+                BASE_COST_LUT[code] * (DIAGONAL_FACTOR_LUT[code] if diagonal else 1.0)
+                + ASCENT_COST_LUT[code] * max(0, delta_h)
+                + DESCENT_COST_LUT[code] * max(0, -delta_h)
+                + priority_weight * priority[neighbor]
+            )
+            if edge_cost > cost_cap:
+                edge_cost = cost_cap
+
             new_dist = current_dist + edge_cost
 
-            if new_dist < dist.get(neighbor, float('inf')):
+            if new_dist < dist[neighbor]:
                 dist[neighbor] = new_dist
                 came_from[neighbor] = current
-
-                if algorithm == FinderAlgorithm.ASTAR:
-                    f_score = new_dist + heuristic_func(neighbor, goal, min_cost)
-                else:
-                    f_score = new_dist
-
-                heapq.heappush(pq, (f_score, neighbor))
+                f_score = new_dist + heuristic_func((nx, ny), goal, min_cost) if is_astar else new_dist
+                heappush(pq, (f_score, nx * height + ny))
 
     end_time = time.perf_counter()
 
-    if goal not in came_from:
+    total_cost = dist[goal_index]
+    if total_cost == inf:
         raise NoPathFoundError(f"No path from {start} to {goal}")
 
-    path = _reconstruct_path(came_from, goal)
-    total_cost = dist[goal]
+    path = _reconstruct_path(came_from, goal_index, width)
 
     return FinderResult(
         path=path,
@@ -214,26 +416,322 @@ def find_path(
     )
 
 
-def _reconstruct_path(
-    came_from: dict[tuple[int, int], tuple[int, int] | None],
+def find_paths_batch(
+    game_map: MultiLayerMap,
+    queries: Sequence[tuple[tuple[int, int], tuple[int, int]]],
+    algorithm: FinderAlgorithm,
+    allow_diagonal: bool = False,
+    cost_config: CostConfig | None = None,
+    context: SearchContext | None = None,
+) -> list[FinderResult | None]:
+    """
+    Answer many (start, goal) queries on one map.
+
+    The neighbor and edge cost table is built once (unless a context is
+    given) and shared by every search, so each query only pays for its own
+    expansion.
+
+    Args:
+        game_map: Multi-layer map
+        queries: (start, goal) pairs to solve
+        algorithm: Dijkstra or A*
+        allow_diagonal: Whether diagonal movement is allowed
+        cost_config: Cost calculation configuration
+        context: Precomputed table from build_search_context for this map
+
+    Returns:
+        One FinderResult per query, in query order; None where no path exists
+
+    Raises:
+        ValueError: If context was built with different options, or a query
+            lies outside the map
+    """
+    config = cost_config or CostConfig()
+    if context is None and queries:
+        context = build_search_context(game_map, config, allow_diagonal)
+
+    results: list[FinderResult | None] = []
+
+    for start, goal in queries:
+        try:
+            results.append(find_path(
+                game_map,
+                algorithm,
+                allow_diagonal=allow_diagonal,
+                cost_config=config,
+                context=context,
+                start=start,
+                goal=goal,
+            ))
+        except NoPathFoundError:
+            results.append(None)
+
+    return results
+
+
+def jump_point_search(
+    game_map: MultiLayerMap,
+    allow_diagonal: bool = False,
+    cost_config: CostConfig | None = None,
+    start: tuple[int, int] | None = None,
+    goal: tuple[int, int] | None = None,
+) -> FinderResult:
+    """
+    Find an optimal path with Jump Point Search when step costs are uniform.
+
+    JPS prunes symmetric paths by jumping along straight and diagonal rays
+    until a forced neighbor or the goal appears, so only the jump points are
+    pushed to the open list. It is only exact when every straight step and
+    every diagonal step costs the same, which holds when all passable cells
+    share the same terrain costs, elevation and priority term. Diagonal moves
+    may cut corners, as in find_path. Other maps, and 4-directional movement,
+    fall back to find_path with A*.
+
+    Pays off when obstacles make A* flood large areas; on open fields the
+    octile heuristic alone is already precise and the ray scans cost more.
+
+    Args:
+        game_map: Multi-layer map
+        allow_diagonal: Whether diagonal movement is allowed
+        cost_config: Cost calculation configuration
+        start: Start position (defaults to game_map.start)
+        goal: Goal position (defaults to game_map.goal)
+
+    Returns:
+        FinderResult with the full cell path; nodes_expanded counts jump points
+
+    Raises:
+        NoPathFoundError: If no path exists
+        ValueError: If start or goal lies outside the map
+    """
+    config = cost_config or CostConfig()
+    step_costs = _uniform_step_costs(game_map, config) if allow_diagonal else None
+
+    if step_costs is None:
+        return find_path(
+            game_map,
+            FinderAlgorithm.ASTAR,
+            allow_diagonal=allow_diagonal,
+            cost_config=config,
+            start=start,
+            goal=goal,
+        )
+
+    start_time = time.perf_counter()
+
+    if start is None:
+        start = game_map.start
+    elif not _in_bounds(start, game_map):
+        raise ValueError(f"Start {start} is outside the map")
+    if goal is None:
+        goal = game_map.goal
+    elif not _in_bounds(goal, game_map):
+        raise ValueError(f"Goal {goal} is outside the map")
+
+    straight, diagonal = step_costs
+    width = game_map.width
+    height = game_map.height
+    terrain_codes = game_map.terrain_codes
+    goal_x, goal_y = goal
+
+    def free(x: int, y: int) -> bool:
+        return 0 <= x < width and 0 <= y < height and PASSABLE_LUT[terrain_codes[y * width + x]] != 0
+
+    def jump(x: int, y: int, dx: int, dy: int) -> tuple[int, int] | None:
+        """Walk from (x, y) in direction (dx, dy) to the next jump point."""
+        while True:
+            x += dx
+            y += dy
+            if not free(x, y):
+                return None
+            if x == goal_x and y == goal_y:
+                return x, y
+
+            if dx and dy:
+                if (not free(x - dx, y) and free(x - dx, y + dy)) or (
+                    not free(x, y - dy) and free(x + dx, y - dy)
+                ):
+                    return x, y
+                if jump(x, y, dx, 0) is not None or jump(x, y, 0, dy) is not None:
+                    return x, y
+            elif dx:
+                if (not free(x, y + 1) and free(x + dx, y + 1)) or (
+                    not free(x, y - 1) and free(x + dx, y - 1)
+                ):
+                    return x, y
+            elif (not free(x + 1, y) and free(x + 1, y + dy)) or (
+                not free(x - 1, y) and free(x - 1, y + dy)
+            ):
+                return x, y
+
+    def directions_from(x: int, y: int, parent: tuple[int, int] | None) -> list[tuple[int, int]]:
+        """Natural and forced directions of (x, y) given how it was reached."""
+        if parent is None:
+            return DIRECTIONS_8
+        dx = (x > parent[0]) - (x < parent[0])
+        dy = (y > parent[1]) - (y < parent[1])
+
+        if dx and dy:
+            found = [(dx, 0), (0, dy), (dx, dy)]
+            if not free(x - dx, y):
+                found.append((-dx, dy))
+            if not free(x, y - dy):
+                found.append((dx, -dy))
+        elif dx:
+            found = [(dx, 0)]
+            if not free(x, y + 1):
+                found.append((dx, 1))
+            if not free(x, y - 1):
+                found.append((dx, -1))
+        else:
+            found = [(0, dy)]
+            if not free(x + 1, y):
+                found.append((1, dy))
+            if not free(x - 1, y):
+                found.append((-1, dy))
+        return found
+
+    def h(x: int, y: int) -> float:
+        dx = abs(x - goal_x)
+        dy = abs(y - goal_y)
+        return straight * (dx + dy) + (diagonal - 2 * straight) * min(dx, dy)
+
+    g_score: dict[tuple[int, int], float] = {start: 0.0}
+    came_from: dict[tuple[int, int], tuple[int, int]] = {}
+    pq: list[tuple[float, tuple[int, int]]] = [(h(*start), start)]
+    closed: set[tuple[int, int]] = set()
+    nodes_expanded = 0
+
+    while pq:
+        _, current = heapq.heappop(pq)
+
+        if current == goal:
+            break
+        if current in closed:
+            continue
+        closed.add(current)
+        nodes_expanded += 1
+
+        cx, cy = current
+        current_g = g_score[current]
+
+        for dx, dy in directions_from(cx, cy, came_from.get(current)):
+            point = jump(cx, cy, dx, dy)
+            if point is None:
+                continue
+
+            steps = max(abs(point[0] - cx), abs(point[1] - cy))
+            new_g = current_g + steps * (diagonal if dx and dy else straight)
+
+            if new_g < g_score.get(point, float('inf')):
+                g_score[point] = new_g
+                came_from[point] = current
+                heapq.heappush(pq, (new_g + h(*point), point))
+
+    end_time = time.perf_counter()
+
+    if goal not in g_score:
+        raise NoPathFoundError(f"No path from {start} to {goal}")
+
+    return FinderResult(
+        path=_expand_jump_path(came_from, goal),
+        total_cost=g_score[goal],
+        algorithm=FinderAlgorithm.ASTAR,
+        nodes_expanded=nodes_expanded,
+        execution_time=end_time - start_time,
+    )
+
+
+def _uniform_step_costs(
+    game_map: MultiLayerMap,
+    config: CostConfig,
+) -> tuple[float, float] | None:
+    """
+    Return the (straight, diagonal) step cost if it is the same everywhere.
+
+    Returns None unless every passable cell has the same terrain cost terms,
+    elevation and priority term, and the costs satisfy
+    straight <= diagonal <= 2 * straight (required by the JPS pruning rules).
+    """
+    terms = {
+        (BASE_COST_LUT[code], DIAGONAL_FACTOR_LUT[code])
+        for code in set(game_map.terrain_codes)
+        if PASSABLE_LUT[code]
+    }
+    if len(terms) != 1:
+        return None
+
+    passable = [PASSABLE_LUT[code] for code in game_map.terrain_codes]
+    if len({h for h, ok in zip(game_map.elevation_flat, passable) if ok}) != 1:
+        return None
+
+    if config.priority_weight:
+        values = {p for p, ok in zip(game_map.priority_flat, passable) if ok}
+        if len(values) != 1:
+            return None
+        priority_term = config.priority_weight * values.pop()
+    else:
+        priority_term = 0.0
+
+    base, kappa = terms.pop()
+    straight = min(base + priority_term, config.max_cost_cap)
+    diagonal = min(base * kappa + priority_term, config.max_cost_cap)
+
+    if not 0.0 < straight <= diagonal <= 2 * straight:
+        return None
+    return straight, diagonal
+
+
+def _expand_jump_path(
+    came_from: dict[tuple[int, int], tuple[int, int]],
     goal: tuple[int, int],
+) -> list[tuple[int, int]]:
+    """Rebuild the cell-by-cell path from jump points joined by straight or diagonal runs."""
+    path = [goal]
+    current = goal
+
+    while current in came_from:
+        parent = came_from[current]
+        dx = (parent[0] > current[0]) - (parent[0] < current[0])
+        dy = (parent[1] > current[1]) - (parent[1] < current[1])
+        x, y = current
+        while (x, y) != parent:
+            x += dx
+            y += dy
+            path.append((x, y))
+        current = parent
+
+    path.reverse()
+    return path
+
+
+def _in_bounds(pos: tuple[int, int], game_map: MultiLayerMap) -> bool:
+    """Check that pos lies on the map."""
+    return 0 <= pos[0] < game_map.width and 0 <= pos[1] < game_map.height
+
+
+def _reconstruct_path(
+    came_from: Sequence[int],
+    goal_index: int,
+    width: int,
 ) -> list[tuple[int, int]]:
     """
-    Reconstruct path from came_from dictionary.
+    Reconstruct path from a flat predecessor table.
 
     Args:
-        came_from: Dictionary mapping node to its predecessor
-        goal: Goal position
+        came_from: Predecessor index of each cell (-1 for the start or unreached)
+        goal_index: Flat index of the goal
+        width: Map width used to decode indices
 
     Returns:
         List of positions from start to goal
     """
     path: list[tuple[int, int]] = []
-    current: tuple[int, int] | None = goal
+    current = goal_index
 
-    while current is not None:
-        path.append(current)
-        current = came_from.get(current)
+    while current != -1:
+        path.append((current % width, current // width))
+        current = came_from[current]
 
     path.reverse()
     return path
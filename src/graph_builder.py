@@ -1,7 +1,16 @@
 """Graph building module for map representation."""
-import networkx as nx
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
 from src.map_loader import GameMap
 
+if TYPE_CHECKING:
+    import networkx as nx
+
 
 DIRECTIONS = [(0, -1), (0, 1), (-1, 0), (1, 0)]
 
@@ -19,6 +28,63 @@ def is_passable(char: str) -> bool:
     return char != '#'
 
 
+@dataclass(frozen=True, slots=True)
+class NeighborTable:
+    """
+    4-adjacency of passable cells in compressed sparse row (CSR) form.
+
+    Cells are flat row-major indices (y * width + x). The neighbors of cell i
+    are indices[indptr[i]:indptr[i + 1]], listed up, left, down, right like
+    the adjacency of build_graph; walls have no neighbors.
+    """
+
+    width: int
+    height: int
+    indptr: array
+    indices: array
+
+    def neighbors(self, index: int) -> array:
+        """Return the flat indices of the passable neighbors of a cell."""
+        return self.indices[self.indptr[index]:self.indptr[index + 1]]
+
+
+def build_neighbor_table(game_map: GameMap) -> NeighborTable:
+    """
+    Build a NetworkX-free CSR neighbor table from a GameMap.
+
+    Two int arrays hold what build_graph stores as nested dicts, for
+    callers that walk the grid themselves.
+
+    Args:
+        game_map: Validated GameMap object
+
+    Returns:
+        NeighborTable of the map
+    """
+    width = game_map.width
+    height = game_map.height
+    passable = [is_passable(cell) for row in game_map.grid for cell in row]
+
+    indptr = array('i', [0])
+    indices = array('i')
+    append = indices.append
+
+    for index, open_cell in enumerate(passable):
+        if open_cell:
+            y, x = divmod(index, width)
+            if y > 0 and passable[index - width]:
+                append(index - width)
+            if x > 0 and passable[index - 1]:
+                append(index - 1)
+            if y + 1 < height and passable[index + width]:
+                append(index + width)
+            if x + 1 < width and passable[index + 1]:
+                append(index + 1)
+        indptr.append(len(indices))
+
+    return NeighborTable(width=width, height=height, indptr=indptr, indices=indices)
+
+
 def build_graph(game_map: GameMap) -> nx.Graph:
     """
     Build a NetworkX graph from a GameMap.
@@ -34,26 +100,51 @@ def build_graph(game_map: GameMap) -> nx.Graph:
     Returns:
         NetworkX Graph representing the map
     """
+    # Imported here so NeighborTable users never pay for importing networkx
+    import networkx as nx
+
     graph: nx.Graph = nx.Graph()
-    grid = game_map.grid
+    rows = ["".join(row) for row in game_map.grid]
     height = game_map.height
-    width = game_map.width
 
-    for y in range(height):
-        for x in range(width):
-            cell = grid[y][x]
-            if not is_passable(cell):
-                continue
+    graph.add_nodes_from(
+        (x, y)
+        for y, row in enumerate(rows)
+        for x, cell in enumerate(row)
+        if is_passable(cell)
+    )
+    graph.add_edges_from(_adjacent_pairs(rows, height), weight=1)
 
-            graph.add_node((x, y))
+    return graph
 
-            for dx, dy in DIRECTIONS:
-                nx_coord = x + dx
-                ny_coord = y + dy
 
-                if 0 <= nx_coord < width and 0 <= ny_coord < height:
-                    neighbor_cell = grid[ny_coord][nx_coord]
-                    if is_passable(neighbor_cell):
-                        graph.add_edge((x, y), (nx_coord, ny_coord), weight=1)
+def _adjacent_pairs(
+    rows: list[str],
+    height: int,
+) -> Iterator[tuple[tuple[int, int], tuple[int, int]]]:
+    """
+    Yield every 4-adjacent pair of passable cells exactly once.
 
-    return graph
+    Each cell only looks down and right, pairing a row with the row below
+    and with itself shifted by one column. Pairs come out in row-major order,
+    so every node's adjacency reads up, left, down, right, the same order a
+    per-cell scan of DIRECTIONS would produce.
+
+    Args:
+        rows: Map rows joined into strings
+        height: Number of rows
+
+    Yields:
+        (cell, neighbor) coordinate pairs
+    """
+    wall_row = '#' * len(rows[0]) if rows else ''
+
+    for y, row in enumerate(rows):
+        below = rows[y + 1] if y + 1 < height else wall_row
+        for x, (cell, right, down) in enumerate(zip(row, row[1:] + '#', below)):
+            if not is_passable(cell):
+                continue
+            if is_passable(down):
+                yield (x, y), (x, y + 1)
+            if is_passable(right):
+                yield (x, y), (x + 1, y)
@@ -5,8 +5,11 @@ from typing import TextIO
 
 VALID_CHARS = frozenset({'S', 'G', '#', '.'})
 
+# str.translate table that deletes every valid character
+_STRIP_VALID = str.maketrans('', '', ''.join(VALID_CHARS))
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class GameMap:
     """Represents a loaded and validated game map."""
 
@@ -49,6 +52,12 @@ def validate_map(grid: list[list[str]]) -> tuple[tuple[int, int], tuple[int, int
                 f"Map is non-rectangular: row {y} has {len(row)} chars, expected {width}"
             )
 
+        # Most rows hold only walls and floor; check those with one C-level
+        # strip and keep the per-cell scan for rows that need a position reported
+        line = "".join(row)
+        if len(line) == width and not line.strip('.#'):
+            continue
+
         for x, char in enumerate(row):
             if char not in VALID_CHARS:
                 raise MapValidationError(
@@ -78,6 +87,35 @@ def validate_map(grid: list[list[str]]) -> tuple[tuple[int, int], tuple[int, int
     return start_pos, goal_pos
 
 
+def _locate_points_if_valid(
+    lines: list[str],
+) -> tuple[tuple[int, int], tuple[int, int]] | None:
+    """
+    Validate map rows with whole-text string operations.
+
+    Accepts exactly the maps validate_map accepts, but checks them with a
+    few C-level passes over the joined text instead of a per-cell loop.
+
+    Args:
+        lines: Map rows as strings
+
+    Returns:
+        (start_position, goal_position) if the map is valid, None otherwise
+        (validate_map then reports the precise error)
+    """
+    width = len(lines[0])
+    if not width or any(len(line) != width for line in lines):
+        return None
+
+    text = ''.join(lines)
+    if text.translate(_STRIP_VALID) or text.count('S') != 1 or text.count('G') != 1:
+        return None
+
+    start_y, start_x = divmod(text.index('S'), width)
+    goal_y, goal_x = divmod(text.index('G'), width)
+    return (start_x, start_y), (goal_x, goal_y)
+
+
 def load_map(file: TextIO) -> GameMap:
     """
     Load and validate a map from a file-like object.
@@ -98,7 +136,8 @@ def load_map(file: TextIO) -> GameMap:
         raise MapValidationError("Map is empty")
 
     grid = [list(line) for line in lines]
-    start, goal = validate_map(grid)
+    points = _locate_points_if_valid(lines)
+    start, goal = points if points is not None else validate_map(grid)
 
     return GameMap(
         grid=grid,
@@ -1,13 +1,22 @@
 """Multi-layer map loader for Phase II format."""
-from dataclasses import dataclass
+from array import array
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TextIO
 
-from src.constants.terrain_costs import TERRAIN_COSTS
+from src.constants.terrain_costs import (
+    BASE_COST_LUT,
+    PASSABLE_CODES_BY_BASE_COST,
+    TERRAIN_COSTS,
+)
 
 
 VALID_TERRAIN_CODES = frozenset(TERRAIN_COSTS.keys())
 
+# Elevations are stored as int16 in MultiLayerMap.elevation_flat
+ELEVATION_MIN = -(1 << 15)
+ELEVATION_MAX = (1 << 15) - 1
+
 
 class LayerValidationError(Exception):
     """Exception raised when layer validation fails."""
@@ -15,9 +24,21 @@ class LayerValidationError(Exception):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MultiLayerMap:
-    """Multi-layer map representation for Phase II."""
+    """Multi-layer map representation for Phase II.
+
+    Besides the nested row layers, every layer is mirrored into a flat
+    row-major buffer (index ``y * width + x``) so the search hot path
+    reads one contiguous buffer per layer:
+
+    - terrain_codes: ASCII code point per cell (unknown characters become '?')
+    - elevation_flat: elevation per cell, stored as int16 ('h')
+    - priority_flat: tactical priority per cell
+
+    min_base_cost caches the lowest base cost among the passable terrain
+    present (1.0 if there is none), for heuristic scaling.
+    """
 
     terrain: list[list[str]]
     elevation: list[list[int]]
@@ -27,6 +48,78 @@ class MultiLayerMap:
     width: int
     height: int
 
+    terrain_codes: bytes = field(init=False, repr=False, compare=False)
+    elevation_flat: array = field(init=False, repr=False, compare=False)
+    priority_flat: array = field(init=False, repr=False, compare=False)
+    min_base_cost: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Build the flat row-major layer buffers and the minimum base cost."""
+        terrain_codes = "".join("".join(row) for row in self.terrain).encode("ascii", "replace")
+        object.__setattr__(self, "terrain_codes", terrain_codes)
+        object.__setattr__(
+            self,
+            "min_base_cost",
+            next(
+                (BASE_COST_LUT[code] for code in PASSABLE_CODES_BY_BASE_COST if code in terrain_codes),
+                1.0,
+            ),
+        )
+        try:
+            elevation_flat = array("h", [h for row in self.elevation for h in row])
+        except OverflowError:
+            raise LayerValidationError(
+                f"Elevation out of range: values must fit in int16 "
+                f"({ELEVATION_MIN}..{ELEVATION_MAX})"
+            ) from None
+        object.__setattr__(self, "elevation_flat", elevation_flat)
+        object.__setattr__(
+            self,
+            "priority_flat",
+            array("d", [p for row in self.priority for p in row]),
+        )
+
+    @property
+    def grid(self) -> list[list[str]]:
+        """Terrain layer under the Phase I GameMap name, for shared renderers."""
+        return self.terrain
+
+
+def _split_layer_lines(content: str) -> list[str]:
+    """
+    Split layer text into rows, ignoring surrounding whitespace.
+
+    Gives the same rows as stripping the text and splitting it on '\n',
+    except that a '\r' ending a row is dropped so CRLF files load too,
+    without first copying the whole text: only the first and last rows are
+    stripped, after dropping blank rows at either end. Unlike
+    str.splitlines, other line boundaries such as '\f' or '\x85' do not
+    start a new row.
+
+    Args:
+        content: Full layer text
+
+    Returns:
+        List of rows, empty if the text is blank
+    """
+    lines = content.split('\n')
+    if '\r' in content:
+        lines = [line.removesuffix('\r') for line in lines]
+
+    end = len(lines)
+    while end and not lines[end - 1].strip():
+        end -= 1
+    begin = 0
+    while begin < end and not lines[begin].strip():
+        begin += 1
+    if begin or end < len(lines):
+        lines = lines[begin:end]
+
+    if lines:
+        lines[0] = lines[0].lstrip()
+        lines[-1] = lines[-1].rstrip()
+    return lines
+
 
 def load_terrain_layer(file: TextIO) -> list[list[str]]:
     """
@@ -41,29 +134,50 @@ def load_terrain_layer(file: TextIO) -> list[list[str]]:
     Raises:
         LayerValidationError: If validation fails
     """
-    content = file.read()
-    lines = content.strip().split('\n')
+    return _parse_terrain_text(file.read())
+
+
+def _parse_terrain_text(content: str) -> list[list[str]]:
+    """
+    Parse and validate terrain text into rows of codes.
+
+    Shared by load_terrain_layer and the Phase I legacy parser.
+
+    Args:
+        content: Full terrain text
+
+    Returns:
+        2D list of terrain codes
+
+    Raises:
+        LayerValidationError: If the terrain is empty, non-rectangular or has unknown codes
+    """
+    lines = _split_layer_lines(content)
 
     if not lines or (len(lines) == 1 and not lines[0]):
         raise LayerValidationError("Terrain layer is empty")
 
     grid: list[list[str]] = []
     width = len(lines[0])
+    # Row lengths are collected in one C-level pass; the per-row length test
+    # below only runs when some row is off, to report the first bad row
+    ragged = len(set(map(len, lines))) > 1
 
     for row_idx, line in enumerate(lines):
-        if len(line) != width:
+        if ragged and len(line) != width:
             raise LayerValidationError(
                 f"Non-rectangular terrain: row {row_idx} has {len(line)} chars, expected {width}"
             )
 
-        row: list[str] = []
-        for col_idx, char in enumerate(line):
-            if char not in VALID_TERRAIN_CODES:
-                raise LayerValidationError(
-                    f"Unknown/invalid terrain code '{char}' at ({col_idx}, {row_idx})"
-                )
-            row.append(char)
-        grid.append(row)
+        # One C-level subset test per row; locate the culprit only on failure
+        if not VALID_TERRAIN_CODES.issuperset(line):
+            col_idx, char = next(
+                (i, c) for i, c in enumerate(line) if c not in VALID_TERRAIN_CODES
+            )
+            raise LayerValidationError(
+                f"Unknown/invalid terrain code '{char}' at ({col_idx}, {row_idx})"
+            )
+        grid.append(list(line))
 
     return grid
 
@@ -82,12 +196,25 @@ def load_elevation_layer(file: TextIO) -> list[list[int]]:
         LayerValidationError: If validation fails
     """
     content = file.read()
-    lines = content.strip().split('\n')
+    lines = _split_layer_lines(content)
 
     if not lines or (len(lines) == 1 and not lines[0]):
         raise LayerValidationError("Elevation layer is empty")
 
-    grid: list[list[int]] = []
+    grid: list[list[int]] | None
+    try:
+        # map(int, ...) parses each row in C; rows are checked afterwards
+        grid = [list(map(int, line.split())) for line in lines]
+    except ValueError:
+        # Rescan row by row only to report the first error in row order
+        grid = None
+
+    if grid is not None:
+        width = len(grid[0])
+        if all(len(values) == width for values in grid):
+            return grid
+
+    grid = []
     width = None
 
     for row_idx, line in enumerate(lines):
@@ -134,7 +261,7 @@ def load_points_layer(
 
     if points_file is not None:
         content = points_file.read()
-        for line in content.strip().split('\n'):
+        for line in _split_layer_lines(content):
             parts = line.split()
             if len(parts) >= 3:
                 marker = parts[0].upper()
@@ -144,12 +271,8 @@ def load_points_layer(
                 elif marker == 'G':
                     goal = (x, y)
     elif terrain_grid is not None:
-        for y, row in enumerate(terrain_grid):
-            for x, cell in enumerate(row):
-                if cell == 'S':
-                    start = (x, y)
-                elif cell == 'G':
-                    goal = (x, y)
+        start = _find_last_marker(terrain_grid, 'S')
+        goal = _find_last_marker(terrain_grid, 'G')
 
     if start is None:
         raise LayerValidationError("Start 'S' not found")
@@ -159,6 +282,31 @@ def load_points_layer(
     return start, goal
 
 
+def _find_last_marker(
+    terrain_grid: list[list[str]],
+    marker: str,
+) -> tuple[int, int] | None:
+    """
+    Find the last occurrence of a marker in row-major order.
+
+    Rows are tested bottom-up with a C-level list membership test and only
+    the matching row is searched, instead of comparing every cell in Python.
+    The last occurrence wins, as with a full forward scan.
+
+    Args:
+        terrain_grid: Terrain grid to scan
+        marker: Single-character marker such as 'S' or 'G'
+
+    Returns:
+        (x, y) of the marker, or None if absent
+    """
+    for y in range(len(terrain_grid) - 1, -1, -1):
+        row = terrain_grid[y]
+        if marker in row:
+            return len(row) - 1 - row[::-1].index(marker), y
+    return None
+
+
 def load_priority_layer(
     file: TextIO | None,
     width: int = 0,
@@ -176,17 +324,12 @@ def load_priority_layer(
         2D list of priority values
     """
     if file is None:
-        return [[0.0 for _ in range(width)] for _ in range(height)]
+        return [[0.0] * width for _ in range(height)]
 
-    content = file.read()
-    lines = content.strip().split('\n')
+    lines = _split_layer_lines(file.read())
 
-    grid: list[list[float]] = []
-    for line in lines:
-        values = [float(v) for v in line.split()]
-        grid.append(values)
-
-    return grid
+    # map(float, ...) parses each row in C, as for elevation
+    return [list(map(float, line.split())) for line in lines]
 
 
 def load_multi_layer_map(
@@ -195,6 +338,7 @@ def load_multi_layer_map(
     points_path: Path | None = None,
     priority_path: Path | None = None,
     legacy_text: TextIO | None = None,
+    legacy_bytes: bytes | memoryview | None = None,
 ) -> MultiLayerMap:
     """
     Load multi-layer map from files or legacy format.
@@ -205,6 +349,7 @@ def load_multi_layer_map(
         points_path: Optional path to points file (S/G coordinates)
         priority_path: Optional path to priority layer file
         legacy_text: Optional file-like for Phase I legacy format
+        legacy_bytes: Optional raw bytes of a Phase I legacy map
 
     Returns:
         MultiLayerMap with all layers
@@ -215,6 +360,9 @@ def load_multi_layer_map(
     if legacy_text is not None:
         return _load_legacy_format(legacy_text)
 
+    if legacy_bytes is not None:
+        return _load_legacy_bytes(legacy_bytes)
+
     if terrain_path is None:
         raise LayerValidationError("Terrain path is required for Phase II format")
 
@@ -233,7 +381,7 @@ def load_multi_layer_map(
                 f"Size mismatch: terrain is {width}x{height}, elevation is {len(elevation[0]) if elevation else 0}x{len(elevation)}"
             )
     else:
-        elevation = [[0 for _ in range(width)] for _ in range(height)]
+        elevation = [[0] * width for _ in range(height)]
 
     if points_path is not None:
         with open(points_path, 'r', encoding='utf-8') as f:
@@ -268,33 +416,53 @@ def _load_legacy_format(file: TextIO) -> MultiLayerMap:
     Returns:
         MultiLayerMap with default elevation and priority
     """
-    content = file.read()
-    lines = content.strip().split('\n')
+    return _parse_legacy_map(file.read())
 
-    if not lines or (len(lines) == 1 and not lines[0]):
-        raise LayerValidationError("Map is empty")
 
-    terrain: list[list[str]] = []
-    width = len(lines[0])
+def _load_legacy_bytes(data: bytes | memoryview) -> MultiLayerMap:
+    """
+    Load Phase I legacy format from raw bytes.
 
-    for row_idx, line in enumerate(lines):
-        if len(line) != width:
-            raise LayerValidationError(
-                f"Non-rectangular map: row {row_idx} has {len(line)} chars, expected {width}"
-            )
+    Terrain codes are ASCII, so the buffer is checked with bytes.isascii()
+    and decoded as ASCII in one step instead of going through a text stream.
+
+    Args:
+        data: Raw bytes of the legacy map
+
+    Returns:
+        MultiLayerMap with default elevation and priority
+
+    Raises:
+        LayerValidationError: If the data is not ASCII or the map is invalid
+    """
+    raw = bytes(data)
+
+    if not raw.isascii():
+        raise LayerValidationError("Map contains non-ASCII characters")
+
+    return _parse_legacy_map(raw.decode('ascii'))
 
-        row: list[str] = []
-        for char in line:
-            if char not in VALID_TERRAIN_CODES:
-                raise LayerValidationError(f"Unknown terrain code '{char}'")
-            row.append(char)
-        terrain.append(row)
 
+def _parse_legacy_map(content: str) -> MultiLayerMap:
+    """
+    Parse the text of a Phase I legacy map.
+
+    Args:
+        content: Full map text
+
+    Returns:
+        MultiLayerMap with default elevation and priority
+
+    Raises:
+        LayerValidationError: If the map is empty, non-rectangular or has unknown codes
+    """
+    terrain = _parse_terrain_text(content)
     height = len(terrain)
+    width = len(terrain[0])
     start, goal = load_points_layer(terrain_grid=terrain)
 
-    elevation = [[0 for _ in range(width)] for _ in range(height)]
-    priority = [[0.0 for _ in range(width)] for _ in range(height)]
+    elevation = [[0] * width for _ in range(height)]
+    priority = [[0.0] * width for _ in range(height)]
 
     return MultiLayerMap(
         terrain=terrain,
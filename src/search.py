@@ -1,10 +1,17 @@
 """Search algorithms module."""
+from __future__ import annotations
+
+import heapq
 import time
 from dataclasses import dataclass
 from enum import Enum
-from typing import Sequence
+from itertools import count
+from typing import TYPE_CHECKING, Sequence
+
+from src.graph_builder import NeighborTable
 
-import networkx as nx
+if TYPE_CHECKING:
+    import networkx as nx
 
 
 class Algorithm(Enum):
@@ -30,6 +37,10 @@ class SearchResult:
     execution_time: float
 
 
+# Marks cells a grid search has not reached; distinct from None (no parent)
+_UNSEEN = -1
+
+
 def manhattan_distance(a: tuple[int, int], b: tuple[int, int]) -> int:
     """
     Calculate Manhattan distance between two points.
@@ -41,7 +52,27 @@ def manhattan_distance(a: tuple[int, int], b: tuple[int, int]) -> int:
     Returns:
         Manhattan distance
     """
-    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+    dx = a[0] - b[0]
+    dy = a[1] - b[1]
+    return (dx if dx >= 0 else -dx) + (dy if dy >= 0 else -dy)
+
+
+def _require_on_grid(
+    table: NeighborTable,
+    start: tuple[int, int],
+    goal: tuple[int, int],
+) -> None:
+    """
+    Reject positions off the grid before they are turned into flat indices.
+
+    An out-of-range x would otherwise wrap into a neighboring row. Raises
+    nx.NodeNotFound, as the NetworkX searches do for nodes not in the graph.
+    """
+    for pos in (start, goal):
+        if not (0 <= pos[0] < table.width and 0 <= pos[1] < table.height):
+            import networkx as nx
+
+            raise nx.NodeNotFound(f"Node {pos} is not in the grid")
 
 
 def search_astar(
@@ -63,15 +94,25 @@ def search_astar(
     Raises:
         NoPathError: If no path exists
     """
+    import networkx as nx
+
+    gx, gy = goal
+
+    # Same value as manhattan_distance(n, goal), with the goal bound as
+    # defaults so the per-node call skips the tuple subscripts
+    def heuristic(n: tuple[int, int], _target: tuple[int, int], gx: int = gx, gy: int = gy) -> int:
+        x, y = n
+        return (x - gx if x >= gx else gx - x) + (y - gy if y >= gy else gy - y)
+
     try:
         path = nx.astar_path(
             graph,
             start,
             goal,
-            heuristic=lambda n, g: manhattan_distance(n, goal),
+            heuristic=heuristic,
             weight='weight',
         )
-        return list(path)
+        return path
     except nx.NetworkXNoPath:
         raise NoPathError(f"No path found from {start} to {goal}")
 
@@ -95,15 +136,167 @@ def search_bfs(
     Raises:
         NoPathError: If no path exists
     """
+    import networkx as nx
+
     try:
         path = nx.shortest_path(graph, start, goal)
-        return list(path)
+        return path
     except nx.NetworkXNoPath:
         raise NoPathError(f"No path found from {start} to {goal}")
 
 
+def search_astar_grid(
+    table: NeighborTable,
+    start: tuple[int, int],
+    goal: tuple[int, int],
+) -> list[tuple[int, int]]:
+    """
+    Find shortest path with A* over a CSR neighbor table.
+
+    Follows nx.astar_path step for step (same queue order, tie-breaking and
+    stale-entry rules), so it returns the same path as search_astar on the
+    equivalent graph, but keeps its state in flat lists indexed by cell.
+
+    Args:
+        table: Neighbor table of the map
+        start: Start position
+        goal: Goal position
+
+    Returns:
+        List of positions forming the path
+
+    Raises:
+        NoPathError: If no path exists
+        networkx.NodeNotFound: If start or goal lies outside the grid
+    """
+    _require_on_grid(table, start, goal)
+    width = table.width
+    indptr = table.indptr
+    indices = table.indices
+    gx, gy = goal
+    source = start[1] * width + start[0]
+    target = gy * width + gx
+
+    size = width * table.height
+    # enqueued_cost[v] is None until v is first pushed; explored[v] is
+    # _UNSEEN until v is expanded, then its parent (None for the source)
+    enqueued_cost: list[int | None] = [None] * size
+    enqueued_h = [0] * size
+    explored: list[int | None] = [_UNSEEN] * size
+    counter = count()
+    queue = [(0, next(counter), source, 0, None)]
+    heappop = heapq.heappop
+    heappush = heapq.heappush
+
+    while queue:
+        _, _, current, dist, parent = heappop(queue)
+        if current == target:
+            path = [current]
+            node = parent
+            while node is not None:
+                path.append(node)
+                node = explored[node]
+            path.reverse()
+            return [(index % width, index // width) for index in path]
+
+        seen = explored[current]
+        if seen != _UNSEEN:
+            if seen is None or enqueued_cost[current] < dist:
+                continue
+        explored[current] = parent
+
+        ncost = dist + 1
+        for neighbor in indices[indptr[current]:indptr[current + 1]]:
+            qcost = enqueued_cost[neighbor]
+            if qcost is not None:
+                if qcost <= ncost:
+                    continue
+                h = enqueued_h[neighbor]
+            else:
+                y, x = divmod(neighbor, width)
+                h = (x - gx if x >= gx else gx - x) + (y - gy if y >= gy else gy - y)
+                enqueued_h[neighbor] = h
+            enqueued_cost[neighbor] = ncost
+            heappush(queue, (ncost + h, next(counter), neighbor, ncost, current))
+
+    raise NoPathError(f"No path found from {start} to {goal}")
+
+
+def search_bfs_grid(
+    table: NeighborTable,
+    start: tuple[int, int],
+    goal: tuple[int, int],
+) -> list[tuple[int, int]]:
+    """
+    Find shortest path with BFS over a CSR neighbor table.
+
+    Runs the same bidirectional breadth-first search as nx.shortest_path,
+    so it returns the same path as search_bfs on the equivalent graph.
+
+    Args:
+        table: Neighbor table of the map
+        start: Start position
+        goal: Goal position
+
+    Returns:
+        List of positions forming the path
+
+    Raises:
+        NoPathError: If no path exists
+        networkx.NodeNotFound: If start or goal lies outside the grid
+    """
+    _require_on_grid(table, start, goal)
+    width = table.width
+    indptr = table.indptr
+    indices = table.indices
+    source = start[1] * width + start[0]
+    target = goal[1] * width + goal[0]
+
+    size = width * table.height
+    pred: list[int | None] = [_UNSEEN] * size
+    succ: list[int | None] = [_UNSEEN] * size
+    pred[source] = None
+    succ[target] = None
+    meet = source if source == target else None
+
+    forward_fringe = [source]
+    reverse_fringe = [target]
+    while meet is None and forward_fringe and reverse_fringe:
+        if len(forward_fringe) <= len(reverse_fringe):
+            this_level, forward_fringe = forward_fringe, []
+            this_tree, other_tree, fringe = pred, succ, forward_fringe
+        else:
+            this_level, reverse_fringe = reverse_fringe, []
+            this_tree, other_tree, fringe = succ, pred, reverse_fringe
+        for v in this_level:
+            for w in indices[indptr[v]:indptr[v + 1]]:
+                if this_tree[w] == _UNSEEN:
+                    fringe.append(w)
+                    this_tree[w] = v
+                if other_tree[w] != _UNSEEN:
+                    meet = w
+                    break
+            if meet is not None:
+                break
+
+    if meet is None:
+        raise NoPathError(f"No path found from {start} to {goal}")
+
+    path = []
+    node = meet
+    while node is not None:
+        path.append(node)
+        node = pred[node]
+    path.reverse()
+    node = succ[meet]
+    while node is not None:
+        path.append(node)
+        node = succ[node]
+    return [(index % width, index // width) for index in path]
+
+
 def search_path(
-    graph: nx.Graph,
+    graph: nx.Graph | NeighborTable,
     start: tuple[int, int],
     goal: tuple[int, int],
     algorithm: Algorithm,
@@ -112,7 +305,8 @@ def search_path(
     Find shortest path using specified algorithm.
 
     Args:
-        graph: NetworkX graph
+        graph: NetworkX graph, or a NeighborTable to search the flat grid
+            directly without NetworkX
         start: Start position
         goal: Goal position
         algorithm: Search algorithm to use
@@ -125,7 +319,12 @@ def search_path(
     """
     start_time = time.perf_counter()
 
-    if algorithm == Algorithm.ASTAR:
+    if isinstance(graph, NeighborTable):
+        if algorithm == Algorithm.ASTAR:
+            path = search_astar_grid(graph, start, goal)
+        else:
+            path = search_bfs_grid(graph, start, goal)
+    elif algorithm == Algorithm.ASTAR:
         path = search_astar(graph, start, goal)
     else:
         path = search_bfs(graph, start, goal)
@@ -1,13 +1,24 @@
 """Visualization module for path rendering."""
-from typing import Sequence
-
-from src.map_loader import GameMap
+from typing import Protocol, Sequence
 
 
 PATH_MARKER = '@'
 
+_ROAD = ord('.')
+_PATH_MARKER_CODE = ord(PATH_MARKER)
+
+
+class SupportsGrid(Protocol):
+    """Any map exposing its cells as rows of single-character codes.
+
+    Satisfied by both GameMap and MultiLayerMap.
+    """
+
+    @property
+    def grid(self) -> list[list[str]]: ...
 
-def render_path(game_map: GameMap, path: Sequence[tuple[int, int]]) -> str:
+
+def render_path(game_map: SupportsGrid, path: Sequence[tuple[int, int]]) -> str:
     """
     Render the map with path marked.
 
@@ -15,23 +26,44 @@ def render_path(game_map: GameMap, path: Sequence[tuple[int, int]]) -> str:
     Start ('S'), Goal ('G'), and Wall ('#') are preserved.
 
     Args:
-        game_map: The game map
+        game_map: The game map (GameMap or MultiLayerMap)
         path: Sequence of (x, y) positions forming the path
 
     Returns:
         String representation of the map with path marked
+
+    Raises:
+        IndexError: If a path point lies outside the map
     """
-    path_set = set(path)
+    text = '\n'.join([''.join(row) for row in game_map.grid])
+    if not path:
+        return text
+
+    width = len(game_map.grid[0])
+    height = len(game_map.grid)
+    # Checked up front so neither route wraps an off-map point onto another cell
+    for x, y in path:
+        if not (0 <= x < width and 0 <= y < height):
+            raise IndexError(f"Path point ({x}, {y}) is outside the map")
+
+    if not text.isascii():
+        # Terrain codes are ASCII; anything else takes the per-cell route
+        result_grid = [row.copy() for row in game_map.grid]
+        for x, y in path:
+            if result_grid[y][x] == '.':
+                result_grid[y][x] = PATH_MARKER
+        return '\n'.join([''.join(row) for row in result_grid])
 
-    result_grid = [row.copy() for row in game_map.grid]
+    # One byte per cell plus one per newline: cell (x, y) sits at y * stride + x
+    stride = width + 1
+    buffer = bytearray(text, 'ascii')
 
     for x, y in path:
-        cell = result_grid[y][x]
-        if cell == '.':
-            result_grid[y][x] = PATH_MARKER
+        index = y * stride + x
+        if buffer[index] == _ROAD:
+            buffer[index] = _PATH_MARKER_CODE
 
-    lines = [''.join(row) for row in result_grid]
-    return '\n'.join(lines)
+    return buffer.decode('ascii')
 
 
 def format_metrics(
@@ -130,3 +130,18 @@ class TestMain:
             exit_code = main()
 
         assert exit_code == 0
+
+
+class TestStartupImports:
+    """Tests for what importing the CLI pulls in."""
+
+    def test_networkx_not_imported(self) -> None:
+        """Importing the CLI should not import networkx."""
+        import subprocess
+
+        code = "import sys, src.cli; print('networkx' in sys.modules)"
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+        ).stdout
+
+        assert output.strip() == "False"
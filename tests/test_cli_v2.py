@@ -15,6 +15,11 @@ class TestParseArgs:
         with pytest.raises(SystemExit):
             parse_args([])
 
+    def test_compare_and_queries_exclusive(self) -> None:
+        """--compare and --queries should not be accepted together."""
+        with pytest.raises(SystemExit):
+            parse_args(["test_map.txt", "--compare", "--queries", "queries.txt"])
+
     def test_map_file_parsed(self) -> None:
         """Map file should be parsed correctly."""
         args = parse_args(["test_map.txt"])
@@ -55,6 +60,14 @@ class TestParseArgs:
         args = parse_args(["test_map.txt", "--compare"])
         assert args.compare is True
 
+    def test_repeated_calls_do_not_share_state(self) -> None:
+        """Flags from one call should not leak into the next."""
+        parse_args(["first.txt", "--compare", "--priority-weight", "2.5"])
+        args = parse_args(["second.txt"])
+        assert args.map_file == "second.txt"
+        assert args.compare is False
+        assert args.priority_weight == 0.0
+
     def test_metrics_flag(self) -> None:
         """Metrics flag should be parsed."""
         args = parse_args(["test_map.txt", "--metrics"])
@@ -194,6 +207,45 @@ class TestRun:
 
         assert exit_code == 0
 
+    def test_run_with_queries(self, tmp_path: Path, capsys) -> None:
+        """Batch mode should print one summary line per query."""
+        map_file = tmp_path / "test.txt"
+        map_file.write_text("S..\n.#.\n..G")
+        queries_file = tmp_path / "queries.txt"
+        queries_file.write_text("0 0 2 2\n\n2 0 0 2\n")
+
+        args = parse_args([str(map_file), "--queries", str(queries_file)])
+        exit_code = run(args)
+        lines = capsys.readouterr().out.splitlines()
+
+        assert exit_code == 0
+        assert lines[0].startswith("(0, 0) -> (2, 2): cost=")
+        assert lines[1].startswith("(2, 0) -> (0, 2): cost=")
+
+    def test_run_with_unreachable_query(self, tmp_path: Path, capsys) -> None:
+        """Batch mode should report unreachable queries and fail."""
+        map_file = tmp_path / "test.txt"
+        map_file.write_text("S#G")
+        queries_file = tmp_path / "queries.txt"
+        queries_file.write_text("0 0 2 0\n")
+
+        args = parse_args([str(map_file), "--queries", str(queries_file)])
+        exit_code = run(args)
+
+        assert exit_code == 1
+        assert "no path" in capsys.readouterr().out
+
+    def test_run_with_malformed_queries(self, tmp_path: Path) -> None:
+        """Batch mode should reject lines that are not four integers."""
+        map_file = tmp_path / "test.txt"
+        map_file.write_text("S.G")
+        queries_file = tmp_path / "queries.txt"
+        queries_file.write_text("0 0 two 0\n")
+
+        args = parse_args([str(map_file), "--queries", str(queries_file)])
+
+        assert run(args) == 1
+
     def test_run_outputs_visualization(self, tmp_path: Path, capsys) -> None:
         """Run should output path visualization."""
         map_file = tmp_path / "test.txt"
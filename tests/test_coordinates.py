@@ -1,15 +1,34 @@
 """Tests for coordinate transformation layer."""
 import pytest
 import math
+import pickle
 from src.coordinates import (
     to_iso,
+    to_iso_scalars,
+    to_iso_specialize,
+    to_grid_specialize,
     to_grid,
+    to_iso_batch,
+    to_grid_batch,
+    to_iso_int,
+    to_iso_int_batch,
+    to_iso_center,
+    to_iso_center_batch,
+    is_in_diamond,
+    is_in_diamond_batch,
     IsoConfig,
     IsoCoord,
+    IsoCoordInt,
     GridCoord,
+    octile_distance_grid,
 )
 
 
+# Shared projection for tests that do not exercise IsoConfig itself;
+# IsoConfig is frozen, so one instance can serve the whole module
+_CFG = IsoConfig(tile_width=64, tile_height=32, elevation_scale=16)
+
+
 class TestIsoConfig:
     """Tests for isometric configuration."""
 
@@ -27,21 +46,37 @@ class TestIsoConfig:
         assert config.tile_height == 32
         assert config.elevation_scale == 16
 
+    def test_half_tile_sizes_precomputed(self) -> None:
+        """Half tile sizes should be derived from the tile dimensions."""
+        config = IsoConfig(tile_width=64, tile_height=32, elevation_scale=16)
+        assert config.half_tw == 32
+        assert config.half_th == 16
+        assert config.quarter_th == 8
+
+    def test_reciprocal_half_tile_sizes_precomputed(self) -> None:
+        """Reciprocal half tile sizes should be derived from the tile dimensions."""
+        config = IsoConfig(tile_width=64, tile_height=32, elevation_scale=16)
+        assert config.inv_half_tw == pytest.approx(1 / 32)
+        assert config.inv_half_th == pytest.approx(1 / 16)
+
+    def test_derived_fields_excluded_from_equality(self) -> None:
+        """Configs with the same parameters should compare equal."""
+        assert IsoConfig() == IsoConfig()
+        assert repr(IsoConfig()) == "IsoConfig(tile_width=64.0, tile_height=32.0, elevation_scale=16.0)"
+
 
 class TestToIso:
     """Tests for to_iso conversion (logical grid -> isometric)."""
 
     def test_origin_conversion(self) -> None:
         """Origin (0,0,0) should map to (0,0)."""
-        config = IsoConfig(tile_width=64, tile_height=32, elevation_scale=16)
-        result = to_iso(GridCoord(0, 0, 0), config)
+        result = to_iso(GridCoord(0, 0, 0), _CFG)
         assert result.x == 0
         assert result.y == 0
 
     def test_x_axis_movement(self) -> None:
         """Moving along x-axis should increase X and Y in iso."""
-        config = IsoConfig(tile_width=64, tile_height=32, elevation_scale=16)
-        result = to_iso(GridCoord(1, 0, 0), config)
+        result = to_iso(GridCoord(1, 0, 0), _CFG)
         # X = (64/2)(1-0) = 32
         # Y = (32/2)(1+0) = 16
         assert result.x == 32
@@ -49,8 +84,7 @@ class TestToIso:
 
     def test_y_axis_movement(self) -> None:
         """Moving along y-axis should decrease X and increase Y in iso."""
-        config = IsoConfig(tile_width=64, tile_height=32, elevation_scale=16)
-        result = to_iso(GridCoord(0, 1, 0), config)
+        result = to_iso(GridCoord(0, 1, 0), _CFG)
         # X = (64/2)(0-1) = -32
         # Y = (32/2)(0+1) = 16
         assert result.x == -32
@@ -58,21 +92,19 @@ class TestToIso:
 
     def test_elevation_effect(self) -> None:
         """Elevation should decrease Y coordinate."""
-        config = IsoConfig(tile_width=64, tile_height=32, elevation_scale=16)
-        result_h0 = to_iso(GridCoord(1, 1, 0), config)
-        result_h1 = to_iso(GridCoord(1, 1, 1), config)
+        result_h0 = to_iso(GridCoord(1, 1, 0), _CFG)
+        result_h1 = to_iso(GridCoord(1, 1, 1), _CFG)
         # With elevation, Y should be lower (visually higher)
         assert result_h1.y < result_h0.y
         assert result_h1.y == result_h0.y - 16
 
     def test_formula_correctness(self) -> None:
         """Verify exact formula: X = (tw/2)(x-y), Y = (th/2)(x+y) - β*h."""
-        config = IsoConfig(tile_width=64, tile_height=32, elevation_scale=16)
         x, y, h = 3, 2, 1
-        result = to_iso(GridCoord(x, y, h), config)
+        result = to_iso(GridCoord(x, y, h), _CFG)
 
-        expected_x = (config.tile_width / 2) * (x - y)
-        expected_y = (config.tile_height / 2) * (x + y) - config.elevation_scale * h
+        expected_x = (_CFG.tile_width / 2) * (x - y)
+        expected_y = (_CFG.tile_height / 2) * (x + y) - _CFG.elevation_scale * h
 
         assert result.x == expected_x
         assert result.y == expected_y
@@ -83,74 +115,199 @@ class TestToGrid:
 
     def test_origin_conversion(self) -> None:
         """Iso origin should map back to grid origin."""
-        config = IsoConfig(tile_width=64, tile_height=32, elevation_scale=16)
-        result = to_grid(IsoCoord(0, 0), 0, config)
+        result = to_grid(IsoCoord(0, 0), 0, _CFG)
         assert result.x == 0
         assert result.y == 0
 
     def test_basic_conversion(self) -> None:
         """Basic iso coordinates should convert back correctly."""
-        config = IsoConfig(tile_width=64, tile_height=32, elevation_scale=16)
         # Iso coords for grid (1, 0, 0)
-        result = to_grid(IsoCoord(32, 16), 0, config)
+        result = to_grid(IsoCoord(32, 16), 0, _CFG)
         assert result.x == 1
         assert result.y == 0
 
     def test_with_elevation(self) -> None:
         """Conversion with known elevation should be accurate."""
-        config = IsoConfig(tile_width=64, tile_height=32, elevation_scale=16)
         # Grid (1, 1, 2) -> Iso
-        iso = to_iso(GridCoord(1, 1, 2), config)
+        iso = to_iso(GridCoord(1, 1, 2), _CFG)
         # Convert back with known elevation
-        grid = to_grid(iso, 2, config)
+        grid = to_grid(iso, 2, _CFG)
         assert grid.x == 1
         assert grid.y == 1
 
+    @pytest.mark.parametrize("iso_y,expected", [
+        (16.0, 1),    # grid (0.5, 0.5)
+        (48.0, 2),    # grid (1.5, 1.5)
+        (-16.0, -1),  # grid (-0.5, -0.5)
+    ])
+    def test_halves_round_away_from_zero(self, iso_y: float, expected: int) -> None:
+        """Exact half-tile positions should round away from zero."""
+        result = to_grid(IsoCoord(0, iso_y), 0, _CFG)
+        assert result.x == expected
+        assert result.y == expected
+
 
 class TestRoundTrip:
     """Tests for round-trip conversion accuracy."""
 
     def test_roundtrip_iso_grid_iso(self) -> None:
-        """iso -> grid -> iso should have bounded error."""
-        config = IsoConfig(tile_width=64, tile_height=32, elevation_scale=16)
+        """iso -> grid -> iso should reproduce the iso coordinate exactly."""
         original_grid = GridCoord(5, 3, 2)
 
-        iso = to_iso(original_grid, config)
-        recovered_grid = to_grid(iso, original_grid.h, config)
-        recovered_iso = to_iso(GridCoord(recovered_grid.x, recovered_grid.y, original_grid.h), config)
+        iso = to_iso(original_grid, _CFG)
+        recovered_grid = to_grid(iso, original_grid.h, _CFG)
+        recovered_iso = to_iso(GridCoord(recovered_grid.x, recovered_grid.y, original_grid.h), _CFG)
 
-        # Error should be within 0.5 pixels
-        assert abs(recovered_iso.x - iso.x) <= 0.5
-        assert abs(recovered_iso.y - iso.y) <= 0.5
+        # Even tile sizes keep every product an exact integer-valued float
+        assert recovered_iso == iso
 
     def test_roundtrip_grid_iso_grid(self) -> None:
         """grid -> iso -> grid should recover original coordinates."""
-        config = IsoConfig(tile_width=64, tile_height=32, elevation_scale=16)
         original_grid = GridCoord(7, 4, 1)
 
-        iso = to_iso(original_grid, config)
-        recovered_grid = to_grid(iso, original_grid.h, config)
+        iso = to_iso(original_grid, _CFG)
+        recovered_grid = to_grid(iso, original_grid.h, _CFG)
 
         assert recovered_grid.x == original_grid.x
         assert recovered_grid.y == original_grid.y
 
-    @pytest.mark.parametrize("x,y,h", [
-        (0, 0, 0),
-        (10, 10, 0),
-        (5, 8, 3),
-        (100, 50, 10),
-        (0, 0, 5),
+    def test_roundtrip_various_coords(self) -> None:
+        """Multiple coordinates should round-trip correctly in one batch."""
+        xs = [0, 10, 5, 100, 0]
+        ys = [0, 10, 8, 50, 0]
+        hs = [0, 0, 3, 10, 5]
+
+        iso_xs, iso_ys = to_iso_batch(xs, ys, hs, _CFG)
+        recovered_xs, recovered_ys = to_grid_batch(iso_xs, iso_ys, hs, _CFG)
+
+        assert recovered_xs == xs
+        assert recovered_ys == ys
+
+
+class TestIsoScalars:
+    """Tests for the allocation-free scalar projection."""
+
+    @pytest.mark.parametrize("x,y,h", [(0, 0, 0), (3, 1, 0), (2, 7, 4), (10, 10, 1)])
+    def test_matches_to_iso(self, x: int, y: int, h: int) -> None:
+        """to_iso_scalars should return the same values as to_iso."""
+        config = IsoConfig(tile_width=50, tile_height=26, elevation_scale=9)
+        expected = to_iso(GridCoord(x, y, h), config)
+
+        assert to_iso_scalars(GridCoord(x, y, h), config) == (expected.x, expected.y)
+
+
+class TestSpecializedTransforms:
+    """Tests for the configuration-bound transforms."""
+
+    @pytest.mark.parametrize("x,y,h", [(0, 0, 0), (3, 1, 0), (2, 7, 4), (-5, 8, 3), (100, 50, 10)])
+    def test_matches_generic_transforms(self, x: int, y: int, h: int) -> None:
+        """Specialized transforms should agree with to_iso and to_grid."""
+        config = IsoConfig(tile_width=50, tile_height=26, elevation_scale=9)
+        iso_f = to_iso_specialize(config)
+        grid_f = to_grid_specialize(config)
+
+        iso = iso_f(x, y, h)
+        assert iso == to_iso(GridCoord(x, y, h), config)
+        assert grid_f(iso, h) == to_grid(iso, h, config)
+
+    def test_default_config(self) -> None:
+        """Without a config the default projection should be used."""
+        assert to_iso_specialize()(3, 1) == to_iso(GridCoord(3, 1))
+
+
+class TestBatchConversion:
+    """Tests for batch coordinate conversion."""
+
+    def test_to_iso_batch_matches_scalar(self) -> None:
+        """Batch conversion should match scalar to_iso element-wise."""
+        xs, ys, hs = [0, 1, 3, 7], [0, 0, 2, 4], [0, 0, 1, 2]
+
+        iso_xs, iso_ys = to_iso_batch(xs, ys, hs, _CFG)
+
+        for x, y, h, iso_x, iso_y in zip(xs, ys, hs, iso_xs, iso_ys):
+            expected = to_iso(GridCoord(x, y, h), _CFG)
+            assert iso_x == expected.x
+            assert iso_y == expected.y
+
+    def test_batch_roundtrip(self) -> None:
+        """to_iso_batch -> to_grid_batch should recover original coordinates."""
+        xs, ys, hs = [0, 10, 5, 100, 0], [0, 10, 8, 50, 0], [0, 0, 3, 10, 5]
+
+        iso_xs, iso_ys = to_iso_batch(xs, ys, hs, _CFG)
+        grid_xs, grid_ys = to_grid_batch(iso_xs, iso_ys, hs, _CFG)
+
+        assert grid_xs == xs
+        assert grid_ys == ys
+
+    def test_to_iso_int_batch_matches_scalar(self) -> None:
+        """Integer batch conversion should round exactly like to_iso_int."""
+        config = IsoConfig(tile_width=50, tile_height=25, elevation_scale=7)
+        xs, ys, hs = [0, 1, 3, 7, 2], [0, 0, 2, 4, 5], [0, 1, 1, 2, 3]
+
+        int_xs, int_ys = to_iso_int_batch(xs, ys, hs, config)
+
+        for x, y, h, int_x, int_y in zip(xs, ys, hs, int_xs, int_ys):
+            expected = to_iso_int(GridCoord(x, y, h), config)
+            assert (int_x, int_y) == (expected.x, expected.y)
+            assert isinstance(int_x, int) and isinstance(int_y, int)
+
+    def test_to_iso_center_batch_matches_scalar(self) -> None:
+        """Tile-center batch conversion should match to_iso_center element-wise."""
+        config = IsoConfig(tile_width=64, tile_height=30, elevation_scale=16)
+        xs, ys, hs = [0, 1, 3, 7], [0, 0, 2, 4], [0, 0, 1, 2]
+
+        iso_xs, iso_ys = to_iso_center_batch(xs, ys, hs, config)
+
+        for x, y, h, iso_x, iso_y in zip(xs, ys, hs, iso_xs, iso_ys):
+            expected = to_iso_center(GridCoord(x, y, h), config)
+            assert (iso_x, iso_y) == (expected.x, expected.y)
+
+    def test_is_in_diamond_batch_matches_scalar(self) -> None:
+        """Batch hit-test should match is_in_diamond element-wise."""
+        us = [0.0, 0.5, -0.5, 1.0, 0.6, -0.9]
+        vs = [0.0, 0.5, -0.5, 0.0, 0.6, 0.2]
+
+        assert is_in_diamond_batch(us, vs) == [
+            is_in_diamond(u, v) for u, v in zip(us, vs)
+        ]
+
+    def test_empty_batch(self) -> None:
+        """Empty input should produce empty output."""
+        assert to_iso_batch([], [], []) == ([], [])
+        assert to_grid_batch([], [], []) == ([], [])
+        assert to_iso_int_batch([], [], []) == ([], [])
+        assert to_iso_center_batch([], [], []) == ([], [])
+        assert is_in_diamond_batch([], []) == []
+
+    @pytest.mark.parametrize("convert", [
+        to_iso_batch, to_grid_batch, to_iso_int_batch, to_iso_center_batch,
     ])
-    def test_roundtrip_various_coords(self, x: int, y: int, h: int) -> None:
-        """Multiple coordinates should round-trip correctly."""
-        config = IsoConfig(tile_width=64, tile_height=32, elevation_scale=16)
-        original = GridCoord(x, y, h)
+    def test_mismatched_lengths_rejected(self, convert) -> None:
+        """Sequences of different lengths should raise instead of being truncated."""
+        with pytest.raises(ValueError):
+            convert([0, 1], [0, 1], [0], _CFG)
 
-        iso = to_iso(original, config)
-        recovered = to_grid(iso, h, config)
+    def test_diamond_batch_mismatched_lengths_rejected(self) -> None:
+        """Hit-testing sequences of different lengths should raise."""
+        with pytest.raises(ValueError):
+            is_in_diamond_batch([0.0, 0.5], [0.0])
+
+
+class TestOctileDistance:
+    """Tests for octile distance."""
+
+    @pytest.mark.parametrize("a,b", [
+        ((0, 0), (3, 5)),
+        ((5, 2), (1, 1)),
+        ((4, 4), (0, 0)),
+        ((2, 7), (2, 7)),
+    ])
+    def test_matches_max_min_formula(self, a: tuple[int, int], b: tuple[int, int]) -> None:
+        """Octile distance should equal max(dx,dy) + (sqrt(2)-1)*min(dx,dy)."""
+        dx, dy = abs(a[0] - b[0]), abs(a[1] - b[1])
+        expected = max(dx, dy) + (math.sqrt(2) - 1) * min(dx, dy)
 
-        assert recovered.x == x
-        assert recovered.y == y
+        assert octile_distance_grid(GridCoord(*a), GridCoord(*b)) == pytest.approx(expected)
 
 
 class TestMonotonicity:
@@ -158,36 +315,42 @@ class TestMonotonicity:
 
     def test_x_monotonic_in_iso_x(self) -> None:
         """Increasing grid x should change iso X monotonically."""
-        config = IsoConfig(tile_width=64, tile_height=32, elevation_scale=16)
-        y, h = 0, 0
+        iso_xs, _ = to_iso_batch(range(10), [0] * 10, [0] * 10, _CFG)
 
-        prev_iso_x = float('-inf')
-        for x in range(10):
-            iso = to_iso(GridCoord(x, y, h), config)
-            assert iso.x > prev_iso_x
-            prev_iso_x = iso.x
+        assert all(a < b for a, b in zip(iso_xs, iso_xs[1:]))
 
     def test_y_monotonic_in_iso_x(self) -> None:
         """Increasing grid y should change iso X monotonically (decreasing)."""
-        config = IsoConfig(tile_width=64, tile_height=32, elevation_scale=16)
-        x, h = 0, 0
+        iso_xs, _ = to_iso_batch([0] * 10, range(10), [0] * 10, _CFG)
 
-        prev_iso_x = float('inf')
-        for y in range(10):
-            iso = to_iso(GridCoord(x, y, h), config)
-            assert iso.x < prev_iso_x
-            prev_iso_x = iso.x
+        assert all(a > b for a, b in zip(iso_xs, iso_xs[1:]))
 
     def test_elevation_monotonic_in_iso_y(self) -> None:
         """Increasing elevation should decrease iso Y (move up visually)."""
-        config = IsoConfig(tile_width=64, tile_height=32, elevation_scale=16)
-        x, y = 5, 5
+        _, iso_ys = to_iso_batch([5] * 5, [5] * 5, range(5), _CFG)
+
+        assert all(a > b for a, b in zip(iso_ys, iso_ys[1:]))
 
-        prev_iso_y = float('inf')
-        for h in range(5):
-            iso = to_iso(GridCoord(x, y, h), config)
-            assert iso.y < prev_iso_y
-            prev_iso_y = iso.y
+
+class TestSlottedValueTypes:
+    """Tests for the slotted coordinate dataclasses."""
+
+    @pytest.mark.parametrize("value", [
+        IsoConfig(tile_width=50, tile_height=25, elevation_scale=7),
+        GridCoord(3, 4, 1),
+        IsoCoord(1.5, -2.0),
+        IsoCoordInt(1, -2),
+    ])
+    def test_no_instance_dict_and_pickles(self, value: object) -> None:
+        """Instances should carry no __dict__ and survive a pickle round trip."""
+        assert not hasattr(value, "__dict__")
+        assert pickle.loads(pickle.dumps(value)) == value
+
+    def test_pickled_config_keeps_derived_fields(self) -> None:
+        """Derived IsoConfig fields should be restored after unpickling."""
+        config = pickle.loads(pickle.dumps(IsoConfig(tile_width=50, tile_height=25)))
+        assert config.half_tw == 25
+        assert config.inv_half_th == pytest.approx(2 / 25)
 
 
 class TestNoSearchDependency:
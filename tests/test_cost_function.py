@@ -1,13 +1,71 @@
 """Tests for cost function."""
 import pytest
+import pickle
 from src.cost_function import (
     calculate_edge_cost,
+    get_minimum_base_cost,
     is_diagonal_move,
     CostConfig,
 )
+from src.constants.terrain_costs import TERRAIN_COSTS
 from src.map_loader_v2 import MultiLayerMap
 
 
+# Axial moves first, then diagonals; column order of _batch_edge_cost
+_DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1))
+
+
+def _batch_edge_cost(
+    game_map: MultiLayerMap,
+    config: CostConfig | None = None,
+    allow_diagonal: bool = False,
+) -> list[list[float]]:
+    """
+    Reference costs for every edge of a map, one row per cell.
+
+    Evaluates c(u,v) = b*κ + u*max(0,Δh) + d*max(0,-Δh) + λ*P straight from
+    TERRAIN_COSTS and the nested layers, independently of the LUTs and flat
+    buffers calculate_edge_cost reads. Row y * width + x holds the costs of
+    leaving (x, y) in each of _DIRECTIONS; moves off the map are inf.
+    """
+    cfg = config or CostConfig()
+    width, height = game_map.width, game_map.height
+    table = []
+    for y in range(height):
+        for x in range(width):
+            row = []
+            for dx, dy in _DIRECTIONS:
+                nx, ny = x + dx, y + dy
+                diagonal = dx != 0 and dy != 0
+                if not (0 <= nx < width and 0 <= ny < height) or (diagonal and not allow_diagonal):
+                    row.append(float('inf'))
+                    continue
+                terrain = TERRAIN_COSTS[game_map.terrain[ny][nx]]
+                if not terrain.passable:
+                    row.append(float('inf'))
+                    continue
+                dh = game_map.elevation[ny][nx] - game_map.elevation[y][x]
+                cost = (
+                    terrain.base_cost * (terrain.diagonal_factor if diagonal else 1.0)
+                    + terrain.ascent_cost * max(0, dh)
+                    + terrain.descent_cost * max(0, -dh)
+                    + cfg.priority_weight * game_map.priority[ny][nx]
+                )
+                row.append(min(cost, cfg.max_cost_cap))
+            table.append(row)
+    return table
+
+
+def _pick(
+    table: list[list[float]],
+    game_map: MultiLayerMap,
+    u: tuple[int, int],
+    v: tuple[int, int],
+) -> float:
+    """Look up the cost of edge u -> v in a _batch_edge_cost table."""
+    return table[u[1] * game_map.width + u[0]][_DIRECTIONS.index((v[0] - u[0], v[1] - u[1]))]
+
+
 class TestIsDiagonalMove:
     """Tests for diagonal move detection."""
 
@@ -31,146 +89,146 @@ class TestIsDiagonalMove:
 class TestCalculateEdgeCost:
     """Tests for edge cost calculation."""
 
-    @pytest.fixture
-    def simple_map(self) -> MultiLayerMap:
-        """Create a simple test map."""
+    @staticmethod
+    def _step_map(terrain: str, delta_h: int, priority: float) -> MultiLayerMap:
+        """2x2 map leaving S at (0, 0) into uniform terrain delta_h levels away."""
+        h = 1 + delta_h
         return MultiLayerMap(
-            terrain=[['S', '.', '.'], ['.', '.', '.'], ['.', '.', 'G']],
-            elevation=[[0, 0, 0], [0, 0, 0], [0, 0, 0]],
-            priority=[[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]],
-            start=(0, 0),
-            goal=(2, 2),
-            width=3,
-            height=3,
-        )
-
-    def test_flat_plain_cost(self, simple_map: MultiLayerMap) -> None:
-        """Flat plain movement should have base cost 1.0."""
-        cost = calculate_edge_cost(
-            (0, 0), (1, 0),
-            simple_map,
-            allow_diagonal=False,
-        )
-        assert cost == pytest.approx(1.0)
-
-    def test_paved_road_cheaper(self) -> None:
-        """Paved road should be cheaper than plain."""
-        paved_map = MultiLayerMap(
-            terrain=[['S', '=', '='], ['=', '=', '='], ['=', '=', 'G']],
-            elevation=[[0, 0, 0], [0, 0, 0], [0, 0, 0]],
-            priority=[[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]],
-            start=(0, 0),
-            goal=(2, 2),
-            width=3,
-            height=3,
-        )
-        cost = calculate_edge_cost((0, 0), (1, 0), paved_map)
-        assert cost == pytest.approx(0.8)  # Paved base cost
-
-    def test_ascent_increases_cost(self) -> None:
-        """Ascending should increase cost."""
-        hill_map = MultiLayerMap(
-            terrain=[['S', '.'], ['.', 'G']],
-            elevation=[[0, 1], [0, 0]],
-            priority=[[0.0, 0.0], [0.0, 0.0]],
-            start=(0, 0),
-            goal=(1, 1),
-            width=2,
-            height=2,
-        )
-        flat_cost = calculate_edge_cost((0, 0), (0, 1), hill_map)
-        ascent_cost = calculate_edge_cost((0, 0), (1, 0), hill_map)
-
-        # Ascending (+1 elevation) adds ascent cost
-        # Plain: base=1.0, ascent=2.0, so total = 1.0 + 2.0*1 = 3.0
-        assert ascent_cost == pytest.approx(3.0)
-        assert ascent_cost > flat_cost
-
-    def test_descent_cheaper_than_ascent(self) -> None:
-        """Descending should be cheaper than ascending."""
-        hill_map = MultiLayerMap(
-            terrain=[['S', '.'], ['.', 'G']],
-            elevation=[[1, 0], [1, 0]],
-            priority=[[0.0, 0.0], [0.0, 0.0]],
+            terrain=[['S', terrain], [terrain, terrain]],
+            elevation=[[1, h], [h, h]],
+            priority=[[0.0, priority], [priority, priority]],
             start=(0, 0),
             goal=(1, 1),
             width=2,
             height=2,
         )
-        # From (0,0) h=1 to (1,0) h=0: descent
-        descent_cost = calculate_edge_cost((0, 0), (1, 0), hill_map)
-        # Plain: base=1.0, descent=0.5, so total = 1.0 + 0.5*1 = 1.5
-        assert descent_cost == pytest.approx(1.5)
-
-    def test_diagonal_applies_factor(self) -> None:
-        """Diagonal movement should apply diagonal factor."""
-        simple_map = MultiLayerMap(
-            terrain=[['S', '.'], ['.', 'G']],
-            elevation=[[0, 0], [0, 0]],
-            priority=[[0.0, 0.0], [0.0, 0.0]],
-            start=(0, 0),
-            goal=(1, 1),
-            width=2,
-            height=2,
-        )
-        diagonal_cost = calculate_edge_cost(
-            (0, 0), (1, 1),
-            simple_map,
-            allow_diagonal=True,
-        )
+
+    # (target terrain, Δh, P(v), λ, diagonal, expected cost)
+    @pytest.mark.parametrize("terrain,delta_h,priority,weight,diagonal,expected", [
+        pytest.param('.', 0, 0.0, 0.0, False, 1.0, id="flat_plain"),
+        pytest.param('=', 0, 0.0, 0.0, False, 0.8, id="paved_cheaper"),
+        # Plain: base=1.0, ascent=2.0 -> 1.0 + 2.0*1
+        pytest.param('.', 1, 0.0, 0.0, False, 3.0, id="ascent"),
+        # Plain: base=1.0, descent=0.5 -> 1.0 + 0.5*1
+        pytest.param('.', -1, 0.0, 0.0, False, 1.5, id="descent"),
         # Plain: base=1.0, diagonal_factor=1.414
-        assert diagonal_cost == pytest.approx(1.414)
-
-    def test_priority_adds_penalty(self) -> None:
-        """Tactical priority should add penalty."""
-        priority_map = MultiLayerMap(
-            terrain=[['S', '.'], ['.', 'G']],
-            elevation=[[0, 0], [0, 0]],
-            priority=[[0.0, 5.0], [0.0, 0.0]],
-            start=(0, 0),
-            goal=(1, 1),
-            width=2,
-            height=2,
-        )
-        config = CostConfig(priority_weight=1.0)
-        cost_with_priority = calculate_edge_cost(
-            (0, 0), (1, 0),
-            priority_map,
-            config=config,
+        pytest.param('.', 0, 0.0, 0.0, True, 1.414, id="diagonal"),
+        # base=1.0 + λ*P = 1.0 + 1.0*5.0
+        pytest.param('.', 0, 5.0, 1.0, False, 6.0, id="priority"),
+        pytest.param('^', 0, 0.0, 0.0, False, 5.0, id="cliff"),
+        # Cliff: base=5.0, ascent=10.0 -> 5.0 + 10.0*3
+        pytest.param('^', 3, 0.0, 0.0, False, 35.0, id="cliff_ascent"),
+    ])
+    def test_edge_cost(
+        self,
+        terrain: str,
+        delta_h: int,
+        priority: float,
+        weight: float,
+        diagonal: bool,
+        expected: float,
+    ) -> None:
+        """Each scenario should cost what the formula gives for its target cell."""
+        game_map = self._step_map(terrain, delta_h, priority)
+        target = (1, 1) if diagonal else (1, 0)
+
+        cost = calculate_edge_cost(
+            (0, 0), target,
+            game_map,
+            config=CostConfig(priority_weight=weight),
+            allow_diagonal=diagonal,
         )
-        # base=1.0 + priority_weight*P = 1.0 + 1.0*5.0 = 6.0
-        assert cost_with_priority == pytest.approx(6.0)
-
-    def test_cliff_terrain_high_cost(self) -> None:
-        """Cliff terrain should have high base cost."""
-        cliff_map = MultiLayerMap(
-            terrain=[['S', '^'], ['^', 'G']],
-            elevation=[[0, 0], [0, 0]],
-            priority=[[0.0, 0.0], [0.0, 0.0]],
+        assert cost == pytest.approx(expected)
+
+    @pytest.mark.parametrize("u,v", [
+        ((1, 0), (2, 0)),   # x past the right edge would wrap to row 1
+        ((0, 1), (0, 2)),
+        ((0, 0), (-1, 0)),
+        ((2, 0), (1, 0)),
+    ])
+    def test_off_map_edge_raises(self, u: tuple[int, int], v: tuple[int, int]) -> None:
+        """Edges leaving the map should raise instead of reading another cell."""
+        game_map = self._step_map('.', 0, 0.0)
+
+        with pytest.raises(IndexError, match="leaves the map"):
+            calculate_edge_cost(u, v, game_map, allow_diagonal=True)
+
+
+class TestBatchEdgeCost:
+    """Cross-checks calculate_edge_cost against the batch reference."""
+
+    @pytest.fixture
+    def mixed_map(self) -> MultiLayerMap:
+        """Create a map mixing terrain, walls, slopes and priority."""
+        return MultiLayerMap(
+            terrain=[['S', 'F', '^', '.'], ['~', '#', '=', 's'], ['.', '^', 'F', 'G']],
+            elevation=[[0, 2, 5, 1], [1, 0, 3, 0], [4, 30, 0, 2]],
+            priority=[[0.0, 1.5, 0.0, 2.0], [0.5, 0.0, 3.0, 0.0], [0.0, 1.0, 0.0, 0.0]],
             start=(0, 0),
-            goal=(1, 1),
-            width=2,
-            height=2,
+            goal=(3, 2),
+            width=4,
+            height=3,
         )
-        cost = calculate_edge_cost((0, 0), (1, 0), cliff_map)
-        # Cliff: base=5.0
-        assert cost == pytest.approx(5.0)
-
-    def test_cliff_ascent_very_expensive(self) -> None:
-        """Climbing a cliff should be very expensive."""
-        cliff_map = MultiLayerMap(
-            terrain=[['S', '^'], ['^', 'G']],
-            elevation=[[0, 3], [0, 0]],
-            priority=[[0.0, 0.0], [0.0, 0.0]],
+
+    @pytest.mark.parametrize("allow_diagonal", [False, True])
+    def test_matches_scalar_on_every_edge(
+        self, mixed_map: MultiLayerMap, allow_diagonal: bool
+    ) -> None:
+        """Every in-bounds edge should cost the same in both implementations."""
+        config = CostConfig(priority_weight=2.0)
+        costs = _batch_edge_cost(mixed_map, config, allow_diagonal)
+
+        actuals = []
+        expecteds = []
+        for y in range(mixed_map.height):
+            for x in range(mixed_map.width):
+                for dx, dy in _DIRECTIONS:
+                    v = (x + dx, y + dy)
+                    if not (0 <= v[0] < mixed_map.width and 0 <= v[1] < mixed_map.height):
+                        continue
+                    expecteds.append(_pick(costs, mixed_map, (x, y), v))
+                    actuals.append(calculate_edge_cost(
+                        (x, y), v, mixed_map, config=config, allow_diagonal=allow_diagonal
+                    ))
+
+        # One sequence comparison instead of an approx object per edge
+        assert actuals == pytest.approx(expecteds)
+
+    def test_cost_cap_applies(self, mixed_map: MultiLayerMap) -> None:
+        """The reference should saturate at the configured cap like the scalar."""
+        costs = _batch_edge_cost(mixed_map)
+        # Cliff at (1, 2) from (0, 2): 5.0 + 10.0 * 26 = 265.0, capped to 255
+        assert _pick(costs, mixed_map, (0, 2), (1, 2)) == 255
+
+
+class TestMinimumBaseCost:
+    """Tests for the heuristic's minimum base cost."""
+
+    @staticmethod
+    def _row_map(row: str) -> MultiLayerMap:
+        return MultiLayerMap(
+            terrain=[list(row)],
+            elevation=[[0] * len(row)],
+            priority=[[0.0] * len(row)],
             start=(0, 0),
-            goal=(1, 1),
-            width=2,
-            height=2,
+            goal=(len(row) - 1, 0),
+            width=len(row),
+            height=1,
         )
-        cost = calculate_edge_cost((0, 0), (1, 0), cliff_map)
-        # Cliff: base=5.0, ascent=10.0, delta_h=3
-        # 5.0 + 10.0*3 = 35.0
-        assert cost == pytest.approx(35.0)
+
+    @pytest.mark.parametrize("row,expected", [
+        ("S..G", 1.0),
+        ("S=~G", 0.8),   # paved is cheapest
+        ("S~FG", 1.0),   # S/G count as plain
+        ("S#G", 1.0),    # walls are ignored
+    ])
+    def test_minimum_over_present_terrain(self, row: str, expected: float) -> None:
+        """Minimum should cover passable terrain actually present in the map."""
+        assert get_minimum_base_cost(self._row_map(row)) == expected
+
+    def test_all_walls_defaults_to_one(self) -> None:
+        """A map with no passable terrain should fall back to 1.0."""
+        assert get_minimum_base_cost(self._row_map("###")) == 1.0
 
 
 class TestCostConfigDefaults:
@@ -186,6 +244,12 @@ class TestCostConfigDefaults:
         config = CostConfig(priority_weight=2.5)
         assert config.priority_weight == 2.5
 
+    def test_no_instance_dict_and_pickles(self) -> None:
+        """CostConfig should be slotted and survive a pickle round trip."""
+        config = CostConfig(priority_weight=1.5, max_cost_cap=100)
+        assert not hasattr(config, "__dict__")
+        assert pickle.loads(pickle.dumps(config)) == config
+
 
 class TestCostFormula:
     """Tests verifying the exact cost formula from specification."""
@@ -11,6 +11,7 @@ Tests cover:
 """
 import pytest
 import math
+from itertools import product
 from src.coordinates import (
     to_iso,
     to_grid,
@@ -20,6 +21,8 @@ from src.coordinates import (
     OutOfBoundsError,
     is_in_diamond,
     to_iso_int,
+    to_iso_batch,
+    to_grid_batch,
     validate_grid_bounds,
 )
 from src.cost_function import (
@@ -31,6 +34,14 @@ from src.map_loader_v2 import MultiLayerMap
 from src.finder import find_path, FinderAlgorithm
 
 
+# Shared projection for tests that do not exercise IsoConfig itself
+_CFG = IsoConfig(tile_width=64, tile_height=32, elevation_scale=16)
+
+# CostConfig is frozen, so the cost-cap tests can share these
+_DEFAULT_COST_CFG = CostConfig()
+_PRIORITY_COST_CFG = CostConfig(priority_weight=1.0)
+
+
 class TestOutOfBoundsError:
     """Tests for boundary defense with OutOfBoundsError."""
 
@@ -38,33 +49,24 @@ class TestOutOfBoundsError:
         """OutOfBoundsError should be a defined exception."""
         assert issubclass(OutOfBoundsError, Exception)
 
-    def test_validate_bounds_raises_on_negative_x(self) -> None:
-        """Negative x should raise OutOfBoundsError."""
-        with pytest.raises(OutOfBoundsError):
-            validate_grid_bounds(-1, 0, 10, 10)
-
-    def test_validate_bounds_raises_on_negative_y(self) -> None:
-        """Negative y should raise OutOfBoundsError."""
-        with pytest.raises(OutOfBoundsError):
-            validate_grid_bounds(0, -1, 10, 10)
-
-    def test_validate_bounds_raises_on_x_out_of_range(self) -> None:
-        """x >= width should raise OutOfBoundsError."""
-        with pytest.raises(OutOfBoundsError):
-            validate_grid_bounds(10, 0, 10, 10)
-
-    def test_validate_bounds_raises_on_y_out_of_range(self) -> None:
-        """y >= height should raise OutOfBoundsError."""
+    @pytest.mark.parametrize("x,y", [
+        pytest.param(-1, 0, id="negative_x"),
+        pytest.param(0, -1, id="negative_y"),
+        pytest.param(10, 0, id="x_at_width"),
+        pytest.param(0, 10, id="y_at_height"),
+    ])
+    def test_validate_bounds_rejects_outside(self, x: int, y: int) -> None:
+        """Coordinates outside 0 <= x < W, 0 <= y < H should raise OutOfBoundsError."""
         with pytest.raises(OutOfBoundsError):
-            validate_grid_bounds(0, 10, 10, 10)
-
-    def test_validate_bounds_valid_origin(self) -> None:
-        """Origin (0,0) should be valid."""
-        validate_grid_bounds(0, 0, 10, 10)  # Should not raise
+            validate_grid_bounds(x, y, 10, 10)
 
-    def test_validate_bounds_valid_max_coord(self) -> None:
-        """Max valid coord (W-1, H-1) should be valid."""
-        validate_grid_bounds(9, 9, 10, 10)  # Should not raise
+    @pytest.mark.parametrize("x,y", [
+        pytest.param(0, 0, id="origin"),
+        pytest.param(9, 9, id="max_coord"),
+    ])
+    def test_validate_bounds_accepts_inside(self, x: int, y: int) -> None:
+        """Origin and (W-1, H-1) should be valid."""
+        validate_grid_bounds(x, y, 10, 10)  # Should not raise
 
 
 class TestIntegerRounding:
@@ -72,17 +74,15 @@ class TestIntegerRounding:
 
     def test_to_iso_int_returns_integers(self) -> None:
         """to_iso_int should return integer coordinates."""
-        config = IsoConfig(tile_width=64, tile_height=32, elevation_scale=16)
-        result = to_iso_int(GridCoord(3, 2, 1), config)
+        result = to_iso_int(GridCoord(3, 2, 1), _CFG)
 
         assert isinstance(result.x, int)
         assert isinstance(result.y, int)
 
     def test_to_iso_int_uses_round(self) -> None:
         """to_iso_int should use nearest rounding."""
-        config = IsoConfig(tile_width=64, tile_height=32, elevation_scale=16)
         # Grid (0, 0, 0) -> iso (0, 0)
-        result = to_iso_int(GridCoord(0, 0, 0), config)
+        result = to_iso_int(GridCoord(0, 0, 0), _CFG)
         assert result.x == 0
         assert result.y == 0
 
@@ -135,13 +135,10 @@ class TestDiamondHitTest:
         result = is_in_diamond(0.0, 0.0)
         assert result is True
 
-    def test_corners_are_on_boundary(self) -> None:
+    @pytest.mark.parametrize("u,v", [(1.0, 0.0), (-1.0, 0.0), (0.0, 1.0), (0.0, -1.0)])
+    def test_corners_are_on_boundary(self, u: float, v: float) -> None:
         """Corner points |u|+|v|=1 should be on boundary (included)."""
-        # Four corners of the diamond
-        assert is_in_diamond(1.0, 0.0) is True
-        assert is_in_diamond(-1.0, 0.0) is True
-        assert is_in_diamond(0.0, 1.0) is True
-        assert is_in_diamond(0.0, -1.0) is True
+        assert is_in_diamond(u, v) is True
 
     def test_outside_diamond(self) -> None:
         """Points with |u|+|v|>1 should be outside."""
@@ -154,13 +151,11 @@ class TestDiamondHitTest:
         assert is_in_diamond(0.3, 0.3) is True  # |0.3|+|0.3| = 0.6 < 1
         assert is_in_diamond(0.5, 0.4) is True  # |0.5|+|0.4| = 0.9 < 1
 
-    def test_quadrant_symmetry(self) -> None:
+    # Point (0.3, 0.4) has |u|+|v| = 0.7 in every quadrant
+    @pytest.mark.parametrize("u,v", [(0.3, 0.4), (-0.3, 0.4), (0.3, -0.4), (-0.3, -0.4)])
+    def test_quadrant_symmetry(self, u: float, v: float) -> None:
         """All quadrants should behave symmetrically."""
-        # Point (0.3, 0.4) has |u|+|v| = 0.7
-        assert is_in_diamond(0.3, 0.4) is True
-        assert is_in_diamond(-0.3, 0.4) is True
-        assert is_in_diamond(0.3, -0.4) is True
-        assert is_in_diamond(-0.3, -0.4) is True
+        assert is_in_diamond(u, v) is True
 
 
 class TestMaxCostCap:
@@ -198,8 +193,7 @@ class TestMaxCostCap:
             height=1,
         )
         # Cost = 5 (base) + 10 * 100 (ascent) = 1005 > 255
-        config = CostConfig()
-        cost = calculate_edge_cost((0, 0), (1, 0), game_map, config)
+        cost = calculate_edge_cost((0, 0), (1, 0), game_map, _DEFAULT_COST_CFG)
         assert cost == 255  # Should be capped
 
     def test_priority_included_in_cap(self) -> None:
@@ -213,9 +207,8 @@ class TestMaxCostCap:
             width=2,
             height=1,
         )
-        config = CostConfig(priority_weight=1.0)
         # Cost = 1 (base) + 1000 (priority) = 1001 > 255
-        cost = calculate_edge_cost((0, 0), (1, 0), game_map, config)
+        cost = calculate_edge_cost((0, 0), (1, 0), game_map, _PRIORITY_COST_CFG)
         assert cost == 255
 
     def test_impassable_remains_infinity(self) -> None:
@@ -231,7 +224,7 @@ class TestMaxCostCap:
         )
         # Moving TO wall at (1,0) - cost function checks terrain at target
         cost = calculate_edge_cost((0, 0), (1, 0), game_map)
-        assert cost == float('inf')  # Not capped to 255
+        assert cost == math.inf  # Not capped to 255
 
 
 class TestAC1ZigzagSuppression:
@@ -361,56 +354,39 @@ class TestAC3ClickCoordinateAccuracy:
 
     def test_tile_center_maps_to_same_tile(self) -> None:
         """Click at tile center should map back to same tile."""
-        config = IsoConfig(tile_width=64, tile_height=32, elevation_scale=16)
-
-        for x in range(5):
-            for y in range(5):
-                grid = GridCoord(x, y, 0)
-                iso = to_iso(grid, config)
-                recovered = to_grid(iso, 0, config)
-
-                assert recovered.x == x
-                assert recovered.y == y
-
-    def test_click_near_corner_stays_in_tile(self) -> None:
+        xs, ys = zip(*product(range(5), range(5)))
+        hs = [0] * len(xs)
+
+        iso_xs, iso_ys = to_iso_batch(xs, ys, hs, _CFG)
+        recovered_xs, recovered_ys = to_grid_batch(iso_xs, iso_ys, hs, _CFG)
+
+        assert recovered_xs == list(xs)
+        assert recovered_ys == list(ys)
+
+    # Points at 90% of the way to each corner; for tile_width=64,
+    # tile_height=32 the corner offsets are (±32, 0) and (0, ±16)
+    @pytest.mark.parametrize("dx,dy", [
+        (28.8, 0),    # 90% to right corner
+        (-28.8, 0),   # 90% to left corner
+        (0, 14.4),    # 90% to bottom corner
+        (0, -14.4),   # 90% to top corner
+    ])
+    def test_click_near_corner_stays_in_tile(self, dx: float, dy: float) -> None:
         """Click near tile corner (but inside) should stay in same tile."""
-        config = IsoConfig(tile_width=64, tile_height=32, elevation_scale=16)
-        grid = GridCoord(3, 3, 0)
-        center = to_iso(grid, config)
-
-        # Test points near corners but still inside diamond
-        # For tile_width=64, tile_height=32:
-        # Corner offsets are approximately (±32, 0) and (0, ±16)
-        # Points at 90% of corner distance should be inside
+        center = to_iso(GridCoord(3, 3, 0), _CFG)
 
-        test_offsets = [
-            (28.8, 0),    # 90% to right corner
-            (-28.8, 0),   # 90% to left corner
-            (0, 14.4),    # 90% to bottom corner
-            (0, -14.4),   # 90% to top corner
-        ]
+        recovered = to_grid(IsoCoord(center.x + dx, center.y + dy), 0, _CFG)
 
-        for dx, dy in test_offsets:
-            test_point = IsoCoord(center.x + dx, center.y + dy)
-            recovered = to_grid(test_point, 0, config)
-
-            assert recovered.x == 3, f"Offset {(dx, dy)} gave x={recovered.x}"
-            assert recovered.y == 3, f"Offset {(dx, dy)} gave y={recovered.y}"
+        assert recovered.x == 3
+        assert recovered.y == 3
 
     def test_roundtrip_error_within_half_pixel(self) -> None:
         """Round-trip iso->grid->iso error should be <= 0.5 pixels."""
-        config = IsoConfig(tile_width=64, tile_height=32, elevation_scale=16)
-
-        for x in range(10):
-            for y in range(10):
-                for h in range(3):
-                    original_grid = GridCoord(x, y, h)
-                    iso = to_iso(original_grid, config)
-                    recovered_grid = to_grid(iso, h, config)
-                    recovered_iso = to_iso(recovered_grid, config)
+        xs, ys, hs = zip(*product(range(10), range(10), range(3)))
 
-                    error_x = abs(recovered_iso.x - iso.x)
-                    error_y = abs(recovered_iso.y - iso.y)
+        iso_xs, iso_ys = to_iso_batch(xs, ys, hs, _CFG)
+        grid_xs, grid_ys = to_grid_batch(iso_xs, iso_ys, hs, _CFG)
+        recovered_xs, recovered_ys = to_iso_batch(grid_xs, grid_ys, hs, _CFG)
 
-                    assert error_x <= 0.5, f"X error {error_x} > 0.5 at ({x},{y},{h})"
-                    assert error_y <= 0.5, f"Y error {error_y} > 0.5 at ({x},{y},{h})"
+        assert max(abs(r - i) for r, i in zip(recovered_xs, iso_xs)) <= 0.5
+        assert max(abs(r - i) for r, i in zip(recovered_ys, iso_ys)) <= 0.5
@@ -2,131 +2,119 @@
 import pytest
 from src.finder import (
     find_path,
+    find_paths_batch,
+    jump_point_search,
+    build_search_context,
     FinderResult,
     FinderAlgorithm,
     NoPathFoundError,
 )
 from src.map_loader_v2 import MultiLayerMap
-from src.cost_function import CostConfig
+from src.cost_function import CostConfig, calculate_edge_cost
+
+
+def _make_map(
+    terrain: list[str],
+    elevation: list[list[int]] | None = None,
+    priority: list[list[float]] | None = None,
+) -> MultiLayerMap:
+    """Build a map from rows of terrain codes, with flat zero layers by default.
+
+    The default layers are tuples sharing one immutable row, since
+    MultiLayerMap only reads them.
+    """
+    grid = [list(row) for row in terrain]
+    width, height = len(grid[0]), len(grid)
+    cells = [(x, y) for y in range(height) for x in range(width)]
+    return MultiLayerMap(
+        terrain=grid,
+        elevation=elevation or ((0,) * width,) * height,
+        priority=priority or ((0.0,) * width,) * height,
+        start=next(c for c in cells if grid[c[1]][c[0]] == 'S'),
+        goal=next(c for c in cells if grid[c[1]][c[0]] == 'G'),
+        width=width,
+        height=height,
+    )
+
+
+# The searches are deterministic and the tests only read the results,
+# so each algorithm runs once for the whole module
+@pytest.fixture(scope="module")
+def simple_map() -> MultiLayerMap:
+    """Simple 3x3 map."""
+    return _make_map(["S..", "...", "..G"])
+
+
+@pytest.fixture(scope="module")
+def dijkstra_result(simple_map: MultiLayerMap) -> FinderResult:
+    """Dijkstra result on the simple map."""
+    return find_path(simple_map, FinderAlgorithm.DIJKSTRA)
+
+
+@pytest.fixture(scope="module")
+def astar_result(simple_map: MultiLayerMap) -> FinderResult:
+    """A* result on the simple map."""
+    return find_path(simple_map, FinderAlgorithm.ASTAR)
 
 
 class TestFindPathBasic:
     """Basic pathfinding tests."""
 
-    @pytest.fixture
-    def simple_map(self) -> MultiLayerMap:
-        """Simple 3x3 map."""
-        return MultiLayerMap(
-            terrain=[['S', '.', '.'], ['.', '.', '.'], ['.', '.', 'G']],
-            elevation=[[0, 0, 0], [0, 0, 0], [0, 0, 0]],
-            priority=[[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]],
-            start=(0, 0),
-            goal=(2, 2),
-            width=3,
-            height=3,
-        )
-
-    def test_dijkstra_finds_path(self, simple_map: MultiLayerMap) -> None:
+    def test_dijkstra_finds_path(
+        self, simple_map: MultiLayerMap, dijkstra_result: FinderResult
+    ) -> None:
         """Dijkstra should find a path."""
-        result = find_path(simple_map, FinderAlgorithm.DIJKSTRA)
-
-        assert result.path is not None
-        assert result.path[0] == simple_map.start
-        assert result.path[-1] == simple_map.goal
+        assert dijkstra_result.path is not None
+        assert dijkstra_result.path[0] == simple_map.start
+        assert dijkstra_result.path[-1] == simple_map.goal
 
-    def test_astar_finds_path(self, simple_map: MultiLayerMap) -> None:
+    def test_astar_finds_path(
+        self, simple_map: MultiLayerMap, astar_result: FinderResult
+    ) -> None:
         """A* should find a path."""
-        result = find_path(simple_map, FinderAlgorithm.ASTAR)
+        assert astar_result.path is not None
+        assert astar_result.path[0] == simple_map.start
+        assert astar_result.path[-1] == simple_map.goal
 
-        assert result.path is not None
-        assert result.path[0] == simple_map.start
-        assert result.path[-1] == simple_map.goal
-
-    def test_dijkstra_astar_same_cost(self, simple_map: MultiLayerMap) -> None:
+    def test_dijkstra_astar_same_cost(
+        self, dijkstra_result: FinderResult, astar_result: FinderResult
+    ) -> None:
         """Dijkstra and A* should find paths with same total cost."""
-        dijkstra_result = find_path(simple_map, FinderAlgorithm.DIJKSTRA)
-        astar_result = find_path(simple_map, FinderAlgorithm.ASTAR)
-
         assert dijkstra_result.total_cost == pytest.approx(astar_result.total_cost)
 
     def test_no_path_raises_error(self) -> None:
         """Should raise error when no path exists."""
-        blocked_map = MultiLayerMap(
-            terrain=[['S', '#', 'G']],
-            elevation=[[0, 0, 0]],
-            priority=[[0.0, 0.0, 0.0]],
-            start=(0, 0),
-            goal=(2, 0),
-            width=3,
-            height=1,
-        )
+        blocked_map = _make_map(["S#G"])
         with pytest.raises(NoPathFoundError):
             find_path(blocked_map, FinderAlgorithm.DIJKSTRA)
 
 
+@pytest.fixture(scope="module")
+def sg_result() -> FinderResult:
+    """Dijkstra result for a start next to the goal, shared by the module."""
+    return find_path(_make_map(["SG"]), FinderAlgorithm.DIJKSTRA)
+
+
 class TestFinderResult:
     """Tests for FinderResult structure."""
 
-    def test_result_contains_path(self) -> None:
+    def test_result_contains_path(self, sg_result: FinderResult) -> None:
         """Result should contain path."""
-        simple_map = MultiLayerMap(
-            terrain=[['S', 'G']],
-            elevation=[[0, 0]],
-            priority=[[0.0, 0.0]],
-            start=(0, 0),
-            goal=(1, 0),
-            width=2,
-            height=1,
-        )
-        result = find_path(simple_map, FinderAlgorithm.DIJKSTRA)
+        assert sg_result.path == [(0, 0), (1, 0)]
 
-        assert result.path == [(0, 0), (1, 0)]
-
-    def test_result_contains_total_cost(self) -> None:
+    def test_result_contains_total_cost(self, sg_result: FinderResult) -> None:
         """Result should contain total cost."""
-        simple_map = MultiLayerMap(
-            terrain=[['S', '.', 'G']],
-            elevation=[[0, 0, 0]],
-            priority=[[0.0, 0.0, 0.0]],
-            start=(0, 0),
-            goal=(2, 0),
-            width=3,
-            height=1,
-        )
-        result = find_path(simple_map, FinderAlgorithm.DIJKSTRA)
+        # One move onto plain-cost goal terrain: 1.0
+        assert sg_result.total_cost == pytest.approx(1.0)
 
-        # Two moves on plain terrain: 1.0 + 1.0 = 2.0
-        assert result.total_cost == pytest.approx(2.0)
-
-    def test_result_contains_nodes_expanded(self) -> None:
+    def test_result_contains_nodes_expanded(self, sg_result: FinderResult) -> None:
         """Result should contain nodes expanded count."""
-        simple_map = MultiLayerMap(
-            terrain=[['S', 'G']],
-            elevation=[[0, 0]],
-            priority=[[0.0, 0.0]],
-            start=(0, 0),
-            goal=(1, 0),
-            width=2,
-            height=1,
-        )
-        result = find_path(simple_map, FinderAlgorithm.DIJKSTRA)
+        assert sg_result.nodes_expanded >= 0
 
-        assert result.nodes_expanded >= 0
-
-    def test_result_contains_execution_time(self) -> None:
+    def test_result_contains_execution_time(self, sg_result: FinderResult) -> None:
         """Result should contain execution time."""
-        simple_map = MultiLayerMap(
-            terrain=[['S', 'G']],
-            elevation=[[0, 0]],
-            priority=[[0.0, 0.0]],
-            start=(0, 0),
-            goal=(1, 0),
-            width=2,
-            height=1,
-        )
-        result = find_path(simple_map, FinderAlgorithm.DIJKSTRA)
-
-        assert result.execution_time >= 0
+        # Captured when the search ran, so it is valid on a shared result
+        assert sg_result.execution_time >= 0
 
 
 class TestTerrainCostInfluence:
@@ -140,18 +128,10 @@ class TestTerrainCostInfluence:
         # But with 2 plain vs 4 paved:
         # 2*1.0 = 2.0 vs 4*0.8 = 3.2
         # Need map where paved wins
-        paved_map = MultiLayerMap(
-            terrain=[
-                ['S', '.', '.', '.', 'G'],
-                ['=', '=', '=', '=', '='],
-            ],
-            elevation=[[0]*5, [0]*5],
-            priority=[[0.0]*5, [0.0]*5],
-            start=(0, 0),
-            goal=(4, 0),
-            width=5,
-            height=2,
-        )
+        paved_map = _make_map([
+            "S...G",
+            "=====",
+        ])
         result = find_path(paved_map, FinderAlgorithm.DIJKSTRA)
 
         # With paved path (row 1): 1.0 + 0.8*3 + 1.0 = 4.4
@@ -162,18 +142,10 @@ class TestTerrainCostInfluence:
     def test_avoids_difficult_terrain(self) -> None:
         """Pathfinder should avoid difficult terrain when alternative exists."""
         # Direct through cliff vs detour on plain
-        terrain_map = MultiLayerMap(
-            terrain=[
-                ['S', '^', 'G'],
-                ['.', '.', '.'],
-            ],
-            elevation=[[0, 0, 0], [0, 0, 0]],
-            priority=[[0.0]*3, [0.0]*3],
-            start=(0, 0),
-            goal=(2, 0),
-            width=3,
-            height=2,
-        )
+        terrain_map = _make_map([
+            "S^G",
+            "...",
+        ])
         result = find_path(terrain_map, FinderAlgorithm.DIJKSTRA)
 
         # Through cliff: 5.0 + 1.0 = 6.0
@@ -188,17 +160,9 @@ class TestElevationCostInfluence:
 
     def test_prefers_descent_over_ascent(self) -> None:
         """Should prefer descending path over ascending."""
-        elevation_map = MultiLayerMap(
-            terrain=[
-                ['S', '.', 'G'],
-                ['.', '.', '.'],
-            ],
+        elevation_map = _make_map(
+            ["S.G", "..."],
             elevation=[[2, 3, 2], [1, 1, 1]],
-            priority=[[0.0]*3, [0.0]*3],
-            start=(0, 0),
-            goal=(2, 0),
-            width=3,
-            height=2,
         )
         result = find_path(elevation_map, FinderAlgorithm.DIJKSTRA)
 
@@ -210,17 +174,9 @@ class TestElevationCostInfluence:
     def test_avoids_steep_climb(self) -> None:
         """Should avoid steep climbs when gentler path exists."""
         # Cliff with high elevation vs gentle slope
-        cliff_map = MultiLayerMap(
-            terrain=[
-                ['S', '^', 'G'],
-                ['.', '.', '.'],
-            ],
+        cliff_map = _make_map(
+            ["S^G", "..."],
             elevation=[[0, 5, 0], [0, 1, 0]],
-            priority=[[0.0]*3, [0.0]*3],
-            start=(0, 0),
-            goal=(2, 0),
-            width=3,
-            height=2,
         )
         result = find_path(cliff_map, FinderAlgorithm.DIJKSTRA)
 
@@ -236,15 +192,7 @@ class TestDiagonalMovement:
 
     def test_diagonal_disabled_by_default(self) -> None:
         """Diagonal movement should be disabled by default."""
-        diagonal_map = MultiLayerMap(
-            terrain=[['S', '.'], ['.', 'G']],
-            elevation=[[0, 0], [0, 0]],
-            priority=[[0.0, 0.0], [0.0, 0.0]],
-            start=(0, 0),
-            goal=(1, 1),
-            width=2,
-            height=2,
-        )
+        diagonal_map = _make_map(["S.", ".G"])
         result = find_path(diagonal_map, FinderAlgorithm.DIJKSTRA, allow_diagonal=False)
 
         # Must go via (1,0) or (0,1)
@@ -253,15 +201,7 @@ class TestDiagonalMovement:
 
     def test_diagonal_enabled(self) -> None:
         """Diagonal movement should work when enabled."""
-        diagonal_map = MultiLayerMap(
-            terrain=[['S', '.'], ['.', 'G']],
-            elevation=[[0, 0], [0, 0]],
-            priority=[[0.0, 0.0], [0.0, 0.0]],
-            start=(0, 0),
-            goal=(1, 1),
-            width=2,
-            height=2,
-        )
+        diagonal_map = _make_map(["S.", ".G"])
         result = find_path(diagonal_map, FinderAlgorithm.DIJKSTRA, allow_diagonal=True)
 
         # Can go directly diagonal
@@ -274,21 +214,13 @@ class TestHeuristicAdmissibility:
 
     def test_astar_optimal_solution(self) -> None:
         """A* with admissible heuristic should find optimal path."""
-        complex_map = MultiLayerMap(
-            terrain=[
-                ['S', '.', '.', '.', '.'],
-                ['.', '#', '#', '#', '.'],
-                ['.', '.', '.', '.', '.'],
-                ['.', '#', '#', '#', '.'],
-                ['.', '.', '.', '.', 'G'],
-            ],
-            elevation=[[0]*5 for _ in range(5)],
-            priority=[[0.0]*5 for _ in range(5)],
-            start=(0, 0),
-            goal=(4, 4),
-            width=5,
-            height=5,
-        )
+        complex_map = _make_map([
+            "S....",
+            ".###.",
+            ".....",
+            ".###.",
+            "....G",
+        ])
         dijkstra_result = find_path(complex_map, FinderAlgorithm.DIJKSTRA)
         astar_result = find_path(complex_map, FinderAlgorithm.ASTAR)
 
@@ -296,30 +228,286 @@ class TestHeuristicAdmissibility:
 
     def test_astar_fewer_expansions(self) -> None:
         """A* should typically expand fewer nodes than Dijkstra."""
-        large_map = MultiLayerMap(
-            terrain=[['.' if (x, y) != (0, 0) else 'S' if (x, y) == (0, 0) else 'G'
-                     for x in range(10)] for y in range(10)],
-            elevation=[[0]*10 for _ in range(10)],
-            priority=[[0.0]*10 for _ in range(10)],
-            start=(0, 0),
-            goal=(9, 9),
-            width=10,
-            height=10,
-        )
-        # Fix the terrain
-        large_map = MultiLayerMap(
-            terrain=[['S' if (x, y) == (0, 0) else 'G' if (x, y) == (9, 9) else '.'
-                     for x in range(10)] for y in range(10)],
-            elevation=[[0]*10 for _ in range(10)],
-            priority=[[0.0]*10 for _ in range(10)],
-            start=(0, 0),
-            goal=(9, 9),
-            width=10,
-            height=10,
-        )
+        large_map = _make_map(["S" + "." * 9] + ["." * 10] * 8 + ["." * 9 + "G"])
 
         dijkstra_result = find_path(large_map, FinderAlgorithm.DIJKSTRA)
         astar_result = find_path(large_map, FinderAlgorithm.ASTAR)
 
         # A* should expand same or fewer nodes
         assert astar_result.nodes_expanded <= dijkstra_result.nodes_expanded
+
+
+class TestSearchContext:
+    """Tests for the shared per-map search precomputation."""
+
+    @pytest.fixture
+    def mixed_map(self) -> MultiLayerMap:
+        """4x4 map with a wall, water and a slope."""
+        return MultiLayerMap(
+            terrain=[
+                ['S', '.', '~', '.'],
+                ['.', '#', '.', '.'],
+                ['=', '=', 'F', '.'],
+                ['.', '.', '.', 'G'],
+            ],
+            elevation=[
+                [0, 0, 0, 1],
+                [0, 0, 1, 2],
+                [0, 0, 1, 1],
+                [0, 0, 0, 0],
+            ],
+            priority=((0.0,) * 4,) * 4,
+            start=(0, 0),
+            goal=(3, 3),
+            width=4,
+            height=4,
+        )
+
+    @pytest.mark.parametrize("algorithm", list(FinderAlgorithm))
+    @pytest.mark.parametrize("allow_diagonal", [False, True])
+    def test_context_gives_identical_result(
+        self,
+        mixed_map: MultiLayerMap,
+        algorithm: FinderAlgorithm,
+        allow_diagonal: bool,
+    ) -> None:
+        """Searching with a context should match searching without one."""
+        context = build_search_context(mixed_map, allow_diagonal=allow_diagonal)
+
+        plain = find_path(mixed_map, algorithm, allow_diagonal=allow_diagonal)
+        shared = find_path(
+            mixed_map, algorithm, allow_diagonal=allow_diagonal, context=context
+        )
+
+        assert shared.path == plain.path
+        assert shared.total_cost == plain.total_cost
+        assert shared.nodes_expanded == plain.nodes_expanded
+
+    def test_wall_has_no_incoming_edges(self, mixed_map: MultiLayerMap) -> None:
+        """Impassable cells should never appear as edge targets."""
+        context = build_search_context(mixed_map)
+
+        targets = {neighbor for edges in context.edges for neighbor, _ in edges}
+        assert (1, 1) not in targets
+
+    def test_mismatched_options_rejected(self, mixed_map: MultiLayerMap) -> None:
+        """A context built for other options should be refused."""
+        context = build_search_context(mixed_map, allow_diagonal=False)
+
+        with pytest.raises(ValueError, match="context"):
+            find_path(
+                mixed_map, FinderAlgorithm.DIJKSTRA, allow_diagonal=True, context=context
+            )
+        with pytest.raises(ValueError, match="context"):
+            find_path(
+                mixed_map,
+                FinderAlgorithm.DIJKSTRA,
+                cost_config=CostConfig(priority_weight=1.0),
+                context=context,
+            )
+
+
+class TestBatchQueries:
+    """Tests for start/goal overrides and batched queries."""
+
+    @pytest.fixture
+    def open_map(self) -> MultiLayerMap:
+        """4x3 map with a wall pocket in the top right corner."""
+        return MultiLayerMap(
+            terrain=[['S', '.', '#', '.'], ['.', '.', '#', '#'], ['.', '.', '.', 'G']],
+            elevation=[[0, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 0]],
+            priority=((0.0,) * 4,) * 3,
+            start=(0, 0),
+            goal=(3, 2),
+            width=4,
+            height=3,
+        )
+
+    def test_start_goal_override(self, open_map: MultiLayerMap) -> None:
+        """Overridden endpoints should be used instead of the map's own."""
+        result = find_path(
+            open_map, FinderAlgorithm.DIJKSTRA, start=(1, 0), goal=(0, 2)
+        )
+
+        assert result.path[0] == (1, 0)
+        assert result.path[-1] == (0, 2)
+
+    def test_override_outside_map_rejected(self, open_map: MultiLayerMap) -> None:
+        """Endpoints off the map should raise ValueError."""
+        with pytest.raises(ValueError, match="outside"):
+            find_path(open_map, FinderAlgorithm.DIJKSTRA, goal=(4, 0))
+
+    @pytest.mark.parametrize("algorithm", list(FinderAlgorithm))
+    def test_batch_matches_single_queries(
+        self,
+        open_map: MultiLayerMap,
+        algorithm: FinderAlgorithm,
+    ) -> None:
+        """Each batch result should equal the corresponding single search."""
+        queries = [((0, 0), (3, 2)), ((3, 2), (0, 0)), ((1, 1), (1, 1)), ((0, 2), (1, 0))]
+
+        results = find_paths_batch(open_map, queries, algorithm)
+
+        for (start, goal), result in zip(queries, results):
+            expected = find_path(open_map, algorithm, start=start, goal=goal)
+            assert result is not None
+            assert result.path == expected.path
+            assert result.total_cost == expected.total_cost
+
+    def test_batch_marks_unreachable_query(self, open_map: MultiLayerMap) -> None:
+        """A query without a path should yield None without stopping the batch."""
+        results = find_paths_batch(
+            open_map, [((0, 0), (3, 0)), ((0, 0), (3, 2))], FinderAlgorithm.ASTAR
+        )
+
+        assert results[0] is None
+        assert results[1] is not None
+
+
+class TestJumpPointSearch:
+    """Tests for Jump Point Search on uniform-cost maps."""
+
+    @staticmethod
+    def _uniform_map(terrain: list[str]) -> MultiLayerMap:
+        """Build a flat map with zero priority from rows of terrain codes."""
+        grid = [list(row) for row in terrain]
+        width, height = len(grid[0]), len(grid)
+        cells = [(x, y) for y in range(height) for x in range(width)]
+        return MultiLayerMap(
+            terrain=grid,
+            elevation=[[1] * width for _ in range(height)],
+            priority=((0.0,) * width,) * height,
+            start=next(c for c in cells if grid[c[1]][c[0]] == 'S'),
+            goal=next(c for c in cells if grid[c[1]][c[0]] == 'G'),
+            width=width,
+            height=height,
+        )
+
+    @pytest.mark.parametrize("terrain", [
+        ["S....", ".....", "....G"],
+        ["S.#..", "..#..", "..#..", "....G"],
+        ["S#...", ".#.#.", ".#.#.", "...#G"],
+        ["..#G", ".##.", "S..."],
+    ])
+    def test_matches_astar_cost(self, terrain: list[str]) -> None:
+        """JPS should find a contiguous path with the optimal A* cost."""
+        game_map = self._uniform_map(terrain)
+
+        jps = jump_point_search(game_map, allow_diagonal=True)
+        astar = find_path(game_map, FinderAlgorithm.ASTAR, allow_diagonal=True)
+
+        assert jps.total_cost == pytest.approx(astar.total_cost)
+        assert jps.path[0] == game_map.start
+        assert jps.path[-1] == game_map.goal
+        for (ux, uy), (vx, vy) in zip(jps.path, jps.path[1:]):
+            assert max(abs(ux - vx), abs(uy - vy)) == 1
+            assert game_map.terrain[vy][vx] != '#'
+
+    def test_prunes_expansions_behind_wall(self) -> None:
+        """Jumping along rays should expand far fewer nodes than A*."""
+        terrain = ["." * 20 for _ in range(20)]
+        terrain = [row[:10] + "#" + row[11:] if y < 17 else row for y, row in enumerate(terrain)]
+        terrain[5] = "S" + terrain[5][1:]
+        terrain[5] = terrain[5][:19] + "G"
+        game_map = self._uniform_map(terrain)
+
+        jps = jump_point_search(game_map, allow_diagonal=True)
+        astar = find_path(game_map, FinderAlgorithm.ASTAR, allow_diagonal=True)
+
+        assert jps.total_cost == pytest.approx(astar.total_cost)
+        assert jps.nodes_expanded < astar.nodes_expanded
+
+    def test_weighted_map_falls_back_to_astar(self) -> None:
+        """Maps with mixed terrain costs should be solved by plain A*."""
+        game_map = self._uniform_map(["S~.", ".F.", "..G"])
+
+        jps = jump_point_search(game_map, allow_diagonal=True)
+        astar = find_path(game_map, FinderAlgorithm.ASTAR, allow_diagonal=True)
+
+        assert jps.path == astar.path
+        assert jps.nodes_expanded == astar.nodes_expanded
+
+    def test_four_directional_falls_back_to_astar(self) -> None:
+        """Without diagonal movement, JPS should defer to A*."""
+        game_map = self._uniform_map(["S..", ".#.", "..G"])
+
+        jps = jump_point_search(game_map)
+        astar = find_path(game_map, FinderAlgorithm.ASTAR)
+
+        assert jps.path == astar.path
+
+    def test_no_path_raises_error(self) -> None:
+        """An enclosed goal should raise NoPathFoundError."""
+        game_map = self._uniform_map(["S.#..", "..###", "###.G"])
+
+        with pytest.raises(NoPathFoundError):
+            jump_point_search(game_map, allow_diagonal=True)
+
+
+class TestInlinedEdgeCosts:
+    """Tests that the search loop's inlined costs match calculate_edge_cost."""
+
+    @pytest.fixture
+    def weighted_map(self) -> MultiLayerMap:
+        """6x6 map mixing every terrain, elevation and priority."""
+        terrain = [
+            ['S', '.', '~', 'F', '^', 's'],
+            ['=', '#', '.', '~', 'F', '.'],
+            ['.', '^', 's', '#', '=', '~'],
+            ['F', '.', '=', '.', '#', '.'],
+            ['~', 's', '#', 'F', '.', '^'],
+            ['.', '=', '.', '~', 's', 'G'],
+        ]
+        return MultiLayerMap(
+            terrain=terrain,
+            elevation=[[(x * 3 + y * 5) % 4 for x in range(6)] for y in range(6)],
+            priority=[[((x + 2 * y) % 5) * 0.5 for x in range(6)] for y in range(6)],
+            start=(0, 0),
+            goal=(5, 5),
+            width=6,
+            height=6,
+        )
+
+    @pytest.mark.parametrize("algorithm", list(FinderAlgorithm))
+    @pytest.mark.parametrize("allow_diagonal", [False, True])
+    def test_matches_reference_cost_function(
+        self,
+        weighted_map: MultiLayerMap,
+        algorithm: FinderAlgorithm,
+        allow_diagonal: bool,
+    ) -> None:
+        """Inlined costs should reproduce the calculate_edge_cost search exactly."""
+        config = CostConfig(priority_weight=1.5, max_cost_cap=6.0)
+        context = build_search_context(weighted_map, config, allow_diagonal)
+
+        inlined = find_path(
+            weighted_map, algorithm, allow_diagonal=allow_diagonal, cost_config=config
+        )
+        reference = find_path(
+            weighted_map,
+            algorithm,
+            allow_diagonal=allow_diagonal,
+            cost_config=config,
+            context=context,
+        )
+
+        assert inlined.path == reference.path
+        assert inlined.total_cost == reference.total_cost
+        assert inlined.nodes_expanded == reference.nodes_expanded
+
+    @pytest.mark.parametrize("allow_diagonal", [False, True])
+    def test_context_edges_match_reference_cost_function(
+        self,
+        weighted_map: MultiLayerMap,
+        allow_diagonal: bool,
+    ) -> None:
+        """Every context edge should carry the calculate_edge_cost value."""
+        config = CostConfig(priority_weight=1.5, max_cost_cap=6.0)
+        context = build_search_context(weighted_map, config, allow_diagonal)
+
+        for index, edges in enumerate(context.edges):
+            pos = (index % weighted_map.width, index // weighted_map.width)
+            for neighbor, edge_cost in edges:
+                assert edge_cost == calculate_edge_cost(
+                    pos, neighbor, weighted_map, config, allow_diagonal
+                )
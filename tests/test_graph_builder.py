@@ -1,27 +1,36 @@
 """Tests for graph_builder module."""
+import functools
 import pytest
 from io import StringIO
 import networkx as nx
-from src.map_loader import load_map
-from src.graph_builder import build_graph
+from src.map_loader import GameMap, load_map
+from src.graph_builder import build_graph, build_neighbor_table
+
+
+@functools.lru_cache(maxsize=32)
+def _load_cached(text: str) -> GameMap:
+    """Parse a map once per distinct text; build_graph only reads the result."""
+    return load_map(StringIO(text))
+
+
+@pytest.fixture(scope="module")
+def sg_graph() -> nx.Graph:
+    """Graph of the open 2x2 map "SG\n..", built once and only read by tests."""
+    return build_graph(_load_cached("SG\n.."))
 
 
 class TestBuildGraph:
     """Tests for build_graph function."""
 
-    def test_simple_map_creates_graph(self) -> None:
+    def test_simple_map_creates_graph(self, sg_graph: nx.Graph) -> None:
         """Simple map should create a valid graph."""
-        map_text = "SG\n.."
-        game_map = load_map(StringIO(map_text))
-        graph = build_graph(game_map)
-
-        assert isinstance(graph, nx.Graph)
-        assert graph.number_of_nodes() == 4
+        assert isinstance(sg_graph, nx.Graph)
+        assert sg_graph.number_of_nodes() == 4
 
     def test_wall_excluded_from_graph(self) -> None:
         """Wall cells should not be included in the graph."""
         map_text = "S#G\n..."
-        game_map = load_map(StringIO(map_text))
+        game_map = _load_cached(map_text)
         graph = build_graph(game_map)
 
         assert (1, 0) not in graph.nodes()
@@ -31,13 +40,13 @@ class TestBuildGraph:
     def test_four_neighbors_adjacency(self) -> None:
         """Center cell should have 4 neighbors (up, down, left, right)."""
         map_text = "...\n.S.\n..G"
-        game_map = load_map(StringIO(map_text))
+        game_map = _load_cached(map_text)
         graph = build_graph(game_map)
 
         center = (1, 1)
-        neighbors = list(graph.neighbors(center))
+        neighbors = graph[center]
 
-        assert len(neighbors) == 4
+        assert graph.degree[center] == 4
         assert (0, 1) in neighbors  # left
         assert (2, 1) in neighbors  # right
         assert (1, 0) in neighbors  # up
@@ -46,33 +55,25 @@ class TestBuildGraph:
     def test_no_diagonal_neighbors(self) -> None:
         """Diagonal cells should not be connected."""
         map_text = "S.\n.G"
-        game_map = load_map(StringIO(map_text))
+        game_map = _load_cached(map_text)
         graph = build_graph(game_map)
 
         assert not graph.has_edge((0, 0), (1, 1))
         assert not graph.has_edge((1, 0), (0, 1))
 
-    def test_edge_weight_is_one(self) -> None:
+    def test_edge_weight_is_one(self, sg_graph: nx.Graph) -> None:
         """All edges should have weight 1."""
-        map_text = "SG\n.."
-        game_map = load_map(StringIO(map_text))
-        graph = build_graph(game_map)
-
-        for u, v, data in graph.edges(data=True):
+        for u, v, data in sg_graph.edges(data=True):
             assert data.get('weight', 1) == 1
 
-    def test_undirected_graph(self) -> None:
+    def test_undirected_graph(self, sg_graph: nx.Graph) -> None:
         """Graph should be undirected."""
-        map_text = "SG\n.."
-        game_map = load_map(StringIO(map_text))
-        graph = build_graph(game_map)
-
-        assert not graph.is_directed()
+        assert not sg_graph.is_directed()
 
     def test_wall_blocks_connection(self) -> None:
         """Wall should block connections between adjacent cells."""
         map_text = "S#G"
-        game_map = load_map(StringIO(map_text))
+        game_map = _load_cached(map_text)
         graph = build_graph(game_map)
 
         assert not graph.has_edge((0, 0), (2, 0))
@@ -80,8 +81,53 @@ class TestBuildGraph:
     def test_start_and_goal_in_graph(self) -> None:
         """Start and Goal positions should be in the graph."""
         map_text = "S...#\n.#.#.\n.#.G."
-        game_map = load_map(StringIO(map_text))
+        game_map = _load_cached(map_text)
         graph = build_graph(game_map)
 
         assert game_map.start in graph.nodes()
         assert game_map.goal in graph.nodes()
+
+    def test_isolated_cell_kept_as_node(self) -> None:
+        """A passable cell walled in on all sides should still be a node."""
+        map_text = "S#.\n##.\n.#G"
+        game_map = _load_cached(map_text)
+        graph = build_graph(game_map)
+
+        assert (0, 2) in graph.nodes()
+        assert graph.degree((0, 2)) == 0
+
+    def test_open_grid_edge_count(self) -> None:
+        """A fully open 3x3 grid should have 12 edges along borders and interior."""
+        map_text = "S..\n...\n..G"
+        game_map = _load_cached(map_text)
+        graph = build_graph(game_map)
+
+        assert graph.number_of_edges() == 12
+
+
+class TestBuildNeighborTable:
+    """Tests for the CSR neighbor table."""
+
+    def test_matches_graph_adjacency(self) -> None:
+        """Each cell's CSR neighbors should equal its graph neighbors, in order."""
+        map_text = "S...#\n.#.#.\n.#.G.\n..#.."
+        game_map = _load_cached(map_text)
+        graph = build_graph(game_map)
+        table = build_neighbor_table(game_map)
+        width = game_map.width
+
+        for index in range(width * game_map.height):
+            cell = (index % width, index // width)
+            expected = list(graph.neighbors(cell)) if cell in graph else []
+            actual = [(n % width, n // width) for n in table.neighbors(index)]
+            assert actual == expected
+
+    def test_indptr_covers_every_cell(self) -> None:
+        """indptr should have one entry per cell plus one, ending at the edge count."""
+        map_text = "S#G\n..."
+        game_map = _load_cached(map_text)
+        table = build_neighbor_table(game_map)
+
+        assert len(table.indptr) == 6 + 1
+        assert table.indptr[-1] == len(table.indices) == 2 * build_graph(game_map).number_of_edges()
+        assert len(table.neighbors(1)) == 0
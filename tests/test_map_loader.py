@@ -33,6 +33,19 @@ class TestLoadMap:
         assert result.height == 2
 
 
+    @pytest.mark.parametrize("map_text", [
+        "SG",
+        "G\nS",
+        "#.#S\n....\nG##.",
+        "...\n.S.\n..G",
+    ])
+    def test_points_match_validate_map(self, map_text: str) -> None:
+        """load_map should locate the same start and goal as validate_map."""
+        result = load_map(StringIO(map_text))
+
+        assert (result.start, result.goal) == validate_map(result.grid)
+
+
 class TestValidateMap:
     """Tests for map validation."""
 
@@ -83,3 +96,9 @@ class TestValidateMap:
         map_text = "S.#\n..G"
         result = load_map(StringIO(map_text))
         assert result is not None
+
+    def test_unknown_character_position_reported(self) -> None:
+        """An invalid character in a plain row should be reported with its position."""
+        map_text = "S...\n..#.\n.#X.\n...G"
+        with pytest.raises(MapValidationError, match=r"'X' at position \(2, 2\)"):
+            load_map(StringIO(map_text))
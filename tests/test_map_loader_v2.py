@@ -1,5 +1,6 @@
 """Tests for multi-layer map loader (Phase II)."""
 import pytest
+import pickle
 from io import StringIO
 from pathlib import Path
 from src.map_loader_v2 import (
@@ -10,6 +11,8 @@ from src.map_loader_v2 import (
     load_priority_layer,
     MultiLayerMap,
     LayerValidationError,
+    ELEVATION_MAX,
+    ELEVATION_MIN,
 )
 
 
@@ -35,6 +38,26 @@ class TestLoadTerrainLayer:
         with pytest.raises(LayerValidationError, match="[Uu]nknown|[Ii]nvalid"):
             load_terrain_layer(StringIO(terrain_text))
 
+    def test_invalid_terrain_code_position(self) -> None:
+        """The first unknown code should be reported with its (x, y) position."""
+        terrain_text = "...\n.?X"
+        with pytest.raises(LayerValidationError, match=r"'\?' at \(1, 1\)"):
+            load_terrain_layer(StringIO(terrain_text))
+
+    def test_crlf_line_endings(self) -> None:
+        """CRLF line endings should load like LF line endings."""
+        assert load_terrain_layer(StringIO("S.\r\n.G\r\n")) == [['S', '.'], ['.', 'G']]
+
+    @pytest.mark.parametrize("separator", ['\v', '\f', '\x1c', '\x85', '\u2028'])
+    def test_only_newline_separates_rows(self, separator: str) -> None:
+        """Line boundaries other than '\\n' should stay inside their row."""
+        with pytest.raises(LayerValidationError, match=r"terrain code '.' at \(1, 0\)"):
+            load_terrain_layer(StringIO(f"S{separator}\n.G"))
+
+    def test_surrounding_blank_lines_ignored(self) -> None:
+        """Blank lines around the terrain should be ignored."""
+        assert load_terrain_layer(StringIO("\n\nS.\n.G\n\n")) == [['S', '.'], ['.', 'G']]
+
     def test_non_rectangular_terrain(self) -> None:
         """Non-rectangular terrain should raise error."""
         terrain_text = "..\n..."
@@ -69,6 +92,18 @@ class TestLoadElevationLayer:
         with pytest.raises(LayerValidationError, match="[Ii]nteger|[Ff]ormat"):
             load_elevation_layer(StringIO(elevation_text))
 
+    def test_non_rectangular_elevation(self) -> None:
+        """Rows with differing value counts should raise error."""
+        elevation_text = "0 0 0\n0 0\n0 0 0"
+        with pytest.raises(LayerValidationError, match="row 1 has 2 values, expected 3"):
+            load_elevation_layer(StringIO(elevation_text))
+
+    def test_first_error_in_row_order_reported(self) -> None:
+        """A size error on an earlier row should win over a later format error."""
+        elevation_text = "0 0\n0\n0 a"
+        with pytest.raises(LayerValidationError, match="Non-rectangular"):
+            load_elevation_layer(StringIO(elevation_text))
+
 
 class TestLoadPointsLayer:
     """Tests for points layer loading."""
@@ -81,6 +116,14 @@ class TestLoadPointsLayer:
         assert start == (0, 0)
         assert goal == (2, 1)
 
+    def test_last_marker_wins(self) -> None:
+        """Repeated S/G markers should resolve to the last one in row-major order."""
+        terrain = [['S', 'G', 'S'], ['G', '.', '.'], ['.', 'S', '.']]
+        start, goal = load_points_layer(terrain_grid=terrain)
+
+        assert start == (1, 2)
+        assert goal == (0, 1)
+
     def test_load_points_from_file(self) -> None:
         """Points from separate file should be loaded."""
         points_text = "S 1 2\nG 5 3"
@@ -120,6 +163,13 @@ class TestLoadPriorityLayer:
 
         assert all(result[y][x] == 0.0 for y in range(2) for x in range(2))
 
+    def test_default_priority_rows_independent(self) -> None:
+        """Default rows should be separate lists, not one shared row."""
+        result = load_priority_layer(None, width=2, height=2)
+        result[0][0] = 1.0
+
+        assert result[1][0] == 0.0
+
 
 class TestMultiLayerMap:
     """Tests for MultiLayerMap structure."""
@@ -159,6 +209,93 @@ class TestMultiLayerMap:
             )
 
 
+class TestFlatLayerBuffers:
+    """Tests for the flat row-major layer buffers on MultiLayerMap."""
+
+    @staticmethod
+    def _make_map() -> MultiLayerMap:
+        return MultiLayerMap(
+            terrain=[['S', '.', '='], ['.', 'F', '#'], ['~', '.', 'G']],
+            elevation=[[0, 0, 0], [0, 1, 2], [0, 1, 3]],
+            priority=[[0.0] * 3 for _ in range(3)],
+            start=(0, 0),
+            goal=(2, 2),
+            width=3,
+            height=3,
+        )
+
+    def test_terrain_codes_match_nested_layer(self) -> None:
+        """terrain_codes[y * W + x] should be the code point of terrain[y][x]."""
+        game_map = self._make_map()
+        for y in range(game_map.height):
+            for x in range(game_map.width):
+                code = game_map.terrain_codes[y * game_map.width + x]
+                assert code == ord(game_map.terrain[y][x])
+
+    def test_elevation_flat_matches_nested_layer(self) -> None:
+        """elevation_flat[y * W + x] should equal elevation[y][x]."""
+        game_map = self._make_map()
+        assert list(game_map.elevation_flat) == [0, 0, 0, 0, 1, 2, 0, 1, 3]
+
+    def test_elevation_flat_is_int16(self) -> None:
+        """elevation_flat should hold int16 values, limits included."""
+        game_map = MultiLayerMap(
+            terrain=[['S', 'G']],
+            elevation=[[ELEVATION_MIN, ELEVATION_MAX]],
+            priority=[[0.0, 0.0]],
+            start=(0, 0),
+            goal=(1, 0),
+            width=2,
+            height=1,
+        )
+        assert game_map.elevation_flat.typecode == 'h'
+        assert list(game_map.elevation_flat) == [ELEVATION_MIN, ELEVATION_MAX]
+
+    def test_elevation_out_of_int16_range_rejected(self) -> None:
+        """Elevations beyond int16 should fail validation."""
+        with pytest.raises(LayerValidationError, match="Elevation out of range"):
+            MultiLayerMap(
+                terrain=[['S', 'G']],
+                elevation=[[0, ELEVATION_MAX + 1]],
+                priority=[[0.0, 0.0]],
+                start=(0, 0),
+                goal=(1, 0),
+                width=2,
+                height=1,
+            )
+
+    def test_priority_flat_matches_nested_layer(self) -> None:
+        """priority_flat[y * W + x] should equal priority[y][x]."""
+        game_map = MultiLayerMap(
+            terrain=[['S', 'G']],
+            elevation=[[0, 0]],
+            priority=[[0.5, 2.0]],
+            start=(0, 0),
+            goal=(1, 0),
+            width=2,
+            height=1,
+        )
+        assert list(game_map.priority_flat) == [0.5, 2.0]
+
+    def test_buffers_excluded_from_equality(self) -> None:
+        """Derived buffers should not take part in equality or repr."""
+        assert self._make_map() == self._make_map()
+
+    def test_no_instance_dict_and_pickles(self) -> None:
+        """MultiLayerMap should be slotted and keep its buffers across a pickle round trip."""
+        game_map = self._make_map()
+        restored = pickle.loads(pickle.dumps(game_map))
+        assert not hasattr(game_map, "__dict__")
+        assert restored == game_map
+        assert restored.terrain_codes == game_map.terrain_codes
+        assert "terrain_codes" not in repr(self._make_map())
+
+    def test_min_base_cost_is_cheapest_present_terrain(self) -> None:
+        """min_base_cost should be the cheapest passable base cost in the map."""
+        assert self._make_map().min_base_cost == 0.8
+        assert "min_base_cost" not in repr(self._make_map())
+
+
 class TestPhaseICompatibility:
     """Tests for Phase I backward compatibility."""
 
@@ -185,28 +322,43 @@ class TestPhaseICompatibility:
         assert result.start == (0, 0)
         assert result.goal == (1, 0)
 
+    def test_legacy_bytes_matches_text(self) -> None:
+        """Legacy bytes input should load the same map as text input."""
+        legacy_text = "S..#\n.#..\n...G\n"
+        from_text = load_multi_layer_map(legacy_text=StringIO(legacy_text))
+        from_bytes = load_multi_layer_map(legacy_bytes=legacy_text.encode('ascii'))
+
+        assert from_bytes == from_text
+        assert from_bytes.terrain_codes == from_text.terrain_codes
+
+    def test_legacy_bytes_accepts_memoryview(self) -> None:
+        """Legacy bytes input should accept a memoryview buffer."""
+        result = load_multi_layer_map(legacy_bytes=memoryview(b"S.G"))
+
+        assert result.goal == (2, 0)
+
+    def test_legacy_bytes_rejects_non_ascii(self) -> None:
+        """Non-ASCII bytes should raise a validation error."""
+        with pytest.raises(LayerValidationError, match="non-ASCII"):
+            load_multi_layer_map(legacy_bytes="S水G".encode('utf-8'))
+
+    def test_legacy_bytes_unknown_code(self) -> None:
+        """Unknown ASCII codes in legacy bytes should raise error."""
+        with pytest.raises(LayerValidationError, match=r"terrain code 'X' at \(2, 0\)"):
+            load_multi_layer_map(legacy_bytes=b"S.X.G")
+
 
 class TestTerrainCodesFromSpec:
     """Tests for all terrain codes from specification."""
 
-    @pytest.mark.parametrize("code,expected_passable", [
-        ('.', True),   # plain
-        ('~', True),   # shallow water
-        ('F', True),   # forest
-        ('^', True),   # cliff
-        ('s', True),   # sand
-        ('=', True),   # paved
-        ('#', False),  # wall
-        ('S', True),   # start
-        ('G', True),   # goal
-    ])
-    def test_terrain_code_validity(self, code: str, expected_passable: bool) -> None:
-        """All spec terrain codes should be valid."""
-        terrain_text = f"S{code}G" if code not in ('S', 'G') else "S.G"
-        if code == 'S':
-            terrain_text = "SG."
-        elif code == 'G':
-            terrain_text = "S.G"
-
-        result = load_terrain_layer(StringIO(terrain_text))
-        assert result is not None
+    def test_terrain_code_validity(self) -> None:
+        """All spec terrain codes should be accepted in a single row."""
+        codes = ".~F^s=#SG"  # plain, shallow water, forest, cliff, sand, paved, wall, start, goal
+        result = load_terrain_layer(StringIO(f"{codes}\n{'.' * len(codes)}"))
+        assert result[0] == list(codes)
+
+    @pytest.mark.parametrize("code", ['X', 'f', '@', '0'])
+    def test_unknown_code_rejected(self, code: str) -> None:
+        """Codes outside the spec should be rejected with their position."""
+        with pytest.raises(LayerValidationError, match=rf"'{code}' at \(1, 0\)"):
+            load_terrain_layer(StringIO(f"S{code}G"))
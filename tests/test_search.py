@@ -1,19 +1,39 @@
 """Tests for search module."""
 import pytest
 from io import StringIO
-from src.map_loader import load_map
-from src.graph_builder import build_graph
+import networkx as nx
+from src.map_loader import GameMap, load_map
+from src.graph_builder import build_graph, build_neighbor_table
 from src.search import search_path, SearchResult, NoPathError, Algorithm
 
 
+@pytest.fixture(scope="module")
+def sg_case() -> tuple[GameMap, nx.Graph]:
+    """Map "SG" and its graph, built once and only read by tests."""
+    game_map = load_map(StringIO("SG"))
+    return game_map, build_graph(game_map)
+
+
+@pytest.fixture(scope="module")
+def maze_case() -> tuple[GameMap, nx.Graph]:
+    """Maze "S...#\n.#.#.\n.#.G." and its graph, built once and only read by tests."""
+    game_map = load_map(StringIO("S...#\n.#.#.\n.#.G."))
+    return game_map, build_graph(game_map)
+
+
+@pytest.fixture(scope="module")
+def walled_case() -> tuple[GameMap, nx.Graph]:
+    """Map "S#G" with no path and its graph, built once and only read by tests."""
+    game_map = load_map(StringIO("S#G"))
+    return game_map, build_graph(game_map)
+
+
 class TestSearchPath:
     """Tests for search_path function."""
 
-    def test_simple_path_astar(self) -> None:
+    def test_simple_path_astar(self, sg_case: tuple[GameMap, nx.Graph]) -> None:
         """A* should find path in simple map."""
-        map_text = "SG"
-        game_map = load_map(StringIO(map_text))
-        graph = build_graph(game_map)
+        game_map, graph = sg_case
 
         result = search_path(graph, game_map.start, game_map.goal, Algorithm.ASTAR)
 
@@ -21,11 +41,9 @@ class TestSearchPath:
         assert result.algorithm == Algorithm.ASTAR
         assert result.path_length == 2
 
-    def test_simple_path_bfs(self) -> None:
+    def test_simple_path_bfs(self, sg_case: tuple[GameMap, nx.Graph]) -> None:
         """BFS should find path in simple map."""
-        map_text = "SG"
-        game_map = load_map(StringIO(map_text))
-        graph = build_graph(game_map)
+        game_map, graph = sg_case
 
         result = search_path(graph, game_map.start, game_map.goal, Algorithm.BFS)
 
@@ -33,11 +51,9 @@ class TestSearchPath:
         assert result.algorithm == Algorithm.BFS
         assert result.path_length == 2
 
-    def test_longer_path(self) -> None:
+    def test_longer_path(self, maze_case: tuple[GameMap, nx.Graph]) -> None:
         """Should find correct path through maze."""
-        map_text = "S...#\n.#.#.\n.#.G."
-        game_map = load_map(StringIO(map_text))
-        graph = build_graph(game_map)
+        game_map, graph = maze_case
 
         result = search_path(graph, game_map.start, game_map.goal, Algorithm.ASTAR)
 
@@ -45,40 +61,32 @@ class TestSearchPath:
         assert result.path[-1] == (3, 2)
         assert result.path_length == 6
 
-    def test_astar_and_bfs_same_length(self) -> None:
+    def test_astar_and_bfs_same_length(self, maze_case: tuple[GameMap, nx.Graph]) -> None:
         """A* and BFS should find paths of same length."""
-        map_text = "S...#\n.#.#.\n.#.G."
-        game_map = load_map(StringIO(map_text))
-        graph = build_graph(game_map)
+        game_map, graph = maze_case
 
         astar_result = search_path(graph, game_map.start, game_map.goal, Algorithm.ASTAR)
         bfs_result = search_path(graph, game_map.start, game_map.goal, Algorithm.BFS)
 
         assert astar_result.path_length == bfs_result.path_length
 
-    def test_no_path_raises_error(self) -> None:
+    def test_no_path_raises_error(self, walled_case: tuple[GameMap, nx.Graph]) -> None:
         """Should raise NoPathError when no path exists."""
-        map_text = "S#G"
-        game_map = load_map(StringIO(map_text))
-        graph = build_graph(game_map)
+        game_map, graph = walled_case
 
         with pytest.raises(NoPathError, match="[Nn]o path|到達"):
             search_path(graph, game_map.start, game_map.goal, Algorithm.ASTAR)
 
-    def test_no_path_bfs_raises_error(self) -> None:
+    def test_no_path_bfs_raises_error(self, walled_case: tuple[GameMap, nx.Graph]) -> None:
         """BFS should also raise NoPathError when no path exists."""
-        map_text = "S#G"
-        game_map = load_map(StringIO(map_text))
-        graph = build_graph(game_map)
+        game_map, graph = walled_case
 
         with pytest.raises(NoPathError, match="[Nn]o path|到達"):
             search_path(graph, game_map.start, game_map.goal, Algorithm.BFS)
 
-    def test_execution_time_recorded(self) -> None:
+    def test_execution_time_recorded(self, sg_case: tuple[GameMap, nx.Graph]) -> None:
         """Search should record execution time."""
-        map_text = "SG"
-        game_map = load_map(StringIO(map_text))
-        graph = build_graph(game_map)
+        game_map, graph = sg_case
 
         result = search_path(graph, game_map.start, game_map.goal, Algorithm.ASTAR)
 
@@ -109,3 +117,53 @@ class TestManhattanDistance:
 
         expected_length = abs(4 - 0) + abs(2 - 0) + 1
         assert result.path_length == expected_length
+
+
+class TestNeighborTableSearch:
+    """Tests for searching a CSR neighbor table without NetworkX."""
+
+    @pytest.mark.parametrize("map_text", [
+        "SG",
+        "S...#\n.#.#.\n.#.G.",
+        "S....\n.....\n....G",
+        "S..#....\n.#.#.##.\n.#...#..\n...#...G",
+    ])
+    @pytest.mark.parametrize("algorithm", list(Algorithm))
+    def test_same_path_as_networkx(self, map_text: str, algorithm: Algorithm) -> None:
+        """Grid search should return exactly the NetworkX path."""
+        game_map = load_map(StringIO(map_text))
+        graph = build_graph(game_map)
+        table = build_neighbor_table(game_map)
+
+        expected = search_path(graph, game_map.start, game_map.goal, algorithm)
+        result = search_path(table, game_map.start, game_map.goal, algorithm)
+
+        assert result.path == expected.path
+        assert result.algorithm == algorithm
+
+    @pytest.mark.parametrize("algorithm", list(Algorithm))
+    def test_no_path_raises_error(self, algorithm: Algorithm) -> None:
+        """Grid search should raise NoPathError when no path exists."""
+        game_map = load_map(StringIO("S#G"))
+        table = build_neighbor_table(game_map)
+
+        with pytest.raises(NoPathError, match="[Nn]o path"):
+            search_path(table, game_map.start, game_map.goal, algorithm)
+
+    @pytest.mark.parametrize("start,goal", [
+        ((3, 0), (1, 1)),   # x past the right edge would wrap to row 1
+        ((0, 0), (-1, 1)),
+        ((0, 0), (0, 2)),
+    ])
+    @pytest.mark.parametrize("algorithm", list(Algorithm))
+    def test_off_grid_position_raises_like_networkx(
+        self, start: tuple[int, int], goal: tuple[int, int], algorithm: Algorithm
+    ) -> None:
+        """Off-grid positions should raise NodeNotFound, as the graph search does."""
+        game_map = load_map(StringIO("S..\n..G"))
+        table = build_neighbor_table(game_map)
+
+        with pytest.raises(nx.NodeNotFound):
+            search_path(build_graph(game_map), start, goal, algorithm)
+        with pytest.raises(nx.NodeNotFound):
+            search_path(table, start, goal, algorithm)
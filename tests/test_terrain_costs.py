@@ -0,0 +1,114 @@
+"""Tests for terrain cost constants."""
+import os
+import pytest
+from pathlib import Path
+from src.constants.terrain_costs import (
+    ASCENT_COST_LUT,
+    ASCII_TERRAIN_LUT,
+    BASE_COST_LUT,
+    DESCENT_COST_LUT,
+    DIAGONAL_FACTOR_LUT,
+    PASSABLE_LUT,
+    DEFAULT_CSV_PATH,
+    DEFAULT_TERRAIN,
+    TERRAIN_COSTS,
+    get_terrain_cost,
+    load_terrain_costs,
+)
+
+CSV_HEADER = "code,terrain,base_cost,ascent_cost,descent_cost,diagonal_factor,passable\n"
+
+
+class TestGetTerrainCost:
+    """Tests for terrain cost lookup."""
+
+    @pytest.mark.parametrize("code", sorted(TERRAIN_COSTS))
+    def test_known_codes_match_table(self, code: str) -> None:
+        """Known codes should resolve to their TERRAIN_COSTS entry."""
+        assert get_terrain_cost(code) is TERRAIN_COSTS[code]
+
+    def test_unknown_ascii_code_returns_default(self) -> None:
+        """Unknown ASCII codes should fall back to the default terrain."""
+        assert get_terrain_cost('X') is DEFAULT_TERRAIN
+
+    @pytest.mark.parametrize("code", ["", "..", "水"])
+    def test_non_ascii_or_multi_char_returns_default(self, code: str) -> None:
+        """Codes outside the ASCII lookup table should still resolve."""
+        assert get_terrain_cost(code) is DEFAULT_TERRAIN
+
+    def test_repeated_unknown_lookups_are_stable(self) -> None:
+        """Memoized unknown codes should keep resolving to the default terrain."""
+        results = {get_terrain_cost("未知") for _ in range(3)}
+        assert results == {DEFAULT_TERRAIN}
+
+
+class TestFieldLookupTables:
+    """Tests for the per-field code-point lookup tables."""
+
+    @pytest.mark.parametrize("code", sorted(TERRAIN_COSTS))
+    def test_tables_match_terrain_entry(self, code: str) -> None:
+        """Each table should hold the matching field of the code's TerrainCost."""
+        cost = TERRAIN_COSTS[code]
+        i = ord(code)
+        assert bool(PASSABLE_LUT[i]) is cost.passable
+        assert BASE_COST_LUT[i] == cost.base_cost
+        assert ASCENT_COST_LUT[i] == cost.ascent_cost
+        assert DESCENT_COST_LUT[i] == cost.descent_cost
+        assert DIAGONAL_FACTOR_LUT[i] == cost.diagonal_factor
+
+    def test_tables_cover_ascii_range(self) -> None:
+        """All tables should be indexable by any ASCII code point."""
+        for table in (PASSABLE_LUT, BASE_COST_LUT, ASCENT_COST_LUT,
+                      DESCENT_COST_LUT, DIAGONAL_FACTOR_LUT):
+            assert len(table) == len(ASCII_TERRAIN_LUT) == 128
+
+    def test_wall_is_impassable(self) -> None:
+        """The wall code should be masked as impassable."""
+        assert PASSABLE_LUT[ord('#')] == 0
+
+
+class TestLoadTerrainCosts:
+    """Tests for CSV loading and its in-process cache."""
+
+    def test_repeated_load_returns_cached_table(self) -> None:
+        """Loading an unchanged CSV twice should return the same table."""
+        assert load_terrain_costs(DEFAULT_CSV_PATH) is load_terrain_costs(DEFAULT_CSV_PATH)
+
+    def test_modified_csv_is_reparsed(self, tmp_path: Path) -> None:
+        """Changing the CSV should invalidate the cached table."""
+        csv_file = tmp_path / "costs.csv"
+        csv_file.write_text(CSV_HEADER + ".,plain,1.0,2.0,0.5,1.414,true\n")
+        first = load_terrain_costs(csv_file)
+
+        csv_file.write_text(CSV_HEADER + ".,plain,3.0,2.0,0.5,1.414,true\n")
+        stat = csv_file.stat()
+        os.utime(csv_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        second = load_terrain_costs(csv_file)
+
+        assert first["."].base_cost == 1.0
+        assert second["."].base_cost == 3.0
+
+    def test_rewrite_with_same_mtime_is_reparsed(self, tmp_path: Path) -> None:
+        """A rewrite within one mtime tick should still be seen if the size changed."""
+        csv_file = tmp_path / "costs.csv"
+        csv_file.write_text(CSV_HEADER + ".,plain,1.0,2.0,0.5,1.414,true\n")
+        stat = csv_file.stat()
+        first = load_terrain_costs(csv_file)
+
+        csv_file.write_text(CSV_HEADER + ".,plain,12.5,2.0,0.5,1.414,true\n")
+        os.utime(csv_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        second = load_terrain_costs(csv_file)
+
+        assert first["."].base_cost == 1.0
+        assert second["."].base_cost == 12.5
+
+    def test_missing_csv_returns_default(self, tmp_path: Path) -> None:
+        """A missing CSV should yield only the default terrain."""
+        result = load_terrain_costs(tmp_path / "missing.csv")
+
+        assert dict(result) == {".": DEFAULT_TERRAIN}
+
+    def test_table_is_read_only(self) -> None:
+        """The shared table should not be mutable by callers."""
+        with pytest.raises(TypeError):
+            TERRAIN_COSTS["X"] = DEFAULT_TERRAIN  # type: ignore[index]
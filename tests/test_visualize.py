@@ -2,6 +2,7 @@
 import pytest
 from io import StringIO
 from src.map_loader import load_map
+from src.map_loader_v2 import load_multi_layer_map
 from src.visualize import render_path
 
 
@@ -18,6 +19,25 @@ class TestRenderPath:
 
         assert result == "SG"
 
+    def test_multi_layer_map_renders_like_game_map(self) -> None:
+        """A MultiLayerMap should render directly, matching the GameMap output."""
+        map_text = "S..#\n.#..\n...G"
+        path = [(0, 0), (0, 1), (0, 2), (1, 2), (2, 2), (3, 2)]
+
+        legacy = render_path(load_map(StringIO(map_text)), path)
+        layered = render_path(load_multi_layer_map(legacy_text=StringIO(map_text)), path)
+
+        assert layered == legacy
+
+    def test_non_ascii_grid_falls_back_to_cell_copy(self) -> None:
+        """Grids with non-ASCII cells should still be marked cell by cell."""
+        class _Grid:
+            grid = [['S', '.', '水'], ['#', '.', 'G']]
+
+        result = render_path(_Grid(), [(0, 0), (1, 0), (1, 1), (2, 1)])
+
+        assert result == "S@水\n#@G"
+
     def test_road_replaced_with_at_sign(self) -> None:
         """Road cells on path should be replaced with '@'."""
         map_text = "S.G"
@@ -96,3 +116,22 @@ class TestRenderPath:
         assert lines[0][2] == '.'
         assert lines[1][1] == '.'
         assert lines[1][2] == '.'
+
+    @pytest.mark.parametrize("point", [(3, 0), (2, 2), (-1, 0)])
+    def test_off_map_point_raises_error(self, point: tuple[int, int]) -> None:
+        """A path point off the map should raise instead of marking another cell."""
+        game_map = load_map(StringIO("S..\n..G"))
+
+        with pytest.raises(IndexError, match="outside the map"):
+            render_path(game_map, [(0, 0), point])
+
+    @pytest.mark.parametrize("point", [(3, 0), (0, -1), (-1, 0)])
+    def test_off_map_point_raises_error_for_non_ascii_grid(
+        self, point: tuple[int, int]
+    ) -> None:
+        """The non-ASCII route should reject off-map points the same way."""
+        class _Grid:
+            grid = [['S', '.', '水'], ['#', '.', 'G']]
+
+        with pytest.raises(IndexError, match="outside the map"):
+            render_path(_Grid(), [(0, 0), point])